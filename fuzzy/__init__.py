@@ -0,0 +1,23 @@
+"""
+Fuzzy reasoning systems.
+
+Subpackages are imported on first access, e.g. ``fuzzy.rules``, so
+  ``import fuzzy`` stays cheap:
+    *. functions - membership functions, partitions and banks,
+    *. operators - t-norms, s-norms, negation and hedges,
+    *. sets - fuzzy sets,
+    *. batch - buffers and workspaces for batch evaluation,
+    *. fitting - fitting membership functions to data,
+    *. lookup - lookup tables precomputed from systems,
+    *. rules - rule bases compiled into flat arrays,
+    *. serve - serving systems to many clients,
+    *. type2 - interval type-2 fuzzy sets.
+"""
+from fuzzy._lazy import lazy_attributes
+
+__all__ = ['functions', 'operators', 'sets', 'batch', 'fitting', 'lookup',
+           'rules', 'serve', 'type2']
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__, {name: f'{__name__}.{name}' for name in __all__}
+)
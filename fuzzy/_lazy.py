@@ -0,0 +1,45 @@
+"""
+Lazy module attributes (PEP 562).
+
+Packages list attributes defined in heavy modules (vectorized NumPy
+  kernels, servers, fitting) together with those modules; modules are
+  imported on first access of any of their attributes and the attributes
+  are then stored in package namespace. Scalar membership functions and
+  operators stay importable without NumPy.
+"""
+import importlib
+import sys
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def lazy_attributes(
+        package: str,
+        attributes: Dict[str, str]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Return module-level ``__getattr__`` and ``__dir__`` for package.
+
+    :param package: ``__name__`` of package.
+    :param attributes: mapping of attribute names to modules defining them;
+      attribute named as submodule of package is the submodule itself.
+    :return: functions to assign to ``__getattr__`` and ``__dir__``.
+    """
+    namespace = sys.modules[package].__dict__
+
+    def __getattr__(name: str) -> Any:
+        if name not in attributes:
+            raise AttributeError(
+                f'module {package!r} has no attribute {name!r}'
+            )
+        module = importlib.import_module(attributes[name])
+        if module.__name__ == f'{package}.{name}':
+            value = module
+        else:
+            value = getattr(module, name)
+        namespace[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(namespace) | set(attributes))
+
+    return __getattr__, __dir__
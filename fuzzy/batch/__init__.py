@@ -0,0 +1,28 @@
+"""
+This package contains helpers for allocation-free batch evaluation.
+
+``evaluate_batch`` of membership functions, operators and rule bases
+  accepts ``dtype`` of results (float32 halves memory traffic), ``out``
+  buffer to write results to and ``workspace`` providing scratch arrays.
+  Reusing the same output buffer and Workspace between calls makes
+  steady-state evaluation allocate no arrays at all.
+
+Inputs can be any array-like or buffer-protocol object; floating point
+  buffers are wrapped without copying (see ``as_input_array``), and raw
+  binary files of floats can be evaluated in chunks with ``evaluate_mmap``.
+"""
+from typing import TYPE_CHECKING
+
+from fuzzy._lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from fuzzy.batch._buffers import as_input_array
+    from fuzzy.batch._workspace import Workspace, prepare_batch
+    from fuzzy.batch._mmap import evaluate_mmap
+
+__getattr__, __dir__ = lazy_attributes(__name__, {
+    'as_input_array': 'fuzzy.batch._buffers',
+    'Workspace': 'fuzzy.batch._workspace',
+    'prepare_batch': 'fuzzy.batch._workspace',
+    'evaluate_mmap': 'fuzzy.batch._mmap',
+})
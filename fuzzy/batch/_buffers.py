@@ -0,0 +1,47 @@
+"""
+Zero-copy ingestion of input buffers.
+
+Inputs of batch evaluation often already live in memory as contiguous
+  floats: ``array.array``, memoryviews over network buffers, Arrow or pandas
+  columns, memory-mapped files. They are wrapped as NumPy arrays sharing
+  memory with the source instead of being converted to lists of floats.
+"""
+import mmap
+
+import numpy as np
+
+_RAW_FORMATS = ('B', 'b', 'c')
+
+
+def as_input_array(input_points, dtype=None) -> np.ndarray:
+    """
+    Return input points as floating point array, without copying if possible.
+
+    Objects supporting buffer protocol are wrapped with ``np.frombuffer``
+      (raw bytes, e.g. ``bytes``, ``bytearray`` or ``mmap``) or
+      ``np.asarray`` (typed buffers, e.g. ``array.array('d')``); objects
+      exposing ``__array__``, like pandas and Arrow columns, with
+      ``np.asarray``. Floating point data is never copied; other data is
+      converted to float64.
+
+    :param input_points: array-like or buffer-protocol object.
+    :param dtype: dtype of elements of raw byte buffers; defaults to
+      native float64. Ignored for typed inputs.
+    :return: array sharing memory with input_points when possible.
+    :raises ValueError: when size of raw buffer is not multiple of dtype
+      size.
+    """
+    if isinstance(input_points, np.ndarray):
+        points = input_points
+    elif isinstance(input_points, (bytes, bytearray, memoryview, mmap.mmap)):
+        view = memoryview(input_points)
+        if view.format in _RAW_FORMATS:
+            points = np.frombuffer(view, dtype=dtype or np.float64)
+        else:
+            points = np.asarray(view)
+    else:
+        points = np.asarray(input_points)
+    if points.dtype.kind != 'f':
+        points = points.astype(np.float64)
+    return points
+
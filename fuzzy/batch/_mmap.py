@@ -0,0 +1,76 @@
+"""
+Chunked evaluation over memory-mapped files of raw floats.
+"""
+import os
+from typing import Optional
+
+import numpy as np
+
+from fuzzy.batch._workspace import Workspace
+
+
+def evaluate_mmap(
+        system,
+        path: str,
+        dtype=np.float64,
+        offset: int = 0,
+        count: int = -1,
+        chunk_size: int = 65536,
+        out: Optional[np.ndarray] = None,
+        out_dtype=None,
+        workspace=None
+) -> np.ndarray:
+    """
+    Evaluate system over raw binary file of floats, chunk by chunk.
+
+    File is memory-mapped and passed to ``system.evaluate_batch`` in chunks
+      of ``chunk_size`` values, each written directly to its slice of out
+      with shared Workspace, so memory use doesn't depend on file size
+      apart from results. Passing ``np.memmap`` as out streams results to
+      disk as well.
+
+    :param system: object with ``evaluate_batch(values, out=..., dtype=...,
+      workspace=...)``, e.g. membership function, operator tree or
+      RuleBase.
+    :param path: path of file of raw values.
+    :param dtype: dtype of values in file, e.g. ``'<f4'``.
+    :param offset: offset of first value in file, in bytes.
+    :param count: number of values to evaluate; -1 for all values until end
+      of file.
+    :param chunk_size: number of values evaluated at once.
+    :param out: optional buffer for results of shape ``(count,) + trailing``,
+      where trailing are dimensions of single result of system.
+    :param out_dtype: floating point dtype of results when out is omitted;
+      defaults to float64.
+    :param workspace: optional Workspace; created when omitted.
+    :return: results for all values; out when given. File without values
+      after offset gives empty results.
+    :raises ValueError: when out doesn't have one row of results for each
+      value.
+    """
+    available = (os.path.getsize(path) - offset) // np.dtype(dtype).itemsize
+    if count == 0 or count < 0 and available <= 0:
+        # Empty files can't be memory-mapped.
+        values = np.empty(0, dtype=dtype)
+    else:
+        values = np.memmap(path, dtype=dtype, mode='r', offset=offset,
+                           shape=None if count < 0 else (count,))
+    workspace = workspace or Workspace()
+    if out is None:
+        first = system.evaluate_batch(values[:chunk_size], dtype=out_dtype,
+                                      workspace=workspace)
+        out = np.empty(values.shape + first.shape[1:], dtype=first.dtype)
+        out[:len(first)] = first
+        start = len(first)
+    else:
+        if out.ndim == 0 or len(out) != len(values):
+            raise ValueError(f'out must have {len(values)} rows, got '
+                             f'shape {out.shape}.')
+        # Checks trailing dimensions of out also when there are no values.
+        system.evaluate_batch(values[:0], out=out[:0], workspace=workspace)
+        start = 0
+    for start in range(start, len(values), chunk_size):
+        stop = min(start + chunk_size, len(values))
+        system.evaluate_batch(values[start:stop], out=out[start:stop],
+                              workspace=workspace)
+    return out
@@ -0,0 +1,114 @@
+"""
+Reusable scratch arrays for batch evaluation.
+"""
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from fuzzy.batch._buffers import as_input_array
+
+
+class Workspace:
+    """
+    Pool of scratch arrays reused between batch evaluations.
+
+    Operator trees borrow one scratch array per level of nesting while
+      evaluating children and return it afterwards, so after first call with
+      given batch shape and dtype no further arrays are allocated.
+    """
+
+    allocations: int
+    """Number of arrays allocated by workspace so far."""
+
+    def __init__(self) -> None:
+        self._free: Dict[Tuple, List[np.ndarray]] = {}
+        self.allocations = 0
+
+    def borrow(self, shape: Tuple[int, ...], dtype=np.float64) -> np.ndarray:
+        """
+        Take scratch array from pool, allocating it when none is free.
+
+        Contents of returned array are undefined.
+
+        :param shape: shape of array.
+        :param dtype: floating point dtype of array.
+        :return: array owned by caller until passed to ``release``.
+        """
+        free = self._free.get((tuple(shape), np.dtype(dtype)))
+        if free:
+            return free.pop()
+        self.allocations += 1
+        return np.empty(shape, dtype=dtype)
+
+    def release(self, array: np.ndarray) -> None:
+        """
+        Return array taken with ``borrow`` to pool.
+
+        :param array: borrowed array.
+        """
+        self._free.setdefault((array.shape, array.dtype), []).append(array)
+
+    @contextmanager
+    def scratch(
+            self,
+            shape: Tuple[int, ...],
+            dtype=np.float64
+    ) -> Iterator[np.ndarray]:
+        """
+        Borrow scratch array for duration of ``with`` block.
+
+        :param shape: shape of array.
+        :param dtype: floating point dtype of array.
+        """
+        array = self.borrow(shape, dtype)
+        try:
+            yield array
+        finally:
+            self.release(array)
+
+    def clear(self) -> None:
+        """Drop all pooled arrays."""
+        self._free.clear()
+
+
+def prepare_batch(
+        input_points,
+        out: Optional[np.ndarray] = None,
+        dtype=None,
+        trailing: Tuple[int, ...] = ()
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Return input points as array and buffer for results of batch evaluation.
+
+    Floating point inputs are used without copying, so float32 inputs stay
+      float32; other inputs are converted to float64. Buffer-protocol
+      objects are wrapped as in ``as_input_array``.
+
+    :param input_points: array-like or buffer-protocol object of points in
+      data-space.
+    :param out: optional buffer for results; allocated when omitted. It
+      must not share memory with input points, as operators write results
+      of one child to out before other children read input points.
+    :param dtype: floating point dtype of results; defaults to dtype of out,
+      or float64.
+    :param trailing: dimensions of results following shape of input points.
+    :return: tuple of input points and output buffer.
+    :raises ValueError: when out has wrong shape or dtype, shares memory
+      with input points, or dtype is not floating point.
+    """
+    points = as_input_array(input_points)
+    shape = points.shape + tuple(trailing)
+    if out is None:
+        dtype = np.dtype(np.float64 if dtype is None else dtype)
+        if dtype.kind != 'f':
+            raise ValueError(f'Results must have floating dtype, got {dtype}.')
+        return points, np.empty(shape, dtype=dtype)
+    if out.shape != shape:
+        raise ValueError(f'out must have shape {shape}, got {out.shape}.')
+    if out.dtype.kind != 'f' or (dtype is not None
+                                 and out.dtype != np.dtype(dtype)):
+        raise ValueError(f'out has unexpected dtype {out.dtype}.')
+    if np.shares_memory(points, out):
+        raise ValueError('out must not share memory with input points.')
+    return points, out
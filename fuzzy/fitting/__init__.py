@@ -0,0 +1,35 @@
+"""
+This package contains tools for fitting membership functions to data.
+
+Vertices of TrapezoidFunctions can be tuned with gradient descent instead
+  of by hand. Gradients of membership degrees and of operator tree outputs
+  with respect to vertices are computed analytically and vectorized over
+  whole batch, so fitting needs only NumPy.
+
+Strong partitions can be fitted to data too large to load: PartitionFitter
+  places vertices at quantiles estimated in one pass by mergeable
+  QuantileSketch, so shards can be fitted in parallel and merged.
+"""
+from typing import TYPE_CHECKING
+
+from fuzzy._lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from fuzzy.fitting._gradients import (
+        trapezoid_gradients, tree_gradients, tree_parameters
+    )
+    from fuzzy.fitting._fitter import TrapezoidFitter
+    from fuzzy.fitting._quantile_sketch import QuantileSketch
+    from fuzzy.fitting._partition_fitter import (
+        PartitionFitter, partition_levels
+    )
+
+__getattr__, __dir__ = lazy_attributes(__name__, {
+    'trapezoid_gradients': 'fuzzy.fitting._gradients',
+    'tree_gradients': 'fuzzy.fitting._gradients',
+    'tree_parameters': 'fuzzy.fitting._gradients',
+    'TrapezoidFitter': 'fuzzy.fitting._fitter',
+    'QuantileSketch': 'fuzzy.fitting._quantile_sketch',
+    'PartitionFitter': 'fuzzy.fitting._partition_fitter',
+    'partition_levels': 'fuzzy.fitting._partition_fitter',
+})
@@ -0,0 +1,136 @@
+"""
+Mini-batch gradient descent over trapezoid vertices of rule trees.
+"""
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from fuzzy.functions import TrapezoidFunction, TriangularFunction
+from fuzzy.fitting._gradients import tree_gradients, tree_parameters
+from fuzzy.operators._operators import Operatable
+
+
+class TrapezoidFitter:
+    """
+    Fit vertices of TrapezoidFunctions so rule outputs match targets.
+
+    Each rule is an operator tree; loss is mean squared error between rule
+      outputs and target degrees over batch and rules. Functions shared
+      between rules are fitted jointly. After every step vertices are
+      projected back onto constructor invariants, so fitted functions stay
+      valid. TriangularFunction keeps single top vertex.
+    """
+
+    rules: List[Operatable]
+    """Operator trees whose outputs are fitted."""
+    parameters: List[TrapezoidFunction]
+    """Unique TrapezoidFunctions of all rules, modified in place."""
+
+    def __init__(
+            self,
+            rules: Sequence[Operatable],
+            learning_rate: float = 0.1,
+            batch_size: int = 1024,
+            min_gap: float = 1e-6,
+            seed: Optional[int] = None
+    ) -> None:
+        """
+        Construct fitter for rules.
+
+        :param rules: operator trees to fit.
+        :param learning_rate: step size of gradient descent.
+        :param batch_size: number of samples in mini-batch.
+        :param min_gap: minimal width of slopes kept by projection.
+        :param seed: seed of mini-batch shuffling.
+        """
+        self.rules = list(rules)
+        self.parameters = []
+        seen = set()
+        for rule in self.rules:
+            for funct in tree_parameters(rule):
+                if id(funct) not in seen:
+                    seen.add(id(funct))
+                    self.parameters.append(funct)
+        self.learning_rate = learning_rate
+        self.batch_size = batch_size
+        self.min_gap = min_gap
+        self._random = np.random.default_rng(seed)
+
+    def loss(self, input_points, targets) -> float:
+        """
+        Return mean squared error of rule outputs.
+
+        :param input_points: array-like of shape ``(N,)``.
+        :param targets: array-like of shape ``(N, len(rules))`` or ``(N,)``
+          for single rule.
+        :return: loss value.
+        """
+        x = np.asarray(input_points, dtype=float)
+        targets = np.asarray(targets, dtype=float).reshape(len(x), -1)
+        outputs = np.stack([rule.evaluate_batch(x) for rule in self.rules],
+                           axis=1)
+        return float(np.mean((outputs - targets) ** 2))
+
+    def step(self, input_points, targets) -> float:
+        """
+        Make single gradient descent step on one mini-batch.
+
+        :param input_points: array-like of shape ``(N,)``.
+        :param targets: array-like of shape ``(N, len(rules))`` or ``(N,)``
+          for single rule.
+        :return: loss value before step.
+        """
+        x = np.asarray(input_points, dtype=float)
+        targets = np.asarray(targets, dtype=float).reshape(len(x), -1)
+        scale = 2. / targets.size
+        totals = {}
+        loss = 0.
+        for rule, target in zip(self.rules, targets.T):
+            # Upstream gradient of loss is computed from output of the same
+            #  forward pass.
+            output, gradients = tree_gradients(
+                rule, x, lambda output: scale * (output - target)
+            )
+            residual = output - target
+            loss += float(residual @ residual)
+            for key, gradient in gradients.items():
+                totals[key] = totals.get(key, 0.) + gradient
+        for funct in self.parameters:
+            if id(funct) in totals:
+                self._update(funct, totals[id(funct)])
+        return loss / targets.size
+
+    def fit(self, input_points, targets, epochs: int = 10) -> List[float]:
+        """
+        Run mini-batch gradient descent over shuffled samples.
+
+        :param input_points: array-like of shape ``(N,)``.
+        :param targets: array-like of shape ``(N, len(rules))`` or ``(N,)``
+          for single rule.
+        :param epochs: number of passes over all samples.
+        :return: mean mini-batch loss of each epoch.
+        """
+        x = np.asarray(input_points, dtype=float)
+        targets = np.asarray(targets, dtype=float).reshape(len(x), -1)
+        history = []
+        for _ in range(epochs):
+            order = self._random.permutation(len(x))
+            losses = []
+            for start in range(0, len(x), self.batch_size):
+                batch = order[start:start + self.batch_size]
+                losses.append(self.step(x[batch], targets[batch]))
+            history.append(float(np.mean(losses)))
+        return history
+
+    def _update(self, funct: TrapezoidFunction, gradient: np.ndarray) -> None:
+        if isinstance(funct, TriangularFunction):
+            gradient = gradient.copy()
+            gradient[1] = gradient[2] = gradient[1] + gradient[2]
+        vertices = np.array(funct.vertices) - self.learning_rate * gradient
+        a, b, c, d = vertices
+        # Projection onto a < b <= c < d pushing vertices to the right;
+        #  infinite vertices stay unchanged.
+        b = max(b, a + self.min_gap)
+        c = max(c, b)
+        d = max(d, c + self.min_gap)
+        funct.vertices = (float(a), float(b), float(c), float(d))
@@ -0,0 +1,156 @@
+"""
+Analytic gradients of membership degrees with respect to trapezoid vertices.
+
+For TrapezoidFunction with vertices ``a <= b <= c <= d`` degree depends on
+  vertices only on slopes:
+    *. Ascending slope ``(x - a)/(b - a)``:
+       ``d/da = (x - b)/(b - a)**2``, ``d/db = -(x - a)/(b - a)**2``.
+    *. Descending slope ``(d - x)/(d - c)``:
+       ``d/dc = (d - x)/(d - c)**2``, ``d/dd = (x - c)/(d - c)**2``.
+  On plateaus all derivatives are 0.
+
+Operator trees are differentiated by backpropagation: t-norm and s-norm pass
+  gradient to child with minimal and maximal degree respectively, strong
+  negation flips its sign and hedges scale it by their derivative.
+"""
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from fuzzy.functions import TrapezoidFunction, FuzzyMembershipFunction
+from fuzzy.operators import TNorm, SNorm, StrongNegation, Hedge
+from fuzzy.operators._operators import Operatable
+
+
+def trapezoid_gradients(
+        funct: TrapezoidFunction,
+        input_points
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Return membership degrees and their gradients for batch of points.
+
+    :param funct: TrapezoidFunction (or its subclass) to differentiate.
+    :param input_points: 1-dimensional array-like of input points.
+    :return: tuple of degrees of shape ``(N,)`` and gradients with respect
+      to ``funct.vertices`` of shape ``(N, 4)``; gradients with respect to
+      infinite vertices are 0.
+    """
+    x = np.asarray(input_points, dtype=float)
+    return funct.evaluate_batch(x), _slope_gradients(funct, x)
+
+
+def _slope_gradients(funct: TrapezoidFunction, x: np.ndarray) -> np.ndarray:
+    a, b, c, d = funct.vertices
+    gradients = np.zeros(x.shape + (4,))
+    if np.isfinite(a):
+        ascending = (x > a) & (x < b)
+        xa = x[ascending]
+        squared = (b - a) ** 2
+        gradients[ascending, 0] = (xa - b) / squared
+        gradients[ascending, 1] = -(xa - a) / squared
+    if np.isfinite(d):
+        descending = (x >= c) & (x <= d)
+        xd = x[descending]
+        squared = (d - c) ** 2
+        gradients[descending, 2] = (d - xd) / squared
+        gradients[descending, 3] = (xd - c) / squared
+    return gradients
+
+
+def tree_parameters(operatable: Operatable) -> List[TrapezoidFunction]:
+    """
+    Return unique TrapezoidFunctions of operator tree in depth-first order.
+
+    :param operatable: FuzzyMembershipFunction or FuzzyOperator.
+    :return: list of TrapezoidFunction leaves, each listed once.
+    """
+    parameters = []
+    seen = set()
+    stack = [operatable]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, TrapezoidFunction):
+            if id(node) not in seen:
+                seen.add(id(node))
+                parameters.append(node)
+        elif not isinstance(node, FuzzyMembershipFunction):
+            stack.extend(reversed(node.functions))
+    return parameters
+
+
+def tree_gradients(
+        operatable: Operatable,
+        input_points,
+        upstream: Union[np.ndarray, Callable[[np.ndarray], np.ndarray],
+                        None] = None
+) -> Tuple[np.ndarray, Dict[int, np.ndarray]]:
+    """
+    Return tree output and gradients summed over batch.
+
+    :param operatable: FuzzyMembershipFunction or FuzzyOperator built from
+      TrapezoidFunction, ConstantFunction, TNorm, SNorm, StrongNegation
+      and hedges.
+    :param input_points: 1-dimensional array-like of input points.
+    :param upstream: optional weights of shape ``(N,)`` multiplying
+      gradient of each sample, or callable computing them from tree
+      output, e.g. derivative of loss with respect to tree output, which
+      then needs no separate forward pass; defaults to ones.
+    :return: tuple of tree output of shape ``(N,)`` and dictionary mapping
+      ``id`` of each TrapezoidFunction leaf to its summed gradient of
+      shape ``(4,)``.
+    """
+    x = np.asarray(input_points, dtype=float)
+    outputs = {}
+    _forward(operatable, x, outputs)
+    if upstream is None:
+        upstream = np.ones(x.shape)
+    elif callable(upstream):
+        upstream = upstream(outputs[id(operatable)])
+    gradients = {}
+    _backward(operatable, x, upstream, outputs, gradients)
+    return outputs[id(operatable)], gradients
+
+
+def _forward(node: Operatable, x: np.ndarray, outputs: Dict) -> np.ndarray:
+    # Caches output of every node under its id.
+    if id(node) in outputs:
+        return outputs[id(node)]
+    if isinstance(node, FuzzyMembershipFunction):
+        output = node.evaluate_batch(x)
+    elif isinstance(node, StrongNegation):
+        output = 1 - _forward(node.functions[0], x, outputs)
+    elif isinstance(node, Hedge):
+        output = node.apply_batch(_forward(node.functions[0], x, outputs))
+    elif isinstance(node, TNorm):
+        output = np.minimum.reduce(
+            [_forward(f, x, outputs) for f in node.functions])
+    elif isinstance(node, SNorm):
+        output = np.maximum.reduce(
+            [_forward(f, x, outputs) for f in node.functions])
+    else:
+        raise TypeError(f'Cannot differentiate {type(node).__name__}.')
+    outputs[id(node)] = output
+    return output
+
+
+def _backward(node, x, upstream, outputs, gradients) -> None:
+    # Accumulates upstream-weighted gradients of TrapezoidFunction leaves.
+    if isinstance(node, TrapezoidFunction):
+        local = _slope_gradients(node, x)
+        gradients[id(node)] = gradients.get(id(node), 0.) + upstream @ local
+    elif isinstance(node, StrongNegation):
+        _backward(node.functions[0], x, -upstream, outputs, gradients)
+    elif isinstance(node, Hedge):
+        child = node.functions[0]
+        local = node.derivative_batch(outputs[id(child)])
+        _backward(child, x, upstream * local, outputs, gradients)
+    elif isinstance(node, (TNorm, SNorm)):
+        children = np.stack([outputs[id(f)] for f in node.functions])
+        if isinstance(node, TNorm):
+            selected = np.argmin(children, axis=0)
+        else:
+            selected = np.argmax(children, axis=0)
+        for i, child in enumerate(node.functions):
+            child_upstream = np.where(selected == i, upstream, 0.)
+            if child_upstream.any():
+                _backward(child, x, child_upstream, outputs, gradients)
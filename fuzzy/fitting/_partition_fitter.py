@@ -0,0 +1,144 @@
+"""
+Strong partitions fitted to quantiles of streamed data.
+
+Partition of ``m`` terms is determined by ``2 * (m - 1)`` shared vertices
+  ``v_0 <= v_1 <= ...``: first term is left InfiniteTrapezoidFunction
+  descending from ``v_0`` to ``v_1``, term ``i`` in the middle rises from
+  ``v_{2i - 2}`` to ``v_{2i - 1}`` and falls from ``v_{2i}`` to
+  ``v_{2i + 1}``, and last term is right InfiniteTrapezoidFunction. Middle
+  terms with ``v_{2i - 1} == v_{2i}`` are TriangularFunctions.
+
+PartitionFitter places those vertices at quantiles of data estimated by
+  QuantileSketch, so it needs single pass over data and bounded memory,
+  and fitters of shards can be merged.
+"""
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from fuzzy.functions import Partition, TrapezoidBank, TrapezoidFunction
+from fuzzy.fitting._quantile_sketch import QuantileSketch
+
+
+def partition_levels(terms: int, plateau: float = 0.5) -> np.ndarray:
+    """
+    Return evenly spread quantile levels of partition vertices.
+
+    Range of levels [0;1] is split into ``terms`` equal cells, one for each
+      term, and neighbouring terms overlap around cell boundaries.
+
+    :param terms: number of terms, at least 2.
+    :param plateau: fraction of cell where term has degree 1, in [0;1);
+      0 makes middle terms triangular.
+    :return: non-decreasing array of ``2 * (terms - 1)`` levels in (0;1).
+    :raises ValueError: when arguments are out of range.
+    """
+    if terms < 2:
+        raise ValueError('Partition fitting requires at least 2 terms.')
+    if not 0. <= plateau < 1.:
+        raise ValueError('plateau must be in range [0;1).')
+    boundaries = np.arange(1, terms) / terms
+    half_overlap = (1. - plateau) / terms / 2
+    return np.stack([boundaries - half_overlap,
+                     boundaries + half_overlap], axis=1).ravel()
+
+
+class PartitionFitter:
+    """
+    One-pass fitter of strong partition to quantiles of streamed values.
+    """
+
+    levels: np.ndarray
+    """Quantile levels of shared vertices of partition."""
+    sketch: QuantileSketch
+    """Sketch of values seen so far."""
+
+    def __init__(
+            self,
+            terms: int = 3,
+            plateau: float = 0.5,
+            levels: Optional[Sequence[float]] = None,
+            k: int = 200,
+            seed: Optional[int] = None
+    ) -> None:
+        """
+        Construct fitter with empty sketch.
+
+        :param terms: number of terms; see partition_levels.
+        :param plateau: fraction of each term's share of data where it has
+          degree 1; see partition_levels.
+        :param levels: explicit non-decreasing quantile levels of shared
+          vertices, of even length; overrides terms and plateau.
+        :param k: accuracy parameter of QuantileSketch.
+        :param seed: seed of QuantileSketch.
+        :raises ValueError: when levels are invalid.
+        """
+        if levels is None:
+            self.levels = partition_levels(terms, plateau)
+        else:
+            self.levels = np.asarray(levels, dtype=float)
+            if (self.levels.ndim != 1 or len(self.levels) < 2
+                    or len(self.levels) % 2):
+                raise ValueError('levels must be 1-dimensional sequence of '
+                                 'even length.')
+            if (np.any(np.diff(self.levels) < 0) or self.levels[0] < 0
+                    or self.levels[-1] > 1):
+                raise ValueError('levels must be non-decreasing and in '
+                                 'range [0;1].')
+        self.sketch = QuantileSketch(k, seed)
+
+    def update(self, values) -> None:
+        """
+        Add batch of values.
+
+        :param values: array-like of values; NaN values are ignored.
+        """
+        self.sketch.update(values)
+
+    def merge(self, other: "PartitionFitter") -> "PartitionFitter":
+        """
+        Add values seen by other fitter, e.g. fitted on another shard.
+
+        :param other: fitter with the same levels and k.
+        :return: this fitter.
+        :raises ValueError: when fitters have different levels or k.
+        """
+        if not np.array_equal(self.levels, other.levels):
+            raise ValueError('Cannot merge fitters with different levels.')
+        self.sketch.merge(other.sketch)
+        return self
+
+    def vertices(self) -> np.ndarray:
+        """
+        Return vertices of fitted terms.
+
+        :return: array of shape ``(terms, 4)`` with rows as in
+          TrapezoidBank.
+        :raises ValueError: when no values were seen.
+        """
+        shared = self.sketch.quantile(self.levels)
+        inf = float('inf')
+        rows = [[-inf, -inf, shared[0], shared[1]]]
+        for start in range(0, len(shared) - 2, 2):
+            rows.append(shared[start:start + 4])
+        rows.append([shared[-2], shared[-1], inf, inf])
+        return np.array(rows, dtype=float)
+
+    def functions(self) -> List[TrapezoidFunction]:
+        """
+        Return fitted terms.
+
+        :return: left InfiniteTrapezoidFunction, TrapezoidFunctions or
+          TriangularFunctions, and right InfiniteTrapezoidFunction.
+        :raises ValueError: when no values were seen, or data has too few
+          distinct values for vertices to be increasing.
+        """
+        return list(TrapezoidBank(self.vertices()))
+
+    def partition(self) -> Partition:
+        """
+        Return fitted terms as Partition.
+
+        :raises ValueError: as in functions.
+        """
+        return Partition(self.functions())
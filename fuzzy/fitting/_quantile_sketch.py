@@ -0,0 +1,167 @@
+"""
+Mergeable streaming quantile sketch (KLL).
+
+KLL sketch keeps stack of compactors: items on level ``h`` stand for
+  ``2 ** h`` stream items. When sketch retains more items than total
+  capacity of its levels, lowest level reaching its capacity is sorted and
+  every other item (starting at random offset) is promoted to next level,
+  the rest is dropped. Capacities shrink geometrically towards lower
+  levels, so sketch of ``n`` items retains ``O(k)`` items, and rank error
+  of quantiles is ``O(1 / k)`` with high probability, independently of
+  ``n``. Sketches of disjoint streams are merged by concatenating their
+  levels and compacting, which makes them suitable for sharded data.
+"""
+from math import ceil
+from typing import List, Optional
+
+import numpy as np
+
+_CAPACITY_RATIO = 2 / 3
+_MIN_CAPACITY = 2
+
+
+class QuantileSketch:
+    """
+    KLL quantile sketch over stream of floats.
+
+    NaN values are ignored; minimum and maximum are tracked exactly.
+    """
+
+    k: int
+    """Capacity of top compactor; controls accuracy and memory."""
+    count: int
+    """Number of items seen, including merged sketches."""
+    min: float
+    """Smallest item seen; inf for empty sketch."""
+    max: float
+    """Largest item seen; -inf for empty sketch."""
+
+    def __init__(self, k: int = 200, seed: Optional[int] = None) -> None:
+        """
+        Construct empty sketch.
+
+        :param k: capacity of top compactor; rank error is below
+          ``2.5 / k`` with high probability.
+        :param seed: seed of random offsets of compactions.
+        :raises ValueError: when k is smaller than 8.
+        """
+        if k < 8:
+            raise ValueError('k must be at least 8.')
+        self.k = k
+        self.count = 0
+        self.min = float('inf')
+        self.max = float('-inf')
+        self._levels: List[np.ndarray] = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+
+    def __len__(self) -> int:
+        return self.count
+
+    @property
+    def retained(self) -> int:
+        """Number of items stored by sketch."""
+        return sum(len(level) for level in self._levels)
+
+    def update(self, values) -> None:
+        """
+        Add batch of values to sketch.
+
+        Memory used while updating is proportional to batch size; retained
+          items don't depend on it.
+
+        :param values: array-like of values.
+        """
+        values = np.asarray(values, dtype=float).ravel()
+        values = values[~np.isnan(values)]
+        if not len(values):
+            return
+        self.count += len(values)
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+        # Whole batch is compacted at once; error of single compaction
+        #  doesn't depend on number of compacted items.
+        self._levels[0] = np.concatenate([self._levels[0], values])
+        self._compress()
+
+    def merge(self, other: "QuantileSketch") -> "QuantileSketch":
+        """
+        Add items summarized by other sketch to this one.
+
+        :param other: sketch with the same k; it is not modified.
+        :return: this sketch.
+        :raises ValueError: when sketches have different k.
+        """
+        if other.k != self.k:
+            raise ValueError(
+                f'Cannot merge sketches with k={self.k} and k={other.k}.'
+            )
+        while len(self._levels) < len(other._levels):
+            self._levels.append(np.empty(0))
+        for height, level in enumerate(other._levels):
+            self._levels[height] = np.concatenate(
+                [self._levels[height], level]
+            )
+        self.count += other.count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._compress()
+        return self
+
+    def quantile(self, levels):
+        """
+        Return approximate quantiles of items seen.
+
+        Quantile at level ``q`` is smallest retained item whose estimated
+          rank reaches ``q * count``; levels 0 and 1 give exact minimum and
+          maximum.
+
+        :param levels: quantile level or array-like of levels in [0;1].
+        :return: float or array of quantiles of the same shape as levels.
+        :raises ValueError: when sketch is empty or levels are out of [0;1].
+        """
+        levels = np.asarray(levels, dtype=float)
+        if not self.count:
+            raise ValueError('Quantiles of empty sketch are undefined.')
+        if np.any((levels < 0) | (levels > 1)):
+            raise ValueError('Quantile levels must be in range [0;1].')
+        items = np.concatenate(self._levels)
+        weights = np.concatenate([
+            np.full(len(level), 2. ** height)
+            for height, level in enumerate(self._levels)
+        ])
+        order = np.argsort(items, kind='stable')
+        items = items[order]
+        ranks = np.cumsum(weights[order])
+        targets = levels * ranks[-1]
+        indices = np.minimum(np.searchsorted(ranks, targets), len(items) - 1)
+        quantiles = np.clip(items[indices], self.min, self.max)
+        quantiles = np.where(levels == 0, self.min, quantiles)
+        quantiles = np.where(levels == 1, self.max, quantiles)
+        if quantiles.ndim == 0:
+            return float(quantiles)
+        return quantiles
+
+    def _capacity(self, height: int) -> int:
+        depth = len(self._levels) - height - 1
+        return max(_MIN_CAPACITY, ceil(self.k * _CAPACITY_RATIO ** depth))
+
+    def _compress(self) -> None:
+        # Compaction is lazy: levels may exceed their capacities while
+        #  sketch as whole fits, and only the lowest full level is
+        #  compacted at a time. Fewer compactions keep rank error low.
+        while self.retained > sum(map(self._capacity,
+                                      range(len(self._levels)))):
+            height = next(
+                height for height, level in enumerate(self._levels)
+                if len(level) >= self._capacity(height)
+            )
+            if height + 1 == len(self._levels):
+                self._levels.append(np.empty(0))
+            level = np.sort(self._levels[height])
+            # With odd size smallest item stays on its level.
+            kept = level[:len(level) % 2]
+            offset = len(kept) + int(self._rng.integers(2))
+            self._levels[height] = kept
+            self._levels[height + 1] = np.concatenate(
+                [self._levels[height + 1], level[offset::2]]
+            )
@@ -1,4 +1,23 @@
+"""
+This package contains fuzzy membership functions.
+
+Scalar membership functions are imported eagerly and don't need NumPy;
+  Partition, TrapezoidBank and validate_vertices are loaded on first access.
+"""
+from typing import TYPE_CHECKING
+
+from fuzzy._lazy import lazy_attributes
 from fuzzy.functions._functions import (
     FuzzyMembershipFunction, TrapezoidFunction, InfiniteTrapezoidFunction, \
-    TriangularFunction
+    TriangularFunction, ConstantFunction
 )
+
+if TYPE_CHECKING:
+    from fuzzy.functions._partition import Partition
+    from fuzzy.functions._bank import TrapezoidBank, validate_vertices
+
+__getattr__, __dir__ = lazy_attributes(__name__, {
+    'Partition': 'fuzzy.functions._partition',
+    'TrapezoidBank': 'fuzzy.functions._bank',
+    'validate_vertices': 'fuzzy.functions._bank',
+})
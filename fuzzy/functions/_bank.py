@@ -0,0 +1,239 @@
+"""
+Banks of trapezoid membership functions stored as vertex arrays.
+
+Building large numbers of TrapezoidFunction objects one by one is slow and
+  relies on ``assert`` statements, which are removed under ``python -O``.
+  TrapezoidBank validates whole parameter table at once, raising ValueError
+  that names offending rows, evaluates all functions together and creates
+  function objects only when they are accessed.
+"""
+from typing import Iterator, Mapping, Optional, Sequence, Union
+
+import numpy as np
+
+from fuzzy.batch import Workspace, prepare_batch
+from fuzzy.functions._functions import (
+    TrapezoidFunction, InfiniteTrapezoidFunction, TriangularFunction
+)
+from fuzzy.functions._kernels import (
+    trapezoid_kernel, trapezoid_kernel_parameters
+)
+
+VERTEX_NAMES = ('lower_boundary', 'min_full_boundary',
+                'max_full_boundary', 'upper_boundary')
+"""Names of vertex columns, in order of TrapezoidFunction arguments."""
+
+_REPORTED_ROWS = 10
+
+
+def validate_vertices(vertices: np.ndarray, clamp=True) -> None:
+    """
+    Check vertex table against TrapezoidFunction constructor invariants.
+
+    Rows follow TrapezoidFunction conventions: ``lower_boundary`` equal to
+      ``-inf`` requires ``min_full_boundary`` equal to ``-inf``, and
+      ``upper_boundary`` equal to ``inf`` requires ``max_full_boundary``
+      equal to ``inf``. Clamped rows with single infinite side become
+      InfiniteTrapezoidFunctions, so their finite side needs finite plateau
+      end and slope. NaN vertices are invalid.
+
+    :param vertices: array of shape ``(N, 4)``.
+    :param clamp: whether rows with single infinite side are
+      InfiniteTrapezoidFunctions; scalar or boolean array of shape ``(N,)``.
+    :raises ValueError: when any row is invalid; message names up to
+      10 first offending rows and broken invariants.
+    """
+    if vertices.ndim != 2 or vertices.shape[1] != 4:
+        raise ValueError(
+            f'Vertices must have shape (N, 4), got {vertices.shape}.'
+        )
+    lower, min_full, max_full, upper = vertices.T
+    has_nan = np.isnan(vertices).any(axis=1)
+    checks = [
+        (~has_nan, 'vertex is NaN'),
+        (min_full <= max_full,
+         'min_full_boundary > max_full_boundary'),
+        (np.where(lower == -np.inf, min_full == -np.inf, lower < min_full),
+         'lower_boundary >= min_full_boundary'),
+        (np.where(upper == np.inf, max_full == np.inf, max_full < upper),
+         'max_full_boundary >= upper_boundary'),
+        (~(clamp & (lower == -np.inf) & (upper != np.inf)
+           & (max_full == -np.inf)),
+         'left infinite row with infinite max_full_boundary'),
+        (~(clamp & (upper == np.inf) & (lower != -np.inf)
+           & (min_full == np.inf)),
+         'right infinite row with infinite min_full_boundary'),
+    ]
+    valid = np.logical_and.reduce([check for check, _ in checks])
+    if valid.all():
+        return
+    invalid_rows = np.flatnonzero(~valid)
+    reasons = []
+    for row in invalid_rows[:_REPORTED_ROWS]:
+        # Comparisons with NaN fail, so other checks would be misleading.
+        broken = checks[0][1] if has_nan[row] else ', '.join(
+            message for check, message in checks if not check[row]
+        )
+        reasons.append(f'row {row} {tuple(vertices[row].tolist())}: {broken}')
+    more = len(invalid_rows) - _REPORTED_ROWS
+    if more > 0:
+        reasons.append(f'... and {more} more')
+    raise ValueError(
+        f'Invalid trapezoid vertices in {len(invalid_rows)} rows: '
+        + '; '.join(reasons)
+    )
+
+
+class TrapezoidBank:
+    """
+    Sequence of trapezoid membership functions backed by vertex array.
+
+    Items are created on first access: clamped rows with single infinite
+      side become InfiniteTrapezoidFunction, rows with single finite top
+      vertex become TriangularFunction, and all other rows
+      TrapezoidFunction.
+    """
+
+    vertices: np.ndarray
+    """Validated vertices of shape ``(N, 4)``, columns as VERTEX_NAMES."""
+    clamp: np.ndarray
+    """
+    Whether row with single infinite side is InfiniteTrapezoidFunction,
+      which clamps input points to its slope; boolean array of shape
+      ``(N,)``. Other rows are plain TrapezoidFunctions; at infinite input
+      points degrees of the two differ.
+    """
+
+    def __init__(self, vertices, validate: bool = True, clamp=True) -> None:
+        """
+        Construct bank from vertex table.
+
+        :param vertices: array-like of shape ``(N, 4)``.
+        :param validate: check rows; skipped only for tables known to be
+          valid, e.g. memory-mapped from files written by this package.
+        :param clamp: whether rows with single infinite side are
+          InfiniteTrapezoidFunctions; scalar or array-like of shape
+          ``(N,)``.
+        :raises ValueError: when any row is invalid.
+        """
+        vertices = np.asarray(vertices, dtype=float)
+        clamp = np.broadcast_to(np.asarray(clamp, dtype=bool),
+                                vertices.shape[:1])
+        if validate:
+            validate_vertices(vertices, clamp)
+        self.vertices = vertices
+        self.clamp = clamp
+        self._functions = {}
+        self._kernel_parameters = None
+
+    @classmethod
+    def from_arrays(
+            cls,
+            lower_boundary,
+            min_full_boundary,
+            max_full_boundary,
+            upper_boundary
+    ) -> "TrapezoidBank":
+        """
+        Construct bank from one array for each vertex.
+
+        :param lower_boundary: array-like of left-most vertices.
+        :param min_full_boundary: array-like of second-to-left vertices.
+        :param max_full_boundary: array-like of third-to-left vertices.
+        :param upper_boundary: array-like of right-most vertices.
+        :return: validated TrapezoidBank.
+        :raises ValueError: when arrays differ in length or any row is
+          invalid.
+        """
+        columns = [np.asarray(column, dtype=float).ravel() for column in
+                   (lower_boundary, min_full_boundary, max_full_boundary,
+                    upper_boundary)]
+        if len({len(column) for column in columns}) != 1:
+            raise ValueError('Vertex arrays must have equal lengths.')
+        return cls(np.stack(columns, axis=1))
+
+    @classmethod
+    def from_records(
+            cls,
+            records: Union[np.ndarray, Sequence[Sequence[float]],
+                           Sequence[Mapping[str, float]]]
+    ) -> "TrapezoidBank":
+        """
+        Construct bank from records of vertices.
+
+        :param records: NumPy structured array with VERTEX_NAMES fields,
+          sequence of mappings with VERTEX_NAMES keys, or sequence of
+          4-element sequences ordered as VERTEX_NAMES.
+        :return: validated TrapezoidBank.
+        :raises ValueError: when any row is invalid.
+        """
+        if isinstance(records, np.ndarray) and records.dtype.names:
+            return cls.from_arrays(*(records[name] for name in VERTEX_NAMES))
+        records = list(records)
+        if records and isinstance(records[0], Mapping):
+            return cls.from_arrays(*(
+                [record[name] for record in records] for name in VERTEX_NAMES
+            ))
+        return cls(np.asarray(records, dtype=float).reshape(-1, 4))
+
+    def __len__(self) -> int:
+        return len(self.vertices)
+
+    def __getitem__(self, index: int) -> TrapezoidFunction:
+        """
+        Return membership function of given row, creating it if needed.
+
+        :param index: row index.
+        :return: TrapezoidFunction or its subclass.
+        """
+        index = range(len(self))[index]
+        if index not in self._functions:
+            self._functions[index] = self._materialize(index)
+        return self._functions[index]
+
+    def __iter__(self) -> Iterator[TrapezoidFunction]:
+        return (self[i] for i in range(len(self)))
+
+    def evaluate_batch(
+            self,
+            input_points,
+            out: Optional[np.ndarray] = None,
+            dtype=None,
+            workspace: Optional[Workspace] = None
+    ) -> np.ndarray:
+        """
+        Return membership degrees of all functions for array of points.
+
+        Results are identical to batch evaluation of materialized functions.
+
+        :param input_points: array-like of points in data-space.
+        :param out: optional buffer of shape
+          ``input_points.shape + (len(bank),)``.
+        :param dtype: floating point dtype of membership degrees; defaults
+          to dtype of out, or float64.
+        :param workspace: optional Workspace providing scratch array.
+        :return: array of shape ``input_points.shape + (len(bank),)``; out
+          when given.
+        """
+        input_points, out = prepare_batch(input_points, out, dtype,
+                                          trailing=(len(self),))
+        if self._kernel_parameters is None:
+            self._kernel_parameters = trapezoid_kernel_parameters(
+                self.vertices, self.clamp
+            )
+        with (workspace or Workspace()).scratch(out.shape, out.dtype) \
+                as scratch:
+            trapezoid_kernel(input_points[..., None], *self._kernel_parameters,
+                             out=out, scratch=scratch)
+        return out
+
+    def _materialize(self, index: int) -> TrapezoidFunction:
+        lower, min_full, max_full, upper = self.vertices[index].tolist()
+        if self.clamp[index]:
+            if lower == -np.inf and upper != np.inf:
+                return InfiniteTrapezoidFunction(max_full, upper, 'left')
+            if upper == np.inf and lower != -np.inf:
+                return InfiniteTrapezoidFunction(lower, min_full, 'right')
+        if min_full == max_full and np.isfinite(min_full):
+            return TriangularFunction(lower, min_full, upper)
+        return TrapezoidFunction(lower, min_full, max_full, upper)
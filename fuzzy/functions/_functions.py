@@ -2,13 +2,67 @@
 Fuzzy set membership functions calculate degree of membership for given value.
 
 All function should be callable just like name implies.
+
+Membership functions can be combined into operator trees with ``&`` (t-norm),
+  ``|`` (s-norm), ``~`` (strong negation) and ``**`` (power hedge); see
+  :func:`fuzzy.operators.conjunction` for folding rules.
+
+Batch evaluation (``evaluate_batch``) can write results of given dtype into
+  caller's ``out`` buffer and take scratch arrays from reusable Workspace;
+  see :mod:`fuzzy.batch`. NumPy is imported only by batch evaluation, so
+  scalar membership functions can be used without it.
 """
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Optional, Tuple, Union
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from fuzzy.batch import Workspace
 
 
 class FuzzyMembershipFunction(ABC):
     """Base class for membership functions in fuzzy logic."""
 
+    # Operands other than membership functions and degrees return
+    #  NotImplemented; FuzzyOperators then build tree in reflected method.
+
+    def __and__(self, other: Union["FuzzyMembershipFunction", float]):
+        from fuzzy.operators import conjunction
+        if not isinstance(other, (FuzzyMembershipFunction, int, float)):
+            return NotImplemented
+        return conjunction(self, other)
+
+    def __rand__(self, other: Union["FuzzyMembershipFunction", float]):
+        from fuzzy.operators import conjunction
+        if not isinstance(other, (FuzzyMembershipFunction, int, float)):
+            return NotImplemented
+        return conjunction(other, self)
+
+    def __or__(self, other: Union["FuzzyMembershipFunction", float]):
+        from fuzzy.operators import disjunction
+        if not isinstance(other, (FuzzyMembershipFunction, int, float)):
+            return NotImplemented
+        return disjunction(self, other)
+
+    def __ror__(self, other: Union["FuzzyMembershipFunction", float]):
+        from fuzzy.operators import disjunction
+        if not isinstance(other, (FuzzyMembershipFunction, int, float)):
+            return NotImplemented
+        return disjunction(other, self)
+
+    def __invert__(self):
+        from fuzzy.operators import negation
+        return negation(self)
+
+    def __pow__(self, exponent: float):
+        from fuzzy.operators import power
+        if not isinstance(exponent, (int, float)):
+            return NotImplemented
+        return power(self, exponent)
+
     @abstractmethod
     def __call__(self, input_point: float) -> float:
         """Return fuzzy set membership value for a given input point.
@@ -20,6 +74,61 @@ class FuzzyMembershipFunction(ABC):
         """
         pass
 
+    def evaluate_batch(
+            self,
+            input_points,
+            out: Optional[np.ndarray] = None,
+            dtype=None,
+            workspace: Optional[Workspace] = None
+    ) -> np.ndarray:
+        """
+        Return membership degrees for array of input points.
+
+        Default implementation calls membership function for each point;
+          subclasses override it with vectorized kernels.
+
+        :param input_points: array-like of points in data-space.
+        :param out: optional buffer of same shape as input_points to write
+          membership degrees to.
+        :param dtype: floating point dtype of membership degrees; defaults
+          to dtype of out, or float64.
+        :param workspace: optional Workspace providing scratch arrays.
+        :return: array of membership degrees of same shape as input_points;
+          out when given.
+        """
+        import numpy as np
+        from fuzzy.batch import prepare_batch
+
+        input_points, out = prepare_batch(input_points, out, dtype)
+        out[...] = np.fromiter(
+            (self(point) for point in input_points.flat),
+            dtype=float, count=input_points.size
+        ).reshape(input_points.shape)
+        return out
+
+    def interval(self, input_point: float) -> Tuple[float, float]:
+        """
+        Return interval of membership degree for given input point.
+
+        Type-1 membership functions have degenerate intervals; interval
+          type-2 functions override it.
+
+        :param input_point: point in data-space.
+        :return: lower and upper membership degree.
+        """
+        degree = self(input_point)
+        return degree, degree
+
+    def interval_batch(self, input_points) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Return intervals of membership degrees for array of input points.
+
+        :param input_points: array-like of points in data-space.
+        :return: arrays of lower and upper membership degrees.
+        """
+        degrees = self.evaluate_batch(input_points)
+        return degrees, degrees
+
 
 class TrapezoidFunction(FuzzyMembershipFunction):
     """
@@ -69,6 +178,19 @@ class TrapezoidFunction(FuzzyMembershipFunction):
         :param max_full_boundary: Start of descending slope.
         :param upper_boundary: End of descending slope.
         """
+        self.vertices = (lower_boundary, min_full_boundary,
+                         max_full_boundary, upper_boundary)
+
+    @property
+    def vertices(self) -> Tuple[float, float, float, float]:
+        """All 4 vertices ordered from left-most to right-most."""
+        return (self.lower_boundary, self.min_full_boundary,
+                self.max_full_boundary, self.upper_boundary)
+
+    @vertices.setter
+    def vertices(self, vertices: Tuple[float, float, float, float]) -> None:
+        lower_boundary, min_full_boundary, max_full_boundary, \
+            upper_boundary = vertices
         assert min_full_boundary <= max_full_boundary
         if lower_boundary != float('-inf'):
             assert lower_boundary < min_full_boundary
@@ -88,6 +210,7 @@ class TrapezoidFunction(FuzzyMembershipFunction):
         self.upper_boundary = upper_boundary
         self._ascent_denominator = self.min_full_boundary - self.lower_boundary
         self._descent_denominator = self.upper_boundary - self.max_full_boundary
+        self._kernel_parameters = None
 
     def __call__(self, input_point: float) -> float:
         """
@@ -119,6 +242,50 @@ class TrapezoidFunction(FuzzyMembershipFunction):
         # End plateau.
         return 0.
 
+    def evaluate_batch(
+            self,
+            input_points,
+            out: Optional[np.ndarray] = None,
+            dtype=None,
+            workspace: Optional[Workspace] = None
+    ) -> np.ndarray:
+        """
+        Return membership degrees for array of input points.
+
+        Vectorized equivalent of ``__call__``: both slopes are computed with
+          the same expressions as in scalar call and clipped to [0;1], so
+          float64 results are identical to scalar calls.
+
+        :param input_points: array-like of points in data-space.
+        :param out: optional buffer of same shape as input_points to write
+          membership degrees to.
+        :param dtype: floating point dtype of membership degrees; defaults
+          to dtype of out, or float64.
+        :param workspace: optional Workspace providing scratch array.
+        :return: array of membership degrees of same shape as input_points;
+          out when given.
+        """
+        import numpy as np
+        from fuzzy.batch import Workspace, prepare_batch
+        from fuzzy.functions._kernels import (
+            trapezoid_kernel, trapezoid_kernel_parameters
+        )
+
+        input_points, out = prepare_batch(input_points, out, dtype)
+        if self._kernel_parameters is None:
+            parameters = trapezoid_kernel_parameters(
+                np.array(self.vertices, dtype=float),
+                isinstance(self, InfiniteTrapezoidFunction)
+            )
+            self._kernel_parameters = tuple(
+                parameter.item() for parameter in parameters
+            )
+        with (workspace or Workspace()).scratch(out.shape, out.dtype) \
+                as scratch:
+            trapezoid_kernel(input_points, *self._kernel_parameters,
+                             out=out, scratch=scratch)
+        return out
+
 
 class InfiniteTrapezoidFunction(TrapezoidFunction):
     """
@@ -239,3 +406,55 @@ class TriangularFunction(TrapezoidFunction):
         """
         super().__init__(lower_boundary=left, min_full_boundary=top,
                          max_full_boundary=top, upper_boundary=right)
+
+
+class ConstantFunction(FuzzyMembershipFunction):
+    """
+    ConstantFunction returns the same membership degree for every input.
+
+    Used mostly as folded result of operator expressions, e.g. ``f & 0``.
+    """
+    value: float
+    """Membership degree returned for any input point."""
+
+    def __init__(self, value: float) -> None:
+        """
+        Construct constant membership function.
+
+        :param value: membership degree in range [0;1].
+        """
+        assert 0. <= value <= 1.
+        self.value = float(value)
+
+    def __call__(self, input_point: float) -> float:
+        """
+        Return constant membership degree regardless of input point.
+
+        :param input_point: ignored.
+        :return: membership degree.
+        """
+        return self.value
+
+    def evaluate_batch(
+            self,
+            input_points,
+            out: Optional[np.ndarray] = None,
+            dtype=None,
+            workspace: Optional[Workspace] = None
+    ) -> np.ndarray:
+        """
+        Return constant membership degree for each input point.
+
+        :param input_points: array-like of points; only shape is used.
+        :param out: optional buffer of same shape as input_points.
+        :param dtype: floating point dtype of membership degrees.
+        :param workspace: unused.
+        :return: array of membership degrees of same shape as input_points;
+          out when given.
+        """
+        from fuzzy.batch import prepare_batch
+
+        _, out = prepare_batch(input_points, out, dtype)
+        out.fill(self.value)
+        return out
+
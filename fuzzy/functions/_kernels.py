@@ -0,0 +1,64 @@
+"""
+Vectorized kernels of trapezoid membership functions.
+"""
+from typing import Tuple
+
+import numpy as np
+
+
+def trapezoid_kernel_parameters(
+        vertices: np.ndarray,
+        clamp
+) -> Tuple[np.ndarray, ...]:
+    """
+    Return parameters of trapezoid_kernel for vertices of trapezoids.
+
+    :param vertices: array of shape ``(..., 4)``.
+    :param clamp: whether trapezoids with single infinite side clamp input
+      points to their slope, like InfiniteTrapezoidFunction; scalar or
+      boolean array of shape ``(...)``.
+    :return: arrays ``floor``, ``ceiling``, ``lower``, ``ascent``,
+      ``upper`` and ``descent`` of shape ``(...)``.
+    """
+    lower, min_full, max_full, upper = np.moveaxis(vertices, -1, 0)
+    left_infinite = clamp & (lower == -np.inf) & (upper != np.inf)
+    right_infinite = clamp & (upper == np.inf) & (lower != -np.inf)
+    floor = np.where(left_infinite, max_full, -np.inf)
+    ceiling = np.where(right_infinite, min_full, np.inf)
+    # Infinite slopes get unit width, so their degree is infinite (clipped
+    #  to 1) instead of NaN.
+    with np.errstate(invalid='ignore'):
+        ascent = np.where(lower == -np.inf, 1., min_full - lower)
+        descent = np.where(upper == np.inf, 1., upper - max_full)
+    return floor, ceiling, lower, ascent, upper, descent
+
+
+def trapezoid_kernel(
+        input_points: np.ndarray,
+        floor, ceiling, lower, ascent, upper, descent,
+        out: np.ndarray,
+        scratch: np.ndarray
+) -> None:
+    """
+    Write trapezoid membership degrees to out without allocating arrays.
+
+    Degree is minimum of ascending slope ``(x - lower) / ascent`` and
+      descending slope ``(upper - x) / descent`` clipped to [0;1]; NaN input
+      points get 0, like in scalar calls. Parameters come from
+      trapezoid_kernel_parameters and broadcast against input points, so
+      one call can evaluate many trapezoids.
+
+    :param input_points: array of points in data-space.
+    :param out: buffer for membership degrees.
+    :param scratch: buffer of same shape and dtype as out.
+    """
+    with np.errstate(invalid='ignore', divide='ignore'):
+        np.maximum(input_points, floor, out=out)
+        np.minimum(out, ceiling, out=out)
+        np.subtract(upper, out, out=scratch)
+        np.divide(scratch, descent, out=scratch)
+        np.subtract(out, lower, out=out)
+        np.divide(out, ascent, out=out)
+        np.minimum(out, scratch, out=out)
+        np.fmax(out, 0., out=out)
+        np.minimum(out, 1., out=out)
@@ -0,0 +1,153 @@
+"""
+Strong (Ruspini) partitions of input variable.
+
+In strong partition membership degrees of all terms sum to 1 and at any
+  point at most two neighbouring terms are non-zero. Partition finds them
+  by binary search over shared breakpoints instead of evaluating all terms.
+"""
+from bisect import bisect_right
+from math import isclose
+from typing import List, Sequence, Tuple
+
+import numpy as np
+
+from fuzzy.batch import as_input_array
+from fuzzy.functions._functions import TrapezoidFunction
+
+
+class Partition:
+    """
+    Ordered TrapezoidFunctions forming strong partition.
+
+    Neighbouring terms must overlap exactly: descending slope of term ``i``
+      starts where ascending slope of term ``i + 1`` starts, and ends where
+      it ends. Degrees of terms sum to 1 between ``min_full_boundary`` of
+      first term and ``max_full_boundary`` of last term; if outer terms are
+      InfiniteTrapezoidFunctions it is the whole real line.
+
+    Breakpoints are stored in ``knots`` as
+      ``[t_0.min_full, t_0.max_full, t_1.min_full, t_1.max_full, ...]``:
+      term ``i`` has plateau between ``knots[2i]`` and ``knots[2i + 1]``
+      and overlaps term ``i + 1`` between ``knots[2i + 1]`` and
+      ``knots[2i + 2]``.
+    """
+
+    terms: List[TrapezoidFunction]
+    """Terms of partition ordered from left to right."""
+    knots: np.ndarray
+    """Shared breakpoints of terms."""
+
+    def __init__(
+            self,
+            terms: Sequence[TrapezoidFunction],
+            tolerance: float = 1e-9
+    ) -> None:
+        """
+        Construct partition and check partition property.
+
+        :param terms: TrapezoidFunctions (or subclasses) ordered from left
+          to right.
+        :param tolerance: absolute and relative tolerance of comparing
+          shared vertices of neighbouring terms.
+        :raises ValueError: when terms don't form strong partition.
+        """
+        if not terms:
+            raise ValueError('Partition requires at least one term.')
+        for i, (left, right) in enumerate(zip(terms[:-1], terms[1:])):
+            overlap_start = isclose(left.max_full_boundary,
+                                    right.lower_boundary,
+                                    rel_tol=tolerance, abs_tol=tolerance)
+            overlap_end = isclose(left.upper_boundary,
+                                  right.min_full_boundary,
+                                  rel_tol=tolerance, abs_tol=tolerance)
+            if not (overlap_start and overlap_end):
+                raise ValueError(
+                    f'Terms {i} and {i + 1} do not form strong partition: '
+                    f'slopes ({left.max_full_boundary}, '
+                    f'{left.upper_boundary}) and ({right.lower_boundary}, '
+                    f'{right.min_full_boundary}) differ.'
+                )
+        self.terms = list(terms)
+        self.knots = np.array([
+            vertex for term in self.terms
+            for vertex in (term.min_full_boundary, term.max_full_boundary)
+        ])
+        self._knots = self.knots.tolist()
+
+    def __len__(self) -> int:
+        return len(self.terms)
+
+    def __getitem__(self, index: int) -> TrapezoidFunction:
+        return self.terms[index]
+
+    def __call__(self, input_point: float) -> List[Tuple[int, float]]:
+        """
+        Return non-zero membership degrees of input point.
+
+        :param input_point: point in data-space.
+        :return: list of at most two ``(term index, degree)`` pairs
+          ordered by index.
+        """
+        segment = bisect_right(self._knots, input_point)
+        if segment == 0:
+            degree = self.terms[0](input_point)
+            return [(0, degree)] if degree > 0 else []
+        if segment == len(self._knots):
+            last = len(self.terms) - 1
+            degree = self.terms[last](input_point)
+            return [(last, degree)] if degree > 0 else []
+        index = (segment - 1) // 2
+        # Odd segments are plateaus, even ones are overlaps.
+        if segment % 2:
+            return [(index, 1.)]
+        start = self._knots[segment - 1]
+        right = (input_point - start) / (self._knots[segment] - start)
+        if right == 0:
+            return [(index, 1.)]
+        return [(index, 1. - right), (index + 1, right)]
+
+    def evaluate_batch(self, input_points) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Return two candidate terms and their degrees for array of points.
+
+        :param input_points: 1-dimensional array-like of points.
+        :return: tuple of term indices of shape ``(N, 2)`` and degrees of
+          shape ``(N, 2)``; second term is neighbour to the right of first
+          one (or first one for last term) and has degree 0 when only
+          first term is active.
+        """
+        x = as_input_array(input_points)
+        last = len(self.terms) - 1
+        segment = np.searchsorted(self.knots, x, side='right')
+        first = np.clip((segment - 1) // 2, 0, last)
+        indices = np.stack([first, np.minimum(first + 1, last)], axis=1)
+        degrees = np.zeros(indices.shape)
+
+        plateau = segment % 2 == 1
+        degrees[plateau, 0] = 1.
+        overlap = ~plateau & (segment > 0) & (segment < len(self.knots))
+        start = self.knots[segment[overlap] - 1]
+        right = (x[overlap] - start) / (self.knots[segment[overlap]] - start)
+        degrees[overlap, 0] = 1. - right
+        degrees[overlap, 1] = right
+        outer_left = segment == 0
+        degrees[outer_left, 0] = \
+            self.terms[0].evaluate_batch(x[outer_left])
+        outer_right = segment == len(self.knots)
+        degrees[outer_right, 0] = \
+            self.terms[last].evaluate_batch(x[outer_right])
+        return indices, degrees
+
+    def membership_matrix(self, input_points) -> np.ndarray:
+        """
+        Return degrees of all terms for array of points.
+
+        :param input_points: 1-dimensional array-like of points.
+        :return: array of shape ``(N, len(terms))``.
+        """
+        indices, degrees = self.evaluate_batch(input_points)
+        matrix = np.zeros((len(indices), len(self.terms)))
+        rows = np.arange(len(indices))
+        matrix[rows, indices[:, 0]] = degrees[:, 0]
+        matrix[rows, indices[:, 1]] += degrees[:, 1]
+        return matrix
@@ -0,0 +1,20 @@
+"""
+This package contains lookup tables precomputed from fuzzy systems.
+
+For hot paths memory can be traded for latency: operator tree or inference
+  system is evaluated once over grid of 1, 2 or 3 input dimensions, and
+  afterwards each query is answered by multilinear interpolation in
+  LookupTable. Tables can be saved to ``.npy`` files and memory-mapped on
+  load, so loading time doesn't depend on table size.
+"""
+from typing import TYPE_CHECKING
+
+from fuzzy._lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from fuzzy.lookup._lookup_table import LookupTable, compile_lookup_table
+
+__getattr__, __dir__ = lazy_attributes(__name__, {
+    'LookupTable': 'fuzzy.lookup._lookup_table',
+    'compile_lookup_table': 'fuzzy.lookup._lookup_table',
+})
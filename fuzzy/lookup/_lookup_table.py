@@ -0,0 +1,306 @@
+"""
+Lookup tables precomputed from operator trees and inference systems.
+
+LookupTable stores values of a system on rectilinear grid of 1, 2 or 3
+  input dimensions and answers queries with multilinear interpolation.
+  Grid is refined during compilation until interpolation error checked
+  inside every grid edge, face and cell is within requested bound.
+
+Error of interpolation is only estimated from checked points, as values of
+  arbitrary system between them are unknown. Exceptions are piecewise linear
+  systems whose breakpoints are grid nodes, such as 1-dimensional trees of
+  trapezoid functions without hedges, which are interpolated exactly.
+"""
+from itertools import combinations, product
+from typing import Callable, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from fuzzy.batch import as_input_array
+from fuzzy.functions import FuzzyMembershipFunction
+from fuzzy.operators import FuzzyOperator, breakpoints as tree_breakpoints
+from fuzzy.operators._operators import Operatable
+
+FORMAT_VERSION = 1
+"""Version of flat array layout written by LookupTable.save."""
+
+_CHECKED_FRACTIONS = np.array([0.25, 0.5, 0.75])
+"""Positions inside grid intervals where compilation checks error."""
+_CHECK_CHUNK = 1 << 20
+"""Number of points checked at once during compilation."""
+
+Bounds = Union[Tuple[float, float], Sequence[Tuple[float, float]]]
+
+
+class LookupTable:
+    """
+    Dense table of system values with multilinear interpolation.
+
+    Queries outside of grid are clamped to its boundaries.
+    """
+
+    axes: Tuple[np.ndarray, ...]
+    """Sorted grid nodes for each input dimension."""
+    values: np.ndarray
+    """System values at grid nodes; shape is lengths of axes."""
+    estimated_error: float
+    """
+    Largest interpolation error found at points checked while compiling
+      table; error between checked points may be larger.
+    """
+
+    def __init__(
+            self,
+            axes: Sequence[np.ndarray],
+            values: np.ndarray,
+            estimated_error: float
+    ) -> None:
+        """
+        Construct table from grid and values on it.
+
+        :param axes: strictly increasing grid nodes for each dimension;
+          each axis must have at least 2 nodes.
+        :param values: values at grid nodes of shape
+          ``tuple(len(axis) for axis in axes)``.
+        :param estimated_error: estimated interpolation error of the table.
+        """
+        if not 1 <= len(axes) <= 3:
+            raise ValueError('LookupTable supports 1 to 3 dimensions.')
+        self.axes = tuple(np.asarray(axis, dtype=float) for axis in axes)
+        for axis in self.axes:
+            if axis.ndim != 1 or len(axis) < 2 or np.any(np.diff(axis) <= 0):
+                raise ValueError('Axes must be strictly increasing and '
+                                 'contain at least 2 nodes.')
+        self.values = np.asarray(values)
+        if self.values.shape != tuple(len(axis) for axis in self.axes):
+            raise ValueError('Shape of values does not match axes.')
+        self.estimated_error = float(estimated_error)
+
+    @property
+    def ndim(self) -> int:
+        """Number of input dimensions."""
+        return len(self.axes)
+
+    def __call__(self, *point: float) -> float:
+        """
+        Return interpolated value for single point.
+
+        :param point: one coordinate for each dimension.
+        :return: interpolated value.
+        """
+        return float(self.evaluate_batch(*point))
+
+    def evaluate_batch(self, *coordinates) -> np.ndarray:
+        """
+        Return interpolated values for arrays of points.
+
+        :param coordinates: one array-like for each dimension; arrays are
+          broadcast against each other.
+        :return: array of interpolated values of broadcast shape.
+        """
+        if len(coordinates) != self.ndim:
+            raise ValueError(f'Expected {self.ndim} coordinates, '
+                             f'got {len(coordinates)}.')
+        coordinates = np.broadcast_arrays(
+            *(as_input_array(c) for c in coordinates)
+        )
+        indices = []
+        fractions = []
+        for axis, coordinate in zip(self.axes, coordinates):
+            index = np.searchsorted(axis, coordinate, side='right') - 1
+            index = np.clip(index, 0, len(axis) - 2)
+            start = axis[index]
+            fraction = (coordinate - start) / (axis[index + 1] - start)
+            indices.append(index)
+            fractions.append(np.clip(fraction, 0., 1.))
+
+        result = np.zeros(coordinates[0].shape)
+        for corner in product((0, 1), repeat=self.ndim):
+            weight = np.ones(coordinates[0].shape)
+            for offset, fraction in zip(corner, fractions):
+                weight *= fraction if offset else 1. - fraction
+            result += weight * self.values[tuple(
+                index + offset for index, offset in zip(indices, corner)
+            )]
+        return result
+
+    def save(self, path: str) -> None:
+        """
+        Save table to ``.npy`` file as single flat float64 array.
+
+        Layout is ``[version, ndim, estimated_error, len(axis_0), ...,
+          axis_0, ..., values]`` so that ``load`` can memory-map it.
+
+        :param path: destination file path; used as given, without
+          appending ``.npy`` suffix.
+        """
+        header = [FORMAT_VERSION, self.ndim, self.estimated_error] \
+            + [len(axis) for axis in self.axes]
+        with open(path, 'wb') as file:
+            np.save(file, np.concatenate(
+                [np.asarray(header, dtype=float)]
+                + list(self.axes)
+                + [np.ravel(self.values)]
+            ).astype(np.float64))
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = True) -> "LookupTable":
+        """
+        Load table saved with ``save``.
+
+        :param path: ``.npy`` file path.
+        :param mmap: memory-map values instead of reading them, making load
+          time independent of table size.
+        :return: loaded table.
+        """
+        data = np.load(path, mmap_mode='r' if mmap else None)
+        version = int(data[0])
+        if version != FORMAT_VERSION:
+            raise ValueError(f'Unsupported lookup table version {version}.')
+        ndim = int(data[1])
+        estimated_error = float(data[2])
+        shape = tuple(int(n) for n in data[3:3 + ndim])
+        offset = 3 + ndim
+        axes = []
+        for length in shape:
+            axes.append(np.array(data[offset:offset + length]))
+            offset += length
+        values = data[offset:offset + int(np.prod(shape))].reshape(shape)
+        return cls(axes, values, estimated_error)
+
+
+def compile_lookup_table(
+        system: Union[Operatable, Callable[..., np.ndarray]],
+        bounds: Bounds,
+        max_error: float = 1e-3,
+        breakpoints: Optional[Sequence] = None,
+        initial_points: int = 17,
+        max_points: int = 2 ** 22
+) -> LookupTable:
+    """
+    Precompute system over grid into LookupTable.
+
+    Grid of each axis starts with evenly spaced nodes and breakpoints of
+      that axis. For 1-dimensional operator trees breakpoints are computed
+      from tree (see :func:`fuzzy.operators.breakpoints`), which makes table
+      of trapezoid-based trees exact. Afterwards grid intervals are bisected
+      wherever interpolation error at quarter points of grid edges, faces
+      or cells exceeds max_error. Error between checked points is not
+      bounded, so systems changing faster than grid resolution may exceed
+      max_error; see ``LookupTable.estimated_error``.
+
+    :param system: FuzzyMembershipFunction or FuzzyOperator for single
+      dimension, or callable accepting one numpy array per dimension and
+      returning array of values of the same shape. Systems with several
+      outputs, such as RuleBase, need one table for each output, e.g.
+      compiled from ``rule_base[name]``.
+    :param bounds: ``(lower, upper)`` for single dimension or sequence of
+      such pairs, one for each dimension.
+    :param max_error: allowed interpolation error at checked points.
+    :param breakpoints: optional sequence with one entry for each dimension:
+      None, array-like of points to include in grid, or operator tree whose
+      breakpoints are included.
+    :param initial_points: number of evenly spaced nodes of each axis.
+    :param max_points: limit of total number of grid nodes.
+    :return: compiled LookupTable.
+    :raises ValueError: when max_error can't be reached within max_points.
+    :raises TypeError: when system is not operator tree but has batch
+      evaluation, like RuleBase with one output for each rule.
+    """
+    if np.ndim(bounds[0]) == 0:
+        bounds = [bounds]
+    ndim = len(bounds)
+    if breakpoints is None:
+        breakpoints = [system if _is_tree(system) else None] * ndim
+    evaluate = _evaluator(system, ndim)
+
+    axes = []
+    for (lower, upper), axis_breakpoints in zip(bounds, breakpoints):
+        nodes = [np.linspace(lower, upper, initial_points)]
+        if _is_tree(axis_breakpoints):
+            nodes.append(tree_breakpoints(axis_breakpoints, lower, upper))
+        elif axis_breakpoints is not None:
+            points = np.asarray(axis_breakpoints, dtype=float)
+            nodes.append(points[(lower <= points) & (points <= upper)])
+        axes.append(np.unique(np.concatenate(nodes)))
+
+    while True:
+        table = LookupTable(axes, evaluate(*np.meshgrid(*axes,
+                                                        indexing='ij')), 0.)
+        error, refine = _check_cells(table, evaluate, max_error)
+        if not any(r.any() for r in refine):
+            table.estimated_error = error
+            return table
+        for i, (axis, flags) in enumerate(zip(axes, refine)):
+            midpoints = (axis[:-1] + axis[1:])[flags] / 2
+            axes[i] = np.unique(np.concatenate([axis, midpoints]))
+        if np.prod([len(axis) for axis in axes]) > max_points:
+            raise ValueError(
+                f'Interpolation error {error:.3g} exceeds {max_error:.3g}'
+                f' within {max_points} grid points.'
+            )
+
+
+def _is_tree(system) -> bool:
+    return isinstance(system, (FuzzyMembershipFunction, FuzzyOperator))
+
+
+def _evaluator(system, ndim: int) -> Callable[..., np.ndarray]:
+    if _is_tree(system):
+        if ndim != 1:
+            raise ValueError('Operator trees have single input dimension.')
+        return system.evaluate_batch
+    if hasattr(system, 'evaluate_batch'):
+        raise TypeError(
+            f'Cannot compile {type(system).__name__} into lookup table; '
+            f'compile one table for each output instead.'
+        )
+
+    def evaluate(*coordinates: np.ndarray) -> np.ndarray:
+        return np.broadcast_to(system(*coordinates), coordinates[0].shape)
+    return evaluate
+
+
+def _check_cells(table: LookupTable, evaluate, max_error: float):
+    # Checks points inside every edge, face and cell of grid; intervals of
+    #  each axis with error above max_error in any of them are refined.
+    fractions = _CHECKED_FRACTIONS
+    worst = 0.
+    refine = [np.zeros(len(axis) - 1, dtype=bool) for axis in table.axes]
+    for count in range(1, table.ndim + 1):
+        for checked in combinations(range(table.ndim), count):
+            # Points are checked in slabs along first axis to bound memory.
+            rows = len(table.axes[0]) - (0 in checked)
+            step = max(1, _CHECK_CHUNK // len(fractions) ** count
+                       // (table.values.size // len(table.axes[0])))
+            for start in range(0, rows, step):
+                stop = min(start + step, rows)
+                axes = (table.axes[0][start:stop + (0 in checked)],) \
+                    + table.axes[1:]
+                values = table.values[start:stop + (0 in checked)]
+                samples = [_inner(axis, fractions) if i in checked else axis
+                           for i, axis in enumerate(axes)]
+                for i in checked:
+                    values = _inner(values, fractions, axis=i)
+                grid = np.meshgrid(*samples, indexing='ij')
+                error = np.abs(evaluate(*grid) - values)
+                worst = max(worst, float(error.max()))
+                exceeded = error > max_error
+                for i in checked:
+                    other = tuple(j for j in range(table.ndim) if j != i)
+                    flags = exceeded.any(axis=other) if other else exceeded
+                    flags = flags.reshape(-1, len(fractions)).any(axis=1)
+                    if i == 0:
+                        refine[0][start:stop] |= flags
+                    else:
+                        refine[i] |= flags
+    return worst, refine
+
+
+def _inner(array: np.ndarray, fractions: np.ndarray, axis: int = 0):
+    # Linearly interpolates array at given fractions of every interval
+    #  between consecutive entries along axis.
+    array = np.moveaxis(array, axis, -1)
+    inner = array[..., :-1, None] * (1 - fractions) \
+        + array[..., 1:, None] * fractions
+    return np.moveaxis(inner.reshape(array.shape[:-1] + (-1,)), -1, axis)
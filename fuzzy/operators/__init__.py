@@ -14,7 +14,41 @@ For complex scenarios' membership functions can be joined with operators
   temperature slightly.\" - *AND* and *NOT* are respectively fuzzy t-norm and
   fuzzy strong negation.
 
+The same system can be written with operators on membership functions:
+  ``humidity_high & ~uncomfortably_hot``. Nested operators of the same type
+  are flattened into single n-ary operator.
+
+Linguistic hedges modify degree of single operand: ``Very(hot)`` (also
+  ``hot ** 2``), ``Somewhat(cold)``, ``Intensify`` and ``Diminish``.
+
+Window operators aggregate degrees of last samples of time series, updating
+  incrementally with each sample: ``WindowMin``, ``WindowMax``, ordered
+  weighted average ``WindowOWA`` and fuzzy quantifier ``WindowQuantifier``
+  ("most of last 10 readings are high").
+
 """
+from typing import TYPE_CHECKING
+
+from fuzzy._lazy import lazy_attributes
 from fuzzy.operators._operators import (
-    FuzzyOperator, TNorm, SNorm, StrongNegation
+    FuzzyOperator, TNorm, SNorm, StrongNegation, conjunction, disjunction, \
+    negation
 )
+from fuzzy.operators._hedges import (
+    Hedge, Power, Very, Somewhat, Intensify, Diminish, power
+)
+
+if TYPE_CHECKING:
+    from fuzzy.operators._breakpoints import breakpoints
+    from fuzzy.operators._temporal import (
+        WindowOperator, WindowMin, WindowMax, WindowOWA, WindowQuantifier
+    )
+
+__getattr__, __dir__ = lazy_attributes(__name__, {
+    'breakpoints': 'fuzzy.operators._breakpoints',
+    'WindowOperator': 'fuzzy.operators._temporal',
+    'WindowMin': 'fuzzy.operators._temporal',
+    'WindowMax': 'fuzzy.operators._temporal',
+    'WindowOWA': 'fuzzy.operators._temporal',
+    'WindowQuantifier': 'fuzzy.operators._temporal',
+})
@@ -0,0 +1,75 @@
+"""
+Breakpoints of operator trees.
+
+Trapezoid membership functions are piecewise linear, and t-norm, s-norm and
+  strong negation keep them piecewise linear. Output of such tree can change
+  slope only at vertices of its membership functions and at points where
+  children of t-norm or s-norm cross each other. Evaluating tree at those
+  points and interpolating linearly between them reproduces it exactly.
+"""
+import numpy as np
+
+from fuzzy.functions import TrapezoidFunction, FuzzyMembershipFunction
+from fuzzy.operators._operators import Operatable, FuzzyOperator
+
+
+def breakpoints(
+        operatable: Operatable,
+        lower: float,
+        upper: float
+) -> np.ndarray:
+    """
+    Return sorted points where operator tree output can change slope.
+
+    Result contains finite vertices of all TrapezoidFunctions in tree,
+      crossing points of operator children and both ends of range.
+      Membership functions of unknown shape contribute no points, so for
+      trees containing them result is not exact.
+
+    :param operatable: FuzzyMembershipFunction or FuzzyOperator.
+    :param lower: start of range of interest.
+    :param upper: end of range of interest.
+    :return: sorted array of unique points in range [lower;upper].
+    """
+    assert lower < upper
+    points = _node_breakpoints(operatable, lower, upper)
+    return np.unique(np.concatenate([[lower, upper], points]))
+
+
+def _node_breakpoints(
+        operatable: Operatable,
+        lower: float,
+        upper: float
+) -> np.ndarray:
+    if isinstance(operatable, TrapezoidFunction):
+        vertices = np.array([
+            operatable.lower_boundary, operatable.min_full_boundary,
+            operatable.max_full_boundary, operatable.upper_boundary
+        ])
+        return vertices[(lower <= vertices) & (vertices <= upper)]
+    if isinstance(operatable, FuzzyMembershipFunction):
+        return np.empty(0)
+
+    children = operatable.functions
+    knots = np.unique(np.concatenate(
+        [[lower, upper]]
+        + [_node_breakpoints(child, lower, upper) for child in children]
+    ))
+    if len(children) < 2 or not isinstance(operatable, FuzzyOperator):
+        return knots
+    # Between consecutive knots all children are linear, so two children
+    #  cross inside an interval only if their difference changes sign.
+    values = [child.evaluate_batch(knots) for child in children]
+    crossings = [knots]
+    for i, first in enumerate(values):
+        for second in values[i + 1:]:
+            difference = first - second
+            left, right = difference[:-1], difference[1:]
+            crossing = (left * right) < 0
+            if not crossing.any():
+                continue
+            start = knots[:-1][crossing]
+            width = np.diff(knots)[crossing]
+            fraction = left[crossing] / (left[crossing] - right[crossing])
+            crossings.append(start + width * fraction)
+    return np.concatenate(crossings)
@@ -0,0 +1,60 @@
+"""
+Vectorized kernels of contrast hedges.
+"""
+from typing import Optional
+
+import numpy as np
+
+
+def intensify_batch(
+        degrees: np.ndarray,
+        out: Optional[np.ndarray] = None,
+        scratch: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Vectorized kernel of Intensify hedge.
+
+    :param degrees: membership degrees in range [0;1].
+    :param out: optional buffer for results; may be degrees itself.
+    :param scratch: optional scratch array of the same shape as degrees.
+    :return: intensified degrees; out when given.
+    """
+    return _symmetric_kernel(degrees, out, scratch, intensify=True)
+
+
+def diminish_batch(
+        degrees: np.ndarray,
+        out: Optional[np.ndarray] = None,
+        scratch: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Vectorized kernel of Diminish hedge.
+
+    :param degrees: membership degrees in range [0;1].
+    :param out: optional buffer for results; may be degrees itself.
+    :param scratch: optional scratch array of the same shape as degrees.
+    :return: diminished degrees; out when given.
+    """
+    return _symmetric_kernel(degrees, out, scratch, intensify=False)
+
+
+def _symmetric_kernel(degrees, out, scratch, intensify: bool) -> np.ndarray:
+    # Both hedges are symmetric around 0.5: with distance ``m`` of degree
+    #  from nearer end of [0;1], result is ``g(m)`` below 0.5 and
+    #  ``1 - g(m)`` above. It is computed in place as
+    #  ``0.5 + copysign(0.5 - g(m), degree - 0.5)``.
+    out = np.subtract(degrees, 0.5, out=out)
+    if scratch is None:
+        scratch = np.empty_like(out)
+    np.abs(out, out=scratch)
+    np.subtract(0.5, scratch, out=scratch)
+    if intensify:
+        np.square(scratch, out=scratch)
+        np.multiply(scratch, 2, out=scratch)
+    else:
+        np.maximum(scratch, 0., out=scratch)
+        np.divide(scratch, 2, out=scratch)
+        np.sqrt(scratch, out=scratch)
+    np.subtract(0.5, scratch, out=scratch)
+    np.copysign(scratch, out, out=out)
+    return np.add(out, 0.5, out=out)
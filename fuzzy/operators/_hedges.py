@@ -0,0 +1,256 @@
+"""
+Linguistic hedges modifying membership degree of single operand.
+
+Hedges are increasing functions of degree:
+  *. Power - ``μ ** p``; "very" is ``p = 2``, "somewhat" is ``p = 0.5``.
+  *. Intensify - contrast intensification, pushes degrees away from 0.5.
+  *. Diminish - contrast dilution, pulls degrees towards 0.5.
+
+Hedges only transform degree of their operand, so RuleBase fuses them into
+  instruction computing the operand instead of keeping them as separate
+  nodes, and ``f ** p`` merges nested powers into one. Vectorized kernels
+  live in ``fuzzy.operators._hedge_kernels``.
+"""
+from __future__ import annotations
+
+from abc import abstractmethod
+from math import sqrt
+from typing import TYPE_CHECKING, Optional, Tuple
+
+from fuzzy.functions import ConstantFunction
+from fuzzy.operators._operators import (
+    FuzzyOperator, Operatable, _as_operatable
+)
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from fuzzy.batch import Workspace
+
+
+class Hedge(FuzzyOperator):
+    """
+    Base class for hedges - increasing functions of operand's degree.
+
+    Subclasses implement scalar ``apply`` and vectorized ``apply_batch``.
+    """
+
+    def __init__(self, function: Operatable) -> None:
+        """
+        Create hedge for given Operatable object.
+
+        :param function: can be either FuzzyMembershipFunction or
+          FuzzyOperator
+        """
+        super().__init__(function)
+
+    @abstractmethod
+    def apply(self, degree: float) -> float:
+        """
+        Modify single membership degree.
+
+        :param degree: membership degree in range [0;1].
+        :return: modified membership degree.
+        """
+
+    @abstractmethod
+    def apply_batch(
+            self,
+            degrees: np.ndarray,
+            out: Optional[np.ndarray] = None,
+            workspace: Optional[Workspace] = None
+    ) -> np.ndarray:
+        """
+        Modify array of membership degrees.
+
+        :param degrees: membership degrees in range [0;1].
+        :param out: optional buffer for results; may be degrees itself.
+        :param workspace: optional Workspace providing scratch arrays.
+        :return: modified membership degrees; out when given.
+        """
+
+    @abstractmethod
+    def derivative_batch(self, degrees: np.ndarray) -> np.ndarray:
+        """
+        Return derivative of hedge at each membership degree.
+
+        :param degrees: membership degrees in range [0;1].
+        :return: derivatives.
+        """
+
+    def __call__(self, value: float) -> float:
+        return self.apply(self.functions[0](value))
+
+    def evaluate_batch(
+            self,
+            values,
+            out: Optional[np.ndarray] = None,
+            dtype=None,
+            workspace: Optional[Workspace] = None
+    ) -> np.ndarray:
+        from fuzzy.batch import prepare_batch
+
+        values, out = prepare_batch(values, out, dtype)
+        self.functions[0].evaluate_batch(values, out=out, workspace=workspace)
+        return self.apply_batch(out, out=out, workspace=workspace)
+
+    def interval(self, value: float) -> Tuple[float, float]:
+        lower, upper = self.functions[0].interval(value)
+        return self.apply(lower), self.apply(upper)
+
+    def interval_batch(self, values) -> Tuple[np.ndarray, np.ndarray]:
+        lower, upper = self.functions[0].interval_batch(values)
+        return self.apply_batch(lower), self.apply_batch(upper)
+
+
+class Power(Hedge):
+    """
+    Raises membership degree to given power.
+
+    Exponents above 1 concentrate ("very"), below 1 dilate
+      ("somewhat", "more or less") fuzzy set.
+    """
+
+    exponent: float
+    """Positive exponent applied to membership degree."""
+
+    def __init__(self, function: Operatable, exponent: float) -> None:
+        """
+        Create power hedge.
+
+        :param function: can be either FuzzyMembershipFunction or
+          FuzzyOperator
+        :param exponent: positive exponent.
+        """
+        if not exponent > 0:
+            raise ValueError('Exponent of Power hedge must be positive.')
+        super().__init__(function)
+        self.exponent = float(exponent)
+
+    def apply(self, degree: float) -> float:
+        return degree ** self.exponent
+
+    def apply_batch(
+            self,
+            degrees: np.ndarray,
+            out: Optional[np.ndarray] = None,
+            workspace: Optional[Workspace] = None
+    ) -> np.ndarray:
+        import numpy as np
+
+        return np.power(degrees, self.exponent, out=out)
+
+    def derivative_batch(self, degrees: np.ndarray) -> np.ndarray:
+        import numpy as np
+
+        with np.errstate(divide='ignore'):
+            return np.where(
+                degrees > 0,
+                self.exponent * np.power(degrees, self.exponent - 1), 0.
+            )
+
+
+class Very(Power):
+    """Concentration hedge ``μ ** 2``."""
+
+    def __init__(self, function: Operatable) -> None:
+        super().__init__(function, 2.)
+
+
+class Somewhat(Power):
+    """Dilation hedge ``μ ** 0.5``."""
+
+    def __init__(self, function: Operatable) -> None:
+        super().__init__(function, 0.5)
+
+
+class Intensify(Hedge):
+    """
+    Contrast intensification.
+
+    ``2μ²`` for degrees up to 0.5, ``1 - 2(1 - μ)²`` above.
+    """
+
+    def apply(self, degree: float) -> float:
+        if degree <= 0.5:
+            return 2 * degree * degree
+        return 1 - 2 * (1 - degree) * (1 - degree)
+
+    def apply_batch(
+            self,
+            degrees: np.ndarray,
+            out: Optional[np.ndarray] = None,
+            workspace: Optional[Workspace] = None
+    ) -> np.ndarray:
+        from fuzzy.batch import Workspace
+        from fuzzy.operators._hedge_kernels import intensify_batch
+
+        with (workspace or Workspace()).scratch(degrees.shape,
+                                                degrees.dtype) as scratch:
+            return intensify_batch(degrees, out, scratch)
+
+    def derivative_batch(self, degrees: np.ndarray) -> np.ndarray:
+        import numpy as np
+
+        return np.where(degrees <= 0.5, 4 * degrees, 4 * (1 - degrees))
+
+
+class Diminish(Hedge):
+    """
+    Contrast dilution, inverse of Intensify.
+
+    ``sqrt(μ / 2)`` for degrees up to 0.5, ``1 - sqrt((1 - μ) / 2)`` above.
+    """
+
+    def apply(self, degree: float) -> float:
+        if degree <= 0.5:
+            return sqrt(degree / 2)
+        return 1 - sqrt((1 - degree) / 2)
+
+    def apply_batch(
+            self,
+            degrees: np.ndarray,
+            out: Optional[np.ndarray] = None,
+            workspace: Optional[Workspace] = None
+    ) -> np.ndarray:
+        from fuzzy.batch import Workspace
+        from fuzzy.operators._hedge_kernels import diminish_batch
+
+        with (workspace or Workspace()).scratch(degrees.shape,
+                                                degrees.dtype) as scratch:
+            return diminish_batch(degrees, out, scratch)
+
+    def derivative_batch(self, degrees: np.ndarray) -> np.ndarray:
+        import numpy as np
+
+        with np.errstate(divide='ignore'):
+            return np.where(
+                degrees <= 0.5,
+                np.where(degrees > 0, 1 / np.sqrt(8 * degrees), 0.),
+                1 / np.sqrt(np.maximum(8 * (1 - degrees), 1e-300))
+            )
+
+
+def power(operand, exponent: float) -> Operatable:
+    """
+    Build power hedge of operand, merging nested powers.
+
+    :param operand: FuzzyMembershipFunction, FuzzyOperator or membership
+      degree in range [0;1].
+    :param exponent: positive exponent.
+    :return: operand's power; operand itself for exponent equal to 1.
+    :raises ValueError: when exponent is not positive or degree is out of
+      range [0;1].
+    """
+    # Checked before constants are folded, which would accept any exponent.
+    if not exponent > 0:
+        raise ValueError('Exponent of Power hedge must be positive.')
+    operand = _as_operatable(operand)
+    if isinstance(operand, ConstantFunction):
+        return ConstantFunction(operand.value ** exponent)
+    if isinstance(operand, Power):
+        return power(operand.functions[0], operand.exponent * exponent)
+    if exponent == 1:
+        return operand
+    return Power(operand, exponent)
+
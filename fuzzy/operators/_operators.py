@@ -1,12 +1,35 @@
 """
 Operators on fuzzy membership functions.
+
+Besides explicit construction, operator trees can be built with ``&``,
+  ``|`` and ``~``. Those go through :func:`conjunction`,
+  :func:`disjunction` and :func:`negation`, which keep the resulting tree
+  as shallow as possible:
+    *. nested operators of the same type are flattened into one n-ary node,
+    *. double negation is removed,
+    *. constant children are folded (``f & 1`` is ``f``, ``f & 0`` is 0.).
+  ``f ** p`` builds Power hedge (see ``fuzzy.operators._hedges``), merging
+  nested powers.
+
+``evaluate_batch`` of operators evaluates first child directly into output
+  buffer and remaining children into scratch arrays from Workspace, combining
+  them in place; see :mod:`fuzzy.batch`. NumPy is imported only by batch
+  evaluation.
 """
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
-from typing import Union, List
+from typing import TYPE_CHECKING, Optional, Union, List, Tuple
 
-from fuzzy.functions import FuzzyMembershipFunction
+from fuzzy.functions import FuzzyMembershipFunction, ConstantFunction
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from fuzzy.batch import Workspace
 
 Operatable = Union[FuzzyMembershipFunction, "FuzzyOperator"]
+Operand = Union[Operatable, float]
 
 
 class FuzzyOperator(ABC):
@@ -19,6 +42,11 @@ class FuzzyOperator(ABC):
     """
     Contains FuzzyMembershipFunctions and FuzzyOperators to apply operation on.
     """
+    keeps_state: bool = False
+    """
+    Whether operator keeps state between calls, like window operators; such
+      operator must be called exactly once for every value passed to tree.
+    """
 
     def __init__(
             self,
@@ -32,6 +60,12 @@ class FuzzyOperator(ABC):
           functions iterator should contain only one object
         """
         self.functions = list(functions)
+        # Whether subtree contains stateful operator; derived from children
+        #  only, so construction doesn't walk whole subtree.
+        self._stateful = self.keeps_state or any(
+            getattr(ff, '_stateful', False) for ff in self.functions
+        )
+        self._state_checked = not self._stateful
 
     @abstractmethod
     def __call__(
@@ -45,6 +79,121 @@ class FuzzyOperator(ABC):
         :return: result of pipeline
         """
 
+    def _check_state(self) -> None:
+        """
+        Check that no stateful subtree is reachable by more than one path.
+
+        Stateful operator reached twice would see every value twice. Only
+          operators with several children can join paths, so they run this
+          check once, on first call; it visits every stateful subtree once.
+
+        :raises ValueError: when stateful subtree is shared within tree.
+        """
+        visited = {}
+        stack = [self]
+        while stack:
+            for ff in stack.pop().functions:
+                if getattr(ff, '_stateful', False):
+                    if id(ff) in visited:
+                        raise ValueError('Stateful operator cannot appear in '
+                                         'tree more than once.')
+                    visited[id(ff)] = ff
+                    stack.append(ff)
+        # Subtrees of checked tree are checked as well.
+        for ff in visited.values():
+            ff._state_checked = True
+        self._state_checked = True
+
+    def evaluate_batch(
+            self,
+            values,
+            out: Optional[np.ndarray] = None,
+            dtype=None,
+            workspace: Optional[Workspace] = None
+    ) -> np.ndarray:
+        """
+        Pass array of values through pipeline.
+
+        Default implementation calls operator for each value; subclasses
+          override it with vectorized kernels.
+
+        :param values: array-like of values to pass through
+          FuzzyMembershipFunctions.
+        :param out: optional buffer of same shape as values to write
+          results to.
+        :param dtype: floating point dtype of results; defaults to dtype
+          of out, or float64.
+        :param workspace: optional Workspace providing scratch arrays.
+        :return: array of results of same shape as values; out when given.
+        """
+        import numpy as np
+        from fuzzy.batch import prepare_batch
+
+        values, out = prepare_batch(values, out, dtype)
+        out[...] = np.fromiter(
+            (self(value) for value in values.flat),
+            dtype=float, count=values.size
+        ).reshape(values.shape)
+        return out
+
+    def interval(self, value: float) -> Tuple[float, float]:
+        """
+        Apply operator on intervals of membership degrees.
+
+        Used for trees containing interval type-2 membership functions.
+
+        :param value: value to pass through FuzzyMembershipFunctions
+        :return: lower and upper bound of result
+        """
+        raise NotImplementedError(
+            f'{type(self).__name__} does not support interval degrees.'
+        )
+
+    def interval_batch(self, values) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Apply operator on intervals of membership degrees for array of values.
+
+        :param values: array-like of values to pass through
+          FuzzyMembershipFunctions.
+        :return: arrays of lower and upper bounds of results
+        """
+        raise NotImplementedError(
+            f'{type(self).__name__} does not support interval degrees.'
+        )
+
+    # Operands of other types return NotImplemented, so that they can
+    #  handle operator themselves.
+
+    def __and__(self, other: Operand) -> Operatable:
+        if not _is_operand(other):
+            return NotImplemented
+        return conjunction(self, other)
+
+    def __rand__(self, other: Operand) -> Operatable:
+        if not _is_operand(other):
+            return NotImplemented
+        return conjunction(other, self)
+
+    def __or__(self, other: Operand) -> Operatable:
+        if not _is_operand(other):
+            return NotImplemented
+        return disjunction(self, other)
+
+    def __ror__(self, other: Operand) -> Operatable:
+        if not _is_operand(other):
+            return NotImplemented
+        return disjunction(other, self)
+
+    def __invert__(self) -> Operatable:
+        return negation(self)
+
+    def __pow__(self, exponent: float) -> Operatable:
+        from fuzzy.operators._hedges import power
+        if not isinstance(exponent, (int, float)):
+            return NotImplemented
+        return power(self, exponent)
+
+
 class TNorm(FuzzyOperator):
     """
     Intersection of fuzzy sets.
@@ -53,14 +202,45 @@ class TNorm(FuzzyOperator):
     """
 
     def __call__(self, value: float) -> float:
+        if not self._state_checked:
+            self._check_state()
         results = []
         for ff in self.functions:
             res = ff(value)
-            if res == 0:
+            # Stateful children have to see every value.
+            if res == 0 and not self._stateful:
                 return 0.
             results.append(res)
         return min(results)
 
+    def evaluate_batch(
+            self,
+            values,
+            out: Optional[np.ndarray] = None,
+            dtype=None,
+            workspace: Optional[Workspace] = None
+    ) -> np.ndarray:
+        import numpy as np
+
+        return _reduce_batch(self.functions, np.minimum, values, out, dtype,
+                             workspace)
+
+    def interval(self, value: float) -> Tuple[float, float]:
+        if not self._state_checked:
+            self._check_state()
+        lowers, uppers = zip(*(ff.interval(value) for ff in self.functions))
+        return min(lowers), min(uppers)
+
+    def interval_batch(self, values) -> Tuple[np.ndarray, np.ndarray]:
+        import numpy as np
+
+        lower, upper = self.functions[0].interval_batch(values)
+        for ff in self.functions[1:]:
+            ff_lower, ff_upper = ff.interval_batch(values)
+            lower = np.minimum(lower, ff_lower)
+            upper = np.minimum(upper, ff_upper)
+        return lower, upper
+
 
 class SNorm(FuzzyOperator):
     """
@@ -76,14 +256,44 @@ class SNorm(FuzzyOperator):
         :param value: value to calculate negation on given function
         :return: negated degree of membership
         """
+        if not self._state_checked:
+            self._check_state()
         results = []
         for ff in self.functions:
             res = ff(value)
-            if res == 1:
+            if res == 1 and not self._stateful:
                 return 1.
             results.append(res)
         return max(results)
 
+    def evaluate_batch(
+            self,
+            values,
+            out: Optional[np.ndarray] = None,
+            dtype=None,
+            workspace: Optional[Workspace] = None
+    ) -> np.ndarray:
+        import numpy as np
+
+        return _reduce_batch(self.functions, np.maximum, values, out, dtype,
+                             workspace)
+
+    def interval(self, value: float) -> Tuple[float, float]:
+        if not self._state_checked:
+            self._check_state()
+        lowers, uppers = zip(*(ff.interval(value) for ff in self.functions))
+        return max(lowers), max(uppers)
+
+    def interval_batch(self, values) -> Tuple[np.ndarray, np.ndarray]:
+        import numpy as np
+
+        lower, upper = self.functions[0].interval_batch(values)
+        for ff in self.functions[1:]:
+            ff_lower, ff_upper = ff.interval_batch(values)
+            lower = np.maximum(lower, ff_lower)
+            upper = np.maximum(upper, ff_upper)
+        return lower, upper
+
 
 class StrongNegation(FuzzyOperator):
     """
@@ -111,3 +321,144 @@ class StrongNegation(FuzzyOperator):
         :return: negated degree of membership
         """
         return 1 - self.functions[0](value)
+
+    def evaluate_batch(
+            self,
+            values,
+            out: Optional[np.ndarray] = None,
+            dtype=None,
+            workspace: Optional[Workspace] = None
+    ) -> np.ndarray:
+        import numpy as np
+        from fuzzy.batch import prepare_batch
+
+        values, out = prepare_batch(values, out, dtype)
+        self.functions[0].evaluate_batch(values, out=out, workspace=workspace)
+        return np.subtract(1, out, out=out)
+
+    def interval(self, value: float) -> Tuple[float, float]:
+        lower, upper = self.functions[0].interval(value)
+        return 1 - upper, 1 - lower
+
+    def interval_batch(self, values) -> Tuple[np.ndarray, np.ndarray]:
+        lower, upper = self.functions[0].interval_batch(values)
+        return 1 - upper, 1 - lower
+
+
+def _reduce_batch(
+        functions: List[Operatable],
+        reduce: np.ufunc,
+        values,
+        out: Optional[np.ndarray],
+        dtype,
+        workspace: Optional[Workspace]
+) -> np.ndarray:
+    # Combines results of functions in place, reusing one scratch array.
+    from fuzzy.batch import Workspace, prepare_batch
+
+    values, out = prepare_batch(values, out, dtype)
+    workspace = workspace or Workspace()
+    functions[0].evaluate_batch(values, out=out, workspace=workspace)
+    if len(functions) > 1:
+        with workspace.scratch(out.shape, out.dtype) as results:
+            for ff in functions[1:]:
+                ff.evaluate_batch(values, out=results, workspace=workspace)
+                reduce(out, results, out=out)
+    return out
+
+
+def conjunction(*operands: Operand) -> Operatable:
+    """
+    Build flattened t-norm of given operands.
+
+    Nested TNorm operands are merged into single n-ary TNorm. Constant
+      operands are folded: 1. is dropped, 0. makes whole expression 0.,
+      any other constants are reduced to their minimum.
+
+    :param operands: FuzzyMembershipFunction, FuzzyOperator objects or
+      membership degrees in range [0;1].
+    :return: shallowest operator tree equivalent to t-norm of operands.
+    :raises ValueError: when degree is out of range [0;1].
+    """
+    return _fold(TNorm, operands, identity=1., absorbing=0., reduce=min)
+
+
+def disjunction(*operands: Operand) -> Operatable:
+    """
+    Build flattened s-norm of given operands.
+
+    Nested SNorm operands are merged into single n-ary SNorm. Constant
+      operands are folded: 0. is dropped, 1. makes whole expression 1.,
+      any other constants are reduced to their maximum.
+
+    :param operands: FuzzyMembershipFunction, FuzzyOperator objects or
+      membership degrees in range [0;1].
+    :return: shallowest operator tree equivalent to s-norm of operands.
+    :raises ValueError: when degree is out of range [0;1].
+    """
+    return _fold(SNorm, operands, identity=0., absorbing=1., reduce=max)
+
+
+def negation(operand: Operand) -> Operatable:
+    """
+    Build strong negation of given operand.
+
+    Double negation is removed and constants are negated in place.
+
+    :param operand: FuzzyMembershipFunction, FuzzyOperator or membership
+      degree in range [0;1].
+    :return: operand's negation.
+    :raises ValueError: when degree is out of range [0;1].
+    """
+    operand = _as_operatable(operand)
+    if isinstance(operand, ConstantFunction):
+        return ConstantFunction(1. - operand.value)
+    if type(operand) is StrongNegation:
+        return operand.functions[0]
+    return StrongNegation(operand)
+
+
+def _is_operand(operand) -> bool:
+    return isinstance(operand, (FuzzyMembershipFunction, FuzzyOperator,
+                                int, float))
+
+
+def _as_operatable(operand: Operand) -> Operatable:
+    if isinstance(operand, (FuzzyMembershipFunction, FuzzyOperator)):
+        return operand
+    if isinstance(operand, (int, float)):
+        if not 0. <= operand <= 1.:
+            raise ValueError(
+                f'Membership degree {operand} is out of range [0;1].'
+            )
+        return ConstantFunction(operand)
+    raise TypeError(
+        f'Cannot combine fuzzy operator with {type(operand).__name__}.'
+    )
+
+
+def _fold(operator_type, operands, identity, absorbing, reduce) -> Operatable:
+    functions = []
+    constant = None
+    # Stack keeps operand order of flattened nodes.
+    stack = [_as_operatable(operand) for operand in reversed(operands)]
+    while stack:
+        operand = stack.pop()
+        # Subclasses may change semantics, so only exact type is flattened.
+        if type(operand) is operator_type:
+            stack.extend(reversed(operand.functions))
+        elif isinstance(operand, ConstantFunction):
+            if operand.value == absorbing:
+                return ConstantFunction(absorbing)
+            if operand.value != identity:
+                constant = operand.value if constant is None \
+                    else reduce(constant, operand.value)
+        else:
+            functions.append(operand)
+    if constant is not None:
+        functions.append(ConstantFunction(constant))
+    if not functions:
+        return ConstantFunction(identity)
+    if len(functions) == 1:
+        return functions[0]
+    return operator_type(*functions)
@@ -0,0 +1,486 @@
+"""
+Sliding-window aggregation of membership degrees of time series.
+
+Window operators have single child and treat consecutive values passed to
+  them as samples of time series: calling operator evaluates child on new
+  sample, pushes its degree into window of last ``size`` degrees and returns
+  aggregate of that window. "Most of last 10 readings are high" is
+  ``WindowQuantifier(high, 10, most)`` with ``most`` being membership
+  function on proportions, e.g. ``InfiniteTrapezoidFunction(0.3, 0.8,
+  'right')``. Until window fills up, aggregate covers degrees seen so far.
+
+Window operators compose with other operators; TNorm and SNorm containing
+  them evaluate every child instead of stopping at absorbing degree, so each
+  window sees every sample. Streaming evaluation rejects trees reaching one
+  window operator instance more than once, as it would be pushed several
+  samples per value; batched evaluation keeps no state and allows it.
+
+Each sample updates window incrementally instead of sorting it again:
+  *. WindowMin and WindowMax keep monotonic deque of candidates, O(1)
+     amortized per sample,
+  *. WindowOWA keeps window sorted, O(size) per sample,
+  *. WindowQuantifier keeps running sum, O(1) per sample.
+
+``evaluate_batch`` treats last axis of values as independent series and
+  aggregates all windows at once, without touching streaming state; ``reset``
+  clears streaming state. NumPy is imported only by batch evaluation.
+
+Aggregates are non-decreasing in every degree of window, so intervals of
+  degrees of interval type-2 operands are aggregated bound-wise: lower
+  bounds in one window, upper bounds in another. WindowQuantifier applies
+  its quantifier on interval of proportions instead, taking minimum and
+  maximum of quantifier over it.
+"""
+from __future__ import annotations
+
+from abc import abstractmethod
+from bisect import bisect_left, insort
+from collections import deque
+from copy import copy
+from math import fsum
+from operator import mul
+from typing import TYPE_CHECKING, Deque, List, Optional, Sequence, Tuple
+
+from fuzzy.functions import FuzzyMembershipFunction, TrapezoidFunction
+from fuzzy.operators._operators import FuzzyOperator, Operatable
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from fuzzy.batch import Workspace
+
+_OWA_CHUNK = 1 << 20
+"""Number of window items sorted at once by batched WindowOWA."""
+
+
+class WindowOperator(FuzzyOperator):
+    """
+    Base class for aggregations over sliding window of operand's degrees.
+
+    Subclasses implement incremental ``_push`` and vectorized
+      ``aggregate_batch``.
+    """
+
+    keeps_state = True
+
+    size: int
+    """Number of most recent degrees aggregated."""
+
+    def __init__(self, function: Operatable, size: int) -> None:
+        """
+        Create window operator with empty window.
+
+        :param function: can be either FuzzyMembershipFunction or
+          FuzzyOperator
+        :param size: number of most recent degrees aggregated, at least 1.
+        :raises ValueError: when size is smaller than 1.
+        """
+        if size < 1:
+            raise ValueError('Window size must be at least 1.')
+        super().__init__(function)
+        self.size = int(size)
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget all pushed degrees and bounds of intervals."""
+        self._window: Deque[float] = deque(maxlen=self.size)
+        self._tick = 0
+        # Windows of lower and upper bounds, created by first interval call.
+        self._bound_windows: Optional[Tuple[WindowOperator,
+                                            WindowOperator]] = None
+
+    def push(self, degree: float) -> float:
+        """
+        Add degree to window and aggregate window.
+
+        :param degree: membership degree in range [0;1].
+        :return: aggregated degree of window.
+        """
+        expired = self._window[0] if len(self._window) == self.size else None
+        self._window.append(degree)
+        result = self._push(degree, expired)
+        self._tick += 1
+        return result
+
+    @abstractmethod
+    def _push(self, degree: float, expired: Optional[float]) -> float:
+        """
+        Update state by pushed degree and degree leaving window.
+
+        :param degree: pushed degree, already in window.
+        :param expired: degree which left window, None while window fills.
+        :return: aggregated degree of window.
+        """
+
+    @abstractmethod
+    def aggregate_batch(self, degrees: np.ndarray, out: np.ndarray) -> None:
+        """
+        Aggregate every window of series of degrees.
+
+        :param degrees: membership degrees; last axis is time.
+        :param out: buffer of same shape for aggregate of window ending at
+          each sample; must not overlap degrees.
+        """
+
+    def __call__(self, value: float) -> float:
+        return self.push(self.functions[0](value))
+
+    def evaluate_batch(
+            self,
+            values,
+            out: Optional[np.ndarray] = None,
+            dtype=None,
+            workspace: Optional[Workspace] = None
+    ) -> np.ndarray:
+        """
+        Aggregate windows of series of values, starting with empty window.
+
+        :param values: array-like of values; last axis is time.
+        :param out: optional buffer of same shape as values to write
+          results to.
+        :param dtype: floating point dtype of results; defaults to dtype
+          of out, or float64.
+        :param workspace: optional Workspace providing scratch arrays.
+        :return: array of aggregates of windows ending at each value; out
+          when given.
+        """
+        from fuzzy.batch import Workspace, prepare_batch
+
+        values, out = prepare_batch(values, out, dtype)
+        shape = out.shape or (1,)
+        with (workspace or Workspace()).scratch(out.shape,
+                                                out.dtype) as degrees:
+            self.functions[0].evaluate_batch(values, out=degrees,
+                                             workspace=workspace)
+            self.aggregate_batch(degrees.reshape(shape), out.reshape(shape))
+        return out
+
+    def interval(self, value: float) -> Tuple[float, float]:
+        """
+        Push interval of operand's degree and aggregate windows of bounds.
+
+        Bounds are kept in windows separate from those of plain calls.
+
+        :param value: value to pass through FuzzyMembershipFunctions
+        :return: lower and upper bound of aggregate
+        """
+        lower, upper = self.functions[0].interval(value)
+        if self._bound_windows is None:
+            self._bound_windows = (copy(self), copy(self))
+            for window in self._bound_windows:
+                window.reset()
+        lower_window, upper_window = self._bound_windows
+        return lower_window.push(lower), upper_window.push(upper)
+
+    def interval_batch(self, values) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Aggregate windows of bounds of series of values, starting with empty
+          windows.
+
+        :param values: array-like of values; last axis is time.
+        :return: arrays of lower and upper bounds of aggregates
+        """
+        import numpy as np
+
+        bounds = self.functions[0].interval_batch(values)
+        shape = np.shape(bounds[0]) or (1,)
+        results = []
+        for degrees in bounds:
+            degrees = np.asarray(degrees, dtype=float)
+            out = np.empty_like(degrees)
+            self.aggregate_batch(degrees.reshape(shape), out.reshape(shape))
+            results.append(out)
+        return results[0], results[1]
+
+
+class _MonotonicWindow(WindowOperator):
+    # Deque holds (tick, degree) of samples which can still become
+    #  aggregate: each is strictly better than all samples pushed after it.
+
+    def reset(self) -> None:
+        super().reset()
+        self._candidates: Deque[Tuple[int, float]] = deque()
+
+    @staticmethod
+    @abstractmethod
+    def _better(first: float, second: float) -> bool:
+        """Whether first degree is strictly better aggregate than second."""
+
+    def _push(self, degree: float, expired: Optional[float]) -> float:
+        candidates = self._candidates
+        while candidates and not self._better(candidates[-1][1], degree):
+            candidates.pop()
+        candidates.append((self._tick, degree))
+        if candidates[0][0] <= self._tick - self.size:
+            candidates.popleft()
+        return candidates[0][1]
+
+    def _aggregate_batch(self, degrees, out, ufunc, identity) -> None:
+        # Van Herk/Gil-Werman: series padded in front by size - 1 identities
+        #  is cut into blocks of window size; window starting at i is
+        #  combination of suffix of its block from i and prefix of next one.
+        import numpy as np
+
+        length = degrees.shape[-1]
+        size = self.size
+        total = -(-(length + size - 1) // size) * size
+        padded = np.full(degrees.shape[:-1] + (total,), identity,
+                         dtype=degrees.dtype)
+        padded[..., size - 1:size - 1 + length] = degrees
+        blocks = padded.reshape(degrees.shape[:-1] + (-1, size))
+        prefix = ufunc.accumulate(blocks, axis=-1).reshape(padded.shape)
+        suffix = ufunc.accumulate(blocks[..., ::-1], axis=-1)[..., ::-1]
+        suffix = suffix.reshape(padded.shape)
+        ufunc(suffix[..., :length], prefix[..., size - 1:size - 1 + length],
+              out=out)
+
+
+class WindowMin(_MonotonicWindow):
+    """
+    Minimum of last degrees.
+
+    Could be read as "all of last readings".
+    """
+
+    @staticmethod
+    def _better(first: float, second: float) -> bool:
+        return first < second
+
+    def aggregate_batch(self, degrees: np.ndarray, out: np.ndarray) -> None:
+        import numpy as np
+
+        self._aggregate_batch(degrees, out, np.minimum, np.inf)
+
+
+class WindowMax(_MonotonicWindow):
+    """
+    Maximum of last degrees.
+
+    Could be read as "any of last readings".
+    """
+
+    @staticmethod
+    def _better(first: float, second: float) -> bool:
+        return first > second
+
+    def aggregate_batch(self, degrees: np.ndarray, out: np.ndarray) -> None:
+        import numpy as np
+
+        self._aggregate_batch(degrees, out, np.maximum, -np.inf)
+
+
+class WindowOWA(WindowOperator):
+    """
+    Ordered weighted average of last degrees.
+
+    ``weights[0]`` multiplies the largest degree in window, ``weights[-1]``
+      the smallest one, so ``[1, 0, ..., 0]`` is maximum, ``[0, ..., 0, 1]``
+      minimum and uniform weights are mean. While window fills up with
+      ``n`` degrees, weights of ``n`` degrees are increments of piecewise
+      linear cumulative sum of weights at ``i / n`` for ``i = 0, ..., n``.
+    """
+
+    weights: List[float]
+    """Non-negative weights summing to 1, one for each window position."""
+
+    def __init__(self, function: Operatable, weights: Sequence[float]) -> None:
+        """
+        Create OWA operator over window of ``len(weights)`` degrees.
+
+        :param function: can be either FuzzyMembershipFunction or
+          FuzzyOperator
+        :param weights: non-negative weights summing to 1, for degrees
+          sorted in descending order.
+        :raises ValueError: when weights are empty, negative or don't sum
+          to 1.
+        """
+        weights = [float(weight) for weight in weights]
+        if not weights or min(weights) < 0 or abs(fsum(weights) - 1) > 1e-9:
+            raise ValueError('OWA weights must be non-negative and sum to 1.')
+        self.weights = weights
+        self._cumulative = [0.]
+        for weight in weights:
+            self._cumulative.append(self._cumulative[-1] + weight)
+        self._ascending = weights[::-1]
+        super().__init__(function, len(weights))
+
+    @classmethod
+    def from_quantifier(
+            cls,
+            function: Operatable,
+            size: int,
+            quantifier: FuzzyMembershipFunction
+    ) -> "WindowOWA":
+        """
+        Create OWA operator modelling quantifier, as proposed by Yager.
+
+        ``i``-th weight is ``Q(i / size) - Q((i - 1) / size)``.
+
+        :param function: can be either FuzzyMembershipFunction or
+          FuzzyOperator
+        :param size: number of most recent degrees aggregated, at least 1.
+        :param quantifier: non-decreasing membership function of proportion
+          with ``Q(0) = 0`` and ``Q(1) = 1``, e.g. "most".
+        :raises ValueError: when quantifier doesn't give valid weights.
+        """
+        if size < 1:
+            raise ValueError('Window size must be at least 1.')
+        levels = [quantifier(i / size) for i in range(size + 1)]
+        return cls(function, [upper - lower
+                              for lower, upper in zip(levels, levels[1:])])
+
+    def reset(self) -> None:
+        super().reset()
+        self._sorted: List[float] = []
+
+    def window_weights(self, count: int) -> List[float]:
+        """
+        Return weights of window holding given number of degrees.
+
+        :param count: number of degrees in window, from 1 to size.
+        :return: weights for degrees sorted in ascending order.
+        """
+        if count == self.size:
+            return list(self._ascending)
+        scale = self.size / count
+        cumulative = []
+        for i in range(count + 1):
+            position = i * scale
+            index = min(int(position), self.size - 1)
+            fraction = position - index
+            cumulative.append(
+                self._cumulative[index] * (1 - fraction)
+                + self._cumulative[index + 1] * fraction
+            )
+        return [upper - lower
+                for lower, upper in zip(cumulative[-2::-1], cumulative[:0:-1])]
+
+    def _push(self, degree: float, expired: Optional[float]) -> float:
+        if expired is not None:
+            del self._sorted[bisect_left(self._sorted, expired)]
+        insort(self._sorted, degree)
+        if len(self._sorted) == self.size:
+            weights = self._ascending
+        else:
+            weights = self.window_weights(len(self._sorted))
+        return sum(map(mul, weights, self._sorted))
+
+    def aggregate_batch(self, degrees: np.ndarray, out: np.ndarray) -> None:
+        import numpy as np
+        from numpy.lib.stride_tricks import sliding_window_view
+
+        length = degrees.shape[-1]
+        for count in range(1, min(self.size, length + 1)):
+            window = np.sort(degrees[..., :count], axis=-1)
+            out[..., count - 1] = window @ np.array(
+                self.window_weights(count), dtype=degrees.dtype
+            )
+        if length < self.size:
+            return
+        weights = np.array(self.weights[::-1], dtype=degrees.dtype)
+        windows = sliding_window_view(degrees, self.size, axis=-1)
+        step = max(1, _OWA_CHUNK // self.size)
+        for start in range(0, windows.shape[-2], step):
+            stop = start + step
+            out[..., self.size - 1 + start:self.size - 1 + stop] = np.sort(
+                windows[..., start:stop, :], axis=-1
+            ) @ weights
+
+
+class WindowQuantifier(WindowOperator):
+    """
+    Relative quantifier over last degrees, as proposed by Zadeh.
+
+    Truth of "Q of last readings are A" is ``Q(mean degree of A)``, where
+      quantifier Q is membership function of proportion in [0;1].
+      Intervals of proportions are mapped to minimum and maximum of Q over
+      them, exactly for non-decreasing and trapezoid quantifiers.
+    """
+
+    quantifier: FuzzyMembershipFunction
+    """Membership function of proportion, e.g. "most"."""
+
+    def __init__(
+            self,
+            function: Operatable,
+            size: int,
+            quantifier: FuzzyMembershipFunction
+    ) -> None:
+        """
+        Create quantifier over window of degrees.
+
+        :param function: can be either FuzzyMembershipFunction or
+          FuzzyOperator
+        :param size: number of most recent degrees aggregated, at least 1.
+        :param quantifier: membership function of proportion.
+        :raises ValueError: when size is smaller than 1.
+        """
+        self.quantifier = quantifier
+        super().__init__(function, size)
+
+    def reset(self) -> None:
+        super().reset()
+        self._sum = 0.
+        self._proportion = 0.
+
+    def _push(self, degree: float, expired: Optional[float]) -> float:
+        if expired is not None:
+            self._sum -= expired
+        self._sum += degree
+        if self._tick % self.size == self.size - 1:
+            # Rounding errors of running sum are dropped once per window.
+            self._sum = fsum(self._window)
+        self._proportion = min(max(self._sum / len(self._window), 0.), 1.)
+        return self.quantifier(self._proportion)
+
+    def aggregate_batch(self, degrees: np.ndarray, out: np.ndarray) -> None:
+        self.quantifier.evaluate_batch(self._proportions_batch(degrees),
+                                       out=out)
+
+    def interval(self, value: float) -> Tuple[float, float]:
+        super().interval(value)
+        lower_window, upper_window = self._bound_windows
+        lower, upper = lower_window._proportion, upper_window._proportion
+        degrees = [self.quantifier(proportion) for proportion in
+                   [lower, upper] + [knot for knot in self._knots()
+                                     if lower < knot < upper]]
+        return min(degrees), max(degrees)
+
+    def interval_batch(self, values) -> Tuple[np.ndarray, np.ndarray]:
+        import numpy as np
+
+        bounds = self.functions[0].interval_batch(values)
+        shape = np.shape(bounds[0]) or (1,)
+        lower, upper = (
+            self._proportions_batch(
+                np.asarray(degrees, dtype=float).reshape(shape)
+            ).reshape(np.shape(degrees))
+            for degrees in bounds
+        )
+        at_lower = self.quantifier.evaluate_batch(lower)
+        at_upper = self.quantifier.evaluate_batch(upper)
+        minimum = np.minimum(at_lower, at_upper)
+        maximum = np.maximum(at_lower, at_upper)
+        for knot in self._knots():
+            inside = (lower < knot) & (knot < upper)
+            degree = self.quantifier(knot)
+            minimum[inside] = np.minimum(minimum[inside], degree)
+            maximum[inside] = np.maximum(maximum[inside], degree)
+        return minimum, maximum
+
+    def _proportions_batch(self, degrees: np.ndarray) -> np.ndarray:
+        # Means of windows ending at each sample; last axis is time.
+        import numpy as np
+
+        sums = np.cumsum(degrees, axis=-1, dtype=np.float64)
+        sums[..., self.size:] -= sums[..., :-self.size].copy()
+        counts = np.minimum(np.arange(1, degrees.shape[-1] + 1), self.size)
+        return np.clip(sums / counts, 0., 1., out=sums)
+
+    def _knots(self) -> List[float]:
+        # Proportions where trapezoid quantifier can have extreme degree
+        #  inside interval.
+        if not isinstance(self.quantifier, TrapezoidFunction):
+            return []
+        return [vertex for vertex in self.quantifier.vertices
+                if 0. < vertex < 1.]
@@ -0,0 +1,21 @@
+"""
+This package contains rule bases - named collections of operator trees.
+
+RuleBase compiles rules into flat arrays of trapezoid vertices and postfix
+  instruction tape, evaluates all rules over batches of values, and can be
+  saved to versioned binary file. Loading memory-maps numeric sections, so
+  even large rule bases open quickly and are paged in on first use.
+"""
+from typing import TYPE_CHECKING
+
+from fuzzy._lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from fuzzy.rules._rule_base import RuleBase
+    from fuzzy.rules._format import save_rule_base, load_rule_base
+
+__getattr__, __dir__ = lazy_attributes(__name__, {
+    'RuleBase': 'fuzzy.rules._rule_base',
+    'save_rule_base': 'fuzzy.rules._format',
+    'load_rule_base': 'fuzzy.rules._format',
+})
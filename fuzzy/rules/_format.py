@@ -0,0 +1,142 @@
+"""
+Binary file format of RuleBase.
+
+File starts with fixed little-endian header:
+    *. magic ``b'FZRB'``,
+    *. format version (uint32),
+    *. ``(offset, count)`` pairs (uint64) of sections: vertices, constants,
+       tape, offsets, modifiers, clamp and names.
+  Numeric sections follow header, each aligned to 8 bytes:
+    *. vertices - float64 of shape ``(count, 4)``,
+    *. constants - float64 of shape ``(count,)``,
+    *. tape - int32 of shape ``(count, 4)``,
+    *. offsets - int64 of shape ``(count,)``,
+    *. modifiers - float64 of shape ``(count, 2)``,
+    *. clamp - bool of shape ``(count,)``, one for each row of vertices.
+  Names section is UTF-8 JSON object ``{"rules": [...], "terms": [...]}``
+  of ``count`` bytes.
+
+Numeric sections are memory-mapped on load, so opening file reads only
+  header and names; numbers are paged in when rules are evaluated.
+
+Version 1 files have no modifiers section and tape of shape ``(count, 2)``
+  with negation as separate instruction; version 1 and 2 files have no
+  clamp section, so every term with single infinite side is loaded as
+  InfiniteTrapezoidFunction. They are still readable.
+"""
+import json
+import struct
+
+import numpy as np
+
+from fuzzy.rules._rule_base import RuleBase
+
+MAGIC = b'FZRB'
+FORMAT_VERSION = 3
+"""Version of rule base file format written by save_rule_base."""
+
+_PREFIX = struct.Struct('<4sI')
+_SECTIONS = {
+    1: (
+        ('vertices', np.dtype('<f8'), (4,)),
+        ('constants', np.dtype('<f8'), ()),
+        ('tape', np.dtype('<i4'), (2,)),
+        ('offsets', np.dtype('<i8'), ()),
+    ),
+    2: (
+        ('vertices', np.dtype('<f8'), (4,)),
+        ('constants', np.dtype('<f8'), ()),
+        ('tape', np.dtype('<i4'), (4,)),
+        ('offsets', np.dtype('<i8'), ()),
+        ('modifiers', np.dtype('<f8'), (2,)),
+    ),
+    3: (
+        ('vertices', np.dtype('<f8'), (4,)),
+        ('constants', np.dtype('<f8'), ()),
+        ('tape', np.dtype('<i4'), (4,)),
+        ('offsets', np.dtype('<i8'), ()),
+        ('modifiers', np.dtype('<f8'), (2,)),
+        ('clamp', np.dtype('?'), ()),
+    ),
+}
+_HEADERS = {
+    version: struct.Struct(f'<4sI{2 * len(sections) + 2}Q')
+    for version, sections in _SECTIONS.items()
+}
+_ALIGNMENT = 8
+
+
+def save_rule_base(rule_base: RuleBase, path: str) -> None:
+    """
+    Write rule base to file.
+
+    :param rule_base: compiled RuleBase.
+    :param path: destination file path.
+    """
+    header = _HEADERS[FORMAT_VERSION]
+    arrays = [np.ascontiguousarray(getattr(rule_base, name), dtype=dtype)
+              for name, dtype, _ in _SECTIONS[FORMAT_VERSION]]
+    names = json.dumps({'rules': rule_base.names,
+                        'terms': rule_base.term_names}).encode('utf-8')
+    layout = []
+    position = header.size
+    for array in arrays:
+        position = _align(position)
+        layout += [position, len(array)]
+        position += array.nbytes
+    layout += [position, len(names)]
+    with open(path, 'wb') as file:
+        file.write(header.pack(MAGIC, FORMAT_VERSION, *layout))
+        for array, offset in zip(arrays, layout[::2]):
+            file.write(b'\0' * (offset - file.tell()))
+            file.write(array.tobytes())
+        file.write(names)
+
+
+def load_rule_base(path: str, mmap: bool = True) -> RuleBase:
+    """
+    Read rule base written by save_rule_base.
+
+    :param path: file path.
+    :param mmap: memory-map numeric sections instead of reading them.
+    :return: RuleBase backed by file contents.
+    :raises ValueError: when file is not rule base or its version is not
+      supported.
+    """
+    with open(path, 'rb') as file:
+        prefix = file.read(_PREFIX.size)
+        if len(prefix) < _PREFIX.size or prefix[:4] != MAGIC:
+            raise ValueError(f'{path} is not a rule base file.')
+        _, version = _PREFIX.unpack(prefix)
+        if version not in _HEADERS:
+            raise ValueError(f'Unsupported rule base version {version}.')
+        header = prefix + file.read(_HEADERS[version].size - _PREFIX.size)
+        _, _, *layout = _HEADERS[version].unpack(header)
+        names_offset, names_length = layout[-2:]
+        file.seek(names_offset)
+        names = json.loads(file.read(names_length).decode('utf-8'))
+
+    arrays = {}
+    for (name, dtype, shape), offset, count in zip(
+            _SECTIONS[version], layout[0::2], layout[1::2]):
+        shape = (count,) + shape
+        if count == 0:
+            arrays[name] = np.empty(shape, dtype=dtype)
+        elif mmap:
+            arrays[name] = np.memmap(path, dtype=dtype, mode='r',
+                                     offset=offset, shape=shape)
+        else:
+            arrays[name] = np.fromfile(path, dtype=dtype,
+                                       count=int(np.prod(shape)),
+                                       offset=offset).reshape(shape)
+    if version == 1:
+        tape = arrays['tape']
+        arrays['tape'] = np.concatenate(
+            [tape, np.zeros((len(tape), 2), dtype=tape.dtype)], axis=1
+        )
+        arrays['modifiers'] = np.empty((0, 2))
+    return RuleBase.from_arrays(names['rules'], names['terms'], **arrays)
+
+
+def _align(position: int) -> int:
+    return -(-position // _ALIGNMENT) * _ALIGNMENT
@@ -0,0 +1,394 @@
+"""
+Rule bases compiled into flat arrays.
+
+Each rule is an operator tree over TrapezoidFunctions. RuleBase stores all
+  rules together as:
+    *. vertices - one row of 4 vertices for each distinct TrapezoidFunction,
+    *. clamp - for each row, whether it is InfiniteTrapezoidFunction,
+    *. constants - values of ConstantFunctions,
+    *. tape - postfix ``(opcode, operand, modifier start, modifier count)``
+       instructions of all rules,
+    *. modifiers - ``(kind, parameter)`` rows of unary operations applied to
+       result of instruction, in order,
+    *. offsets - start of each rule on tape, plus end of last rule,
+    *. names of rules and terms.
+  Strong negation and hedges are fused into instruction computing their
+  operand as modifiers, so chains like ``Very(~Intensify(f))`` cost no
+  extra instructions; nested powers are merged into one.
+  Such representation can be written to disk and memory-mapped back
+  (see ``fuzzy.rules._format``) without rebuilding Python objects.
+
+Tape is evaluated on preallocated stack of rows: instructions write into
+  stack rows in place, so with reused output buffer and Workspace
+  evaluation allocates no arrays.
+"""
+from typing import Dict, List, Mapping, Optional
+
+import numpy as np
+
+from fuzzy.batch import Workspace, prepare_batch
+from fuzzy.functions import (
+    TrapezoidFunction, InfiniteTrapezoidFunction, ConstantFunction,
+    TrapezoidBank
+)
+from fuzzy.operators import (
+    TNorm, SNorm, StrongNegation, Power, Intensify, Diminish
+)
+from fuzzy.operators._hedge_kernels import intensify_batch, diminish_batch
+from fuzzy.operators._operators import Operatable
+
+OP_TERM = 0
+"""Push degrees of term; operand is row of vertices."""
+OP_CONSTANT = 1
+"""Push constant; operand is index of constants."""
+OP_TNORM = 2
+"""Pop operands and push their minimum; operand is arity."""
+OP_SNORM = 3
+"""Pop operands and push their maximum; operand is arity."""
+OP_NEGATION = 4
+"""Pop operand and push its strong negation; only in version 1 files."""
+
+MOD_NEGATION = 0
+"""Strong negation modifier."""
+MOD_POWER = 1
+"""Power hedge modifier; parameter is exponent."""
+MOD_INTENSIFY = 2
+"""Contrast intensification modifier."""
+MOD_DIMINISH = 3
+"""Contrast dilution modifier."""
+
+# Kernels modify degrees in place; arguments are degrees, parameter and
+#  scratch row.
+_MODIFIER_KERNELS = {
+    MOD_NEGATION: lambda degrees, _, __: np.subtract(1., degrees,
+                                                     out=degrees),
+    MOD_POWER: lambda degrees, exponent, _: np.power(degrees, exponent,
+                                                     out=degrees),
+    MOD_INTENSIFY: lambda degrees, _, scratch: intensify_batch(
+        degrees, degrees, scratch),
+    MOD_DIMINISH: lambda degrees, _, scratch: diminish_batch(
+        degrees, degrees, scratch),
+}
+
+
+class RuleBase:
+    """
+    Named operator trees compiled into flat arrays.
+
+    Rules are evaluated directly from tape; trees are rebuilt only when
+      accessed by name.
+    """
+
+    names: List[str]
+    """Names of rules, in order of evaluation results."""
+    term_names: List[str]
+    """Names of terms for each row of vertices; empty for unnamed ones."""
+    vertices: np.ndarray
+    """Vertices of terms of shape ``(T, 4)``."""
+    clamp: np.ndarray
+    """
+    Whether term is InfiniteTrapezoidFunction; boolean array of shape
+      ``(T,)``.
+    """
+    constants: np.ndarray
+    """Values of constants of shape ``(C,)``."""
+    tape: np.ndarray
+    """Postfix instructions of shape ``(M, 4)``."""
+    modifiers: np.ndarray
+    """Unary modifiers ``(kind, parameter)`` of shape ``(K, 2)``."""
+    offsets: np.ndarray
+    """Start of each rule on tape and end of last one; shape ``(R + 1,)``."""
+
+    def __init__(
+            self,
+            rules: Mapping[str, Operatable],
+            terms: Optional[Mapping[str, TrapezoidFunction]] = None
+    ) -> None:
+        """
+        Compile rules into arrays.
+
+        :param rules: mapping of rule names to operator trees built from
+          TrapezoidFunction, ConstantFunction, TNorm, SNorm,
+          StrongNegation, Power, Intensify and Diminish.
+        :param terms: optional mapping of names to TrapezoidFunctions used
+          in rules, stored in term name table.
+        :raises TypeError: when tree contains other node types.
+        """
+        term_names = {id(funct): name for name, funct in (terms or {}).items()}
+        rows: Dict[int, int] = {}
+        vertices = []
+        clamp = []
+        constants = []
+        tape = []
+        modifiers = []
+        offsets = [0]
+
+        def compile_node(node: Operatable) -> None:
+            chain = []
+            while _modifier(node) is not None:
+                chain.append(_modifier(node))
+                node = node.functions[0]
+            if isinstance(node, TrapezoidFunction):
+                if id(node) not in rows:
+                    rows[id(node)] = len(vertices)
+                    vertices.append(node.vertices)
+                    clamp.append(isinstance(node, InfiniteTrapezoidFunction))
+                tape.append((OP_TERM, rows[id(node)]))
+            elif isinstance(node, ConstantFunction):
+                tape.append((OP_CONSTANT, len(constants)))
+                constants.append(node.value)
+            elif type(node) in (TNorm, SNorm):
+                for child in node.functions:
+                    compile_node(child)
+                opcode = OP_TNORM if type(node) is TNorm else OP_SNORM
+                tape.append((opcode, len(node.functions)))
+            else:
+                raise TypeError(
+                    f'Cannot compile {type(node).__name__} into rule base.'
+                )
+            fused = _fuse(chain[::-1])
+            opcode, operand = tape[-1][:2]
+            tape[-1] = (opcode, operand, len(modifiers), len(fused))
+            modifiers.extend(fused)
+
+        keep = []
+        for rule in rules.values():
+            compile_node(rule)
+            offsets.append(len(tape))
+            keep.append(rule)
+
+        self.names = list(rules)
+        self.term_names = [''] * len(vertices)
+        for key, row in rows.items():
+            self.term_names[row] = term_names.get(key, '')
+        self.vertices = np.array(vertices, dtype=np.float64).reshape(-1, 4)
+        self.clamp = np.array(clamp, dtype=bool)
+        self.constants = np.array(constants, dtype=np.float64)
+        self.tape = np.array(tape, dtype=np.int32).reshape(-1, 4)
+        self.modifiers = np.array(modifiers, dtype=np.float64).reshape(-1, 2)
+        self.offsets = np.array(offsets, dtype=np.int64)
+        self._bank = TrapezoidBank(self.vertices, clamp=self.clamp)
+        self._rules = dict(zip(self.names, keep))
+        self._tape_lists = None
+
+    @classmethod
+    def from_arrays(
+            cls,
+            names: List[str],
+            term_names: List[str],
+            vertices: np.ndarray,
+            constants: np.ndarray,
+            tape: np.ndarray,
+            offsets: np.ndarray,
+            modifiers: np.ndarray,
+            clamp: Optional[np.ndarray] = None
+    ) -> "RuleBase":
+        """
+        Construct rule base from already compiled arrays without copying.
+
+        Arrays are trusted to come from compiled RuleBase, e.g. memory-mapped
+          from file; vertices are not validated.
+
+        :param clamp: whether terms are InfiniteTrapezoidFunctions; when
+          omitted, as for files without clamp section, every term with
+          single infinite side is.
+        :return: RuleBase sharing given arrays.
+        """
+        rule_base = cls.__new__(cls)
+        rule_base.names = list(names)
+        rule_base.term_names = list(term_names)
+        rule_base.vertices = vertices
+        rule_base.clamp = np.ones(len(vertices), dtype=bool) \
+            if clamp is None else clamp
+        rule_base.constants = constants
+        rule_base.tape = tape
+        rule_base.offsets = offsets
+        rule_base.modifiers = modifiers
+        rule_base._bank = None
+        rule_base._rules = {}
+        rule_base._tape_lists = None
+        return rule_base
+
+    @property
+    def terms(self) -> TrapezoidBank:
+        """Terms of rule base as lazily materialized bank."""
+        if self._bank is None:
+            self._bank = TrapezoidBank(self.vertices, validate=False,
+                                       clamp=self.clamp)
+        return self._bank
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __getitem__(self, name: str) -> Operatable:
+        """
+        Return operator tree of rule, rebuilding it from tape if needed.
+
+        :param name: rule name.
+        :return: operator tree.
+        """
+        if name not in self._rules:
+            index = self.names.index(name)
+            start, end = self.offsets[index], self.offsets[index + 1]
+            stack = []
+            for opcode, operand, first, count in \
+                    self.tape[start:end].tolist():
+                if opcode == OP_TERM:
+                    stack.append(self.terms[operand])
+                elif opcode == OP_CONSTANT:
+                    stack.append(ConstantFunction(self.constants[operand]))
+                elif opcode == OP_NEGATION:
+                    stack.append(StrongNegation(stack.pop()))
+                else:
+                    operands = stack[len(stack) - operand:]
+                    del stack[len(stack) - operand:]
+                    operator_type = TNorm if opcode == OP_TNORM else SNorm
+                    stack.append(operator_type(*operands))
+                for kind, parameter in \
+                        self.modifiers[first:first + count].tolist():
+                    stack[-1] = _rebuild_modifier(int(kind), parameter,
+                                                  stack[-1])
+            self._rules[name] = stack.pop()
+        return self._rules[name]
+
+    def __call__(self, value: float) -> List[float]:
+        """
+        Return outputs of all rules for single value.
+
+        :param value: value to pass through rules.
+        :return: list of rule outputs in order of names.
+        """
+        return self.evaluate_batch([value])[0].tolist()
+
+    def evaluate_batch(
+            self,
+            values,
+            out: Optional[np.ndarray] = None,
+            dtype=None,
+            workspace: Optional[Workspace] = None
+    ) -> np.ndarray:
+        """
+        Return outputs of all rules for array of values.
+
+        :param values: 1-dimensional array-like of values.
+        :param out: optional buffer of shape ``(N, len(rule base))``.
+        :param dtype: floating point dtype of outputs; defaults to dtype of
+          out, or float64.
+        :param workspace: optional Workspace providing degrees of terms and
+          evaluation stack.
+        :return: array of shape ``(N, len(rule base))``; out when given.
+        """
+        values, out = prepare_batch(values, out, dtype,
+                                    trailing=(len(self.names),))
+        if self._tape_lists is None:
+            self._tape_lists = (
+                self.tape.tolist(), self.offsets.tolist(),
+                [(int(kind), parameter)
+                 for kind, parameter in self.modifiers.tolist()],
+                self.constants.tolist(), _stack_depth(self.tape)
+            )
+        tape, offsets, modifiers, constants, depth = self._tape_lists
+        workspace = workspace or Workspace()
+        # Degrees are kept transposed, so that each term is contiguous row;
+        #  stack has one spare row used as scratch by modifiers.
+        with workspace.scratch((len(self.vertices), len(values)),
+                               out.dtype) as degrees, \
+                workspace.scratch((depth + 1, len(values)),
+                                  out.dtype) as stack:
+            self.terms.evaluate_batch(values, out=degrees.T,
+                                      workspace=workspace)
+            for rule in range(len(self.names)):
+                top = 0
+                for opcode, operand, first, count in \
+                        tape[offsets[rule]:offsets[rule + 1]]:
+                    if opcode == OP_TERM:
+                        np.copyto(stack[top], degrees[operand])
+                        top += 1
+                    elif opcode == OP_CONSTANT:
+                        stack[top].fill(constants[operand])
+                        top += 1
+                    elif opcode == OP_NEGATION:
+                        np.subtract(1., stack[top - 1], out=stack[top - 1])
+                    else:
+                        reduce = np.minimum if opcode == OP_TNORM \
+                            else np.maximum
+                        top -= operand
+                        for row in range(top + 1, top + operand):
+                            reduce(stack[top], stack[row], out=stack[top])
+                        top += 1
+                    for kind, parameter in modifiers[first:first + count]:
+                        _MODIFIER_KERNELS[kind](stack[top - 1], parameter,
+                                                stack[top])
+                out[:, rule] = stack[0]
+        return out
+
+    def save(self, path: str) -> None:
+        """
+        Save rule base in binary format; see ``fuzzy.rules._format``.
+
+        :param path: destination file path.
+        """
+        from fuzzy.rules._format import save_rule_base
+        save_rule_base(self, path)
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = True) -> "RuleBase":
+        """
+        Load rule base saved with ``save``.
+
+        :param path: file path.
+        :param mmap: memory-map numeric sections instead of reading them.
+        :return: loaded RuleBase.
+        """
+        from fuzzy.rules._format import load_rule_base
+        return load_rule_base(path, mmap=mmap)
+
+
+def _stack_depth(tape: np.ndarray) -> int:
+    # Maximal number of rows on evaluation stack.
+    depth = top = 0
+    for opcode, operand in tape[:, :2].tolist():
+        if opcode in (OP_TERM, OP_CONSTANT):
+            top += 1
+        elif opcode in (OP_TNORM, OP_SNORM):
+            top -= operand - 1
+        depth = max(depth, top)
+    return depth
+
+
+def _modifier(node: Operatable):
+    # Returns (kind, parameter) of unary node fusable as modifier.
+    if type(node) is StrongNegation:
+        return MOD_NEGATION, 0.
+    if isinstance(node, Power):
+        return MOD_POWER, node.exponent
+    if type(node) is Intensify:
+        return MOD_INTENSIFY, 0.
+    if type(node) is Diminish:
+        return MOD_DIMINISH, 0.
+    return None
+
+
+def _fuse(chain):
+    # Merges consecutive powers and cancels double negations.
+    fused = []
+    for kind, parameter in chain:
+        if fused and kind == MOD_POWER and fused[-1][0] == MOD_POWER:
+            fused[-1] = (MOD_POWER, fused[-1][1] * parameter)
+            if fused[-1][1] == 1:
+                fused.pop()
+        elif fused and kind == MOD_NEGATION and fused[-1][0] == MOD_NEGATION:
+            fused.pop()
+        else:
+            fused.append((kind, parameter))
+    return fused
+
+
+def _rebuild_modifier(kind: int, parameter: float, node: Operatable):
+    if kind == MOD_NEGATION:
+        return StrongNegation(node)
+    if kind == MOD_POWER:
+        return Power(node, parameter)
+    if kind == MOD_INTENSIFY:
+        return Intensify(node)
+    return Diminish(node)
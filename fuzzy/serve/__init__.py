@@ -0,0 +1,34 @@
+"""
+This package contains tools for serving fuzzy systems to many clients.
+
+AsyncEvaluator lets many coroutines evaluate single values while system
+  is run on micro-batches through its vectorized ``evaluate_batch``.
+
+InferenceServer answers batched evaluation requests from other processes
+  over Unix or TCP sockets using length-prefixed binary protocol (see
+  ``fuzzy.serve._protocol``). Saved rule base can be served with
+  ``python -m fuzzy.serve model.bin`` and benchmarked with
+  ``python -m fuzzy.serve.loadgen``.
+"""
+from typing import TYPE_CHECKING
+
+from fuzzy._lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from fuzzy.serve._async_evaluator import (
+        AsyncEvaluator, EvaluatorStatistics
+    )
+    from fuzzy.serve._protocol import ProtocolError, parse_address
+    from fuzzy.serve._server import InferenceServer
+    from fuzzy.serve._client import Client, ConnectionPool, run_load
+
+__getattr__, __dir__ = lazy_attributes(__name__, {
+    'AsyncEvaluator': 'fuzzy.serve._async_evaluator',
+    'EvaluatorStatistics': 'fuzzy.serve._async_evaluator',
+    'ProtocolError': 'fuzzy.serve._protocol',
+    'parse_address': 'fuzzy.serve._protocol',
+    'InferenceServer': 'fuzzy.serve._server',
+    'Client': 'fuzzy.serve._client',
+    'ConnectionPool': 'fuzzy.serve._client',
+    'run_load': 'fuzzy.serve._client',
+})
@@ -0,0 +1,46 @@
+"""
+Serve rule base file over socket.
+
+Usage::
+
+    python -m fuzzy.serve model.bin --address 127.0.0.1:8765
+    python -m fuzzy.serve model.bin --address unix:/tmp/fuzzy.sock
+"""
+import argparse
+import asyncio
+
+from fuzzy.rules import RuleBase
+from fuzzy.serve._protocol import parse_address
+from fuzzy.serve._server import InferenceServer
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(
+        prog='python -m fuzzy.serve',
+        description='Serve rule base saved with RuleBase.save.'
+    )
+    parser.add_argument('model', help='rule base file')
+    parser.add_argument('--address', default='127.0.0.1:8765',
+                        help='host:port or unix:/path/to/socket')
+    parser.add_argument('--workers', type=int, default=4,
+                        help='number of worker threads')
+    args = parser.parse_args(argv)
+
+    rule_base = RuleBase.load(args.model)
+
+    async def serve() -> None:
+        server = InferenceServer(rule_base, workers=args.workers)
+        await server.start(parse_address(args.address))
+        print(f'Serving {len(rule_base)} rules on {server.address}',
+              flush=True)
+        async with server:
+            await server.serve_forever()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,165 @@
+"""
+asyncio front-end collecting concurrent evaluations into micro-batches.
+"""
+import asyncio
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+
+class EvaluatorStatistics:
+    """Counters of AsyncEvaluator, updated as requests are served."""
+
+    requests: int
+    """Number of values submitted."""
+    batches: int
+    """Number of batches started."""
+    pending: int
+    """Number of values waiting for next batch."""
+    in_flight: int
+    """Number of batches being evaluated."""
+    max_pending: int
+    """Largest number of values waiting for batch at once."""
+    largest_batch: int
+    """Size of largest batch."""
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.batches = 0
+        self.pending = 0
+        self.in_flight = 0
+        self.max_pending = 0
+        self.largest_batch = 0
+
+    @property
+    def mean_batch_size(self) -> float:
+        """Mean number of values in batch."""
+        if not self.batches:
+            return 0.
+        return (self.requests - self.pending) / self.batches
+
+    def __repr__(self) -> str:
+        return (f'{type(self).__name__}(requests={self.requests}, '
+                f'batches={self.batches}, pending={self.pending}, '
+                f'in_flight={self.in_flight}, '
+                f'max_pending={self.max_pending}, '
+                f'largest_batch={self.largest_batch}, '
+                f'mean_batch_size={self.mean_batch_size:.2f})')
+
+
+class AsyncEvaluator:
+    """
+    Evaluate single values from many coroutines in vectorized batches.
+
+    Values passed to ``evaluate`` are queued until either ``max_batch_size``
+      values are waiting or ``max_wait`` seconds passed since first of them
+      arrived. Whole batch is then passed to ``system.evaluate_batch`` in
+      executor, so event loop is never blocked by evaluation.
+
+    Usage::
+
+        async with AsyncEvaluator(rule_base) as evaluator:
+            degrees = await evaluator.evaluate(21.5)
+    """
+
+    statistics: EvaluatorStatistics
+    """Queue depth and batch size counters."""
+
+    def __init__(
+            self,
+            system,
+            max_batch_size: int = 256,
+            max_wait: float = 0.001,
+            executor: Optional[Executor] = None
+    ) -> None:
+        """
+        Construct evaluator.
+
+        :param system: object with ``evaluate_batch`` accepting
+          1-dimensional array, e.g. operator tree or RuleBase.
+        :param max_batch_size: largest number of values in batch.
+        :param max_wait: longest time in seconds value waits for batch.
+        :param executor: executor running batches; by default evaluator
+          owns single-thread executor.
+        """
+        if max_batch_size < 1:
+            raise ValueError('max_batch_size must be positive.')
+        self.system = system
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.statistics = EvaluatorStatistics()
+        self._own_executor = executor is None
+        self._executor = executor or ThreadPoolExecutor(max_workers=1)
+        self._pending: List[Tuple[float, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._batches = set()
+
+    async def evaluate(self, value: float):
+        """
+        Evaluate system for single value as part of batch.
+
+        :param value: value to pass to system.
+        :return: row of ``system.evaluate_batch`` result for value, as
+          Python float or list.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((value, future))
+        self.statistics.requests += 1
+        self.statistics.pending = len(self._pending)
+        self.statistics.max_pending = max(self.statistics.max_pending,
+                                          len(self._pending))
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait, self._flush)
+        return await future
+
+    async def close(self) -> None:
+        """Evaluate waiting values, wait for all batches and clean up."""
+        self._flush()
+        if self._batches:
+            await asyncio.gather(*self._batches, return_exceptions=True)
+        if self._own_executor:
+            self._executor.shutdown(wait=False)
+
+    async def __aenter__(self) -> "AsyncEvaluator":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        while self._pending:
+            batch = self._pending[:self.max_batch_size]
+            del self._pending[:self.max_batch_size]
+            task = asyncio.ensure_future(self._run(batch))
+            self._batches.add(task)
+            task.add_done_callback(self._batches.discard)
+        self.statistics.pending = 0
+
+    async def _run(self, batch: List[Tuple[float, asyncio.Future]]) -> None:
+        self.statistics.batches += 1
+        self.statistics.in_flight += 1
+        self.statistics.largest_batch = max(self.statistics.largest_batch,
+                                            len(batch))
+        values = np.array([value for value, _ in batch], dtype=float)
+        loop = asyncio.get_running_loop()
+        try:
+            results = await loop.run_in_executor(
+                self._executor, self.system.evaluate_batch, values
+            )
+        except Exception as error:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(error)
+            return
+        finally:
+            self.statistics.in_flight -= 1
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result.tolist())
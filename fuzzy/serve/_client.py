@@ -0,0 +1,205 @@
+"""
+Blocking client, connection pool and load generator of inference server.
+"""
+import queue
+import socket
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator
+
+import numpy as np
+
+from fuzzy.serve._protocol import (
+    Address, decode_response, encode_request, receive_frame
+)
+
+
+class Client:
+    """Single persistent connection to inference server."""
+
+    def __init__(self, address: Address, timeout: float = 30.) -> None:
+        """
+        Connect to server.
+
+        :param address: Unix socket path, or ``(host, port)`` for TCP.
+        :param timeout: socket timeout in seconds.
+        """
+        if isinstance(address, str):
+            self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        else:
+            self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            self._socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._socket.settimeout(timeout)
+        self._socket.connect(address)
+
+    def evaluate(self, values) -> np.ndarray:
+        """
+        Evaluate batch of values on server.
+
+        :param values: 1-dimensional array-like of values.
+        :return: array of shape ``(N, outputs)``.
+        :raises ProtocolError: when server reports error.
+        """
+        return decode_response(self.request(values))
+
+    def request(self, values) -> bytes:
+        """
+        Send batch of values and receive whole response frame.
+
+        :param values: 1-dimensional array-like of values.
+        :return: payload of response frame; see ``decode_response``.
+        """
+        self._socket.sendall(encode_request(values))
+        return receive_frame(self._socket)
+
+    def close(self) -> None:
+        self._socket.close()
+
+    def __enter__(self) -> "Client":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class ConnectionPool:
+    """
+    Thread-safe pool of persistent connections.
+
+    Connections are opened on demand, up to ``size`` at once, and reused.
+    """
+
+    def __init__(self, address: Address, size: int = 8) -> None:
+        """
+        Construct pool.
+
+        :param address: Unix socket path, or ``(host, port)`` for TCP.
+        :param size: largest number of open connections.
+        """
+        self.address = address
+        self._idle = queue.LifoQueue()
+        self._slots = threading.Semaphore(size)
+        self._all = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def connection(self) -> Iterator[Client]:
+        """
+        Borrow connection, opening new one if none is idle.
+
+        Connection is returned to pool only when block exits cleanly; on any
+          exception it is closed and discarded, as its stream may hold part
+          of response.
+        """
+        with self._slots:
+            try:
+                client = self._idle.get_nowait()
+            except queue.Empty:
+                client = Client(self.address)
+                with self._lock:
+                    self._all.append(client)
+            try:
+                yield client
+            except BaseException:
+                client.close()
+                with self._lock:
+                    self._all.remove(client)
+                raise
+            self._idle.put(client)
+
+    def evaluate(self, values) -> np.ndarray:
+        """
+        Evaluate batch of values using pooled connection.
+
+        Whole response is received before connection returns to pool, so
+          errors reported by server keep connection open.
+
+        :raises ProtocolError: when server reports error.
+        """
+        with self.connection() as client:
+            payload = client.request(values)
+        return decode_response(payload)
+
+    def close(self) -> None:
+        with self._lock:
+            for client in self._all:
+                client.close()
+            self._all.clear()
+
+    def __enter__(self) -> "ConnectionPool":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def run_load(
+        address: Address,
+        requests: int = 1000,
+        batch_size: int = 64,
+        concurrency: int = 8,
+        low: float = 0.,
+        high: float = 1.,
+        seed: int = 0
+) -> Dict[str, float]:
+    """
+    Send requests from concurrent threads and measure latency.
+
+    :param address: Unix socket path, or ``(host, port)`` for TCP.
+    :param requests: total number of requests.
+    :param batch_size: number of values in each request.
+    :param concurrency: number of threads, each with pooled connection.
+    :param low: lower bound of uniformly drawn values.
+    :param high: upper bound of uniformly drawn values.
+    :param seed: seed of drawn values.
+    :return: dictionary with ``requests``, ``values``, ``seconds``,
+      ``requests_per_second``, ``values_per_second``, ``p50_ms`` and
+      ``p99_ms``.
+    :raises Exception: first error raised by any request, e.g.
+      ProtocolError or OSError, after all threads stopped.
+    """
+    values = np.random.default_rng(seed).uniform(low, high, batch_size)
+    latencies = []
+    errors = []
+    remaining = iter(range(requests))
+    lock = threading.Lock()
+
+    def worker(pool: ConnectionPool) -> None:
+        while True:
+            with lock:
+                if errors or next(remaining, None) is None:
+                    return
+            start = time.perf_counter()
+            try:
+                pool.evaluate(values)
+            except Exception as error:
+                with lock:
+                    errors.append(error)
+                return
+            elapsed = time.perf_counter() - start
+            with lock:
+                latencies.append(elapsed)
+
+    with ConnectionPool(address, size=concurrency) as pool:
+        threads = [threading.Thread(target=worker, args=(pool,))
+                   for _ in range(concurrency)]
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        seconds = time.perf_counter() - start
+    if errors:
+        raise errors[0]
+
+    latencies = np.array(latencies) * 1000.
+    return {
+        'requests': len(latencies),
+        'values': len(latencies) * batch_size,
+        'seconds': seconds,
+        'requests_per_second': len(latencies) / seconds,
+        'values_per_second': len(latencies) * batch_size / seconds,
+        'p50_ms': float(np.percentile(latencies, 50)),
+        'p99_ms': float(np.percentile(latencies, 99)),
+    }
@@ -0,0 +1,114 @@
+"""
+Length-prefixed binary protocol of inference server.
+
+Every message is frame: little-endian uint32 payload length followed by
+  payload. Connections are persistent - client may send any number of
+  requests, each answered with single response in order.
+
+Request payload is array of little-endian float64 values.
+
+Response payload starts with header ``<BII``: status, rows and columns.
+  For status STATUS_OK it is followed by ``rows * columns`` float64 results
+  in row-major order; for STATUS_ERROR by UTF-8 error message.
+"""
+import asyncio
+import socket
+import struct
+from typing import Tuple, Union
+
+import numpy as np
+
+STATUS_OK = 0
+STATUS_ERROR = 1
+
+MAX_FRAME = 1 << 30
+"""Largest accepted payload in bytes."""
+
+_LENGTH = struct.Struct('<I')
+_RESPONSE = struct.Struct('<BII')
+_FLOAT = np.dtype('<f8')
+
+Address = Union[str, Tuple[str, int]]
+
+
+class ProtocolError(Exception):
+    """Malformed frame or error reported by server."""
+
+
+def parse_address(address: str) -> Address:
+    """
+    Parse ``unix:/path/to/socket`` or ``host:port`` address.
+
+    :param address: address string.
+    :return: socket path for Unix sockets, ``(host, port)`` for TCP.
+    """
+    if address.startswith('unix:'):
+        return address[len('unix:'):]
+    host, _, port = address.rpartition(':')
+    return host or '127.0.0.1', int(port)
+
+
+def encode_request(values) -> bytes:
+    payload = np.ascontiguousarray(values, dtype=_FLOAT).tobytes()
+    return _LENGTH.pack(len(payload)) + payload
+
+
+def decode_request(payload: bytes) -> np.ndarray:
+    if len(payload) % _FLOAT.itemsize:
+        raise ProtocolError('Request length is not multiple of 8 bytes.')
+    return np.frombuffer(payload, dtype=_FLOAT)
+
+
+def encode_response(results: np.ndarray) -> bytes:
+    results = np.asarray(results, dtype=_FLOAT)
+    results = results.reshape(len(results), int(np.prod(results.shape[1:])))
+    payload = _RESPONSE.pack(STATUS_OK, *results.shape) + results.tobytes()
+    return _LENGTH.pack(len(payload)) + payload
+
+
+def encode_error(message: str) -> bytes:
+    payload = _RESPONSE.pack(STATUS_ERROR, 0, 0) + message.encode('utf-8')
+    return _LENGTH.pack(len(payload)) + payload
+
+
+def decode_response(payload: bytes) -> np.ndarray:
+    status, rows, columns = _RESPONSE.unpack_from(payload)
+    body = payload[_RESPONSE.size:]
+    if status != STATUS_OK:
+        raise ProtocolError(body.decode('utf-8', errors='replace'))
+    return np.frombuffer(body, dtype=_FLOAT).reshape(rows, columns)
+
+
+async def read_frame(reader: asyncio.StreamReader) -> bytes:
+    """
+    Read single frame payload from stream.
+
+    :raises asyncio.IncompleteReadError: when connection is closed.
+    :raises ProtocolError: when frame exceeds MAX_FRAME.
+    """
+    length, = _LENGTH.unpack(await reader.readexactly(_LENGTH.size))
+    if length > MAX_FRAME:
+        raise ProtocolError(f'Frame of {length} bytes is too large.')
+    return await reader.readexactly(length)
+
+
+def receive_frame(connection: socket.socket) -> bytes:
+    """
+    Read single frame payload from blocking socket.
+
+    :raises ConnectionError: when connection is closed.
+    """
+    length, = _LENGTH.unpack(_receive_exactly(connection, _LENGTH.size))
+    return _receive_exactly(connection, length)
+
+
+def _receive_exactly(connection: socket.socket, size: int) -> bytes:
+    buffer = bytearray(size)
+    view = memoryview(buffer)
+    received = 0
+    while received < size:
+        count = connection.recv_into(view[received:])
+        if not count:
+            raise ConnectionError('Connection closed by server.')
+        received += count
+    return bytes(buffer)
@@ -0,0 +1,122 @@
+"""
+asyncio socket server answering batched evaluation requests.
+"""
+import asyncio
+import os
+import stat
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+from fuzzy.serve._protocol import (
+    Address, ProtocolError, decode_request, encode_error, encode_response,
+    read_frame
+)
+
+
+class InferenceServer:
+    """
+    Serve ``system.evaluate_batch`` over Unix or TCP sockets.
+
+    Each connection is persistent and handled by own coroutine; requests
+      are evaluated in shared pool of worker threads, so slow batches of one
+      client don't block others.
+    """
+
+    requests: int
+    """Number of requests answered."""
+
+    def __init__(self, system, workers: int = 4) -> None:
+        """
+        Construct server.
+
+        :param system: object with ``evaluate_batch`` accepting
+          1-dimensional array, e.g. RuleBase.
+        :param workers: number of worker threads evaluating requests.
+        """
+        self.system = system
+        self.workers = workers
+        self.requests = 0
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    @property
+    def address(self) -> Address:
+        """Address server listens on; TCP port is resolved if 0 was used."""
+        return self._server.sockets[0].getsockname()
+
+    async def start(self, address: Address) -> None:
+        """
+        Start listening.
+
+        :param address: Unix socket path, or ``(host, port)`` for TCP.
+          Socket left at path by previous server is replaced.
+        :raises FileExistsError: when path exists and is not a socket.
+        """
+        if isinstance(address, str):
+            _remove_stale_socket(address)
+        self._executor = ThreadPoolExecutor(max_workers=self.workers)
+        if isinstance(address, str):
+            self._server = await asyncio.start_unix_server(
+                self._handle, path=address
+            )
+        else:
+            self._server = await asyncio.start_server(self._handle, *address)
+
+    async def serve_forever(self) -> None:
+        """Serve until cancelled."""
+        await self._server.serve_forever()
+
+    async def close(self) -> None:
+        """Stop listening and release workers."""
+        self._server.close()
+        await self._server.wait_closed()
+        self._executor.shutdown(wait=True)
+
+    async def __aenter__(self) -> "InferenceServer":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def _handle(
+            self,
+            reader: asyncio.StreamReader,
+            writer: asyncio.StreamWriter
+    ) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                try:
+                    payload = await read_frame(reader)
+                except asyncio.IncompleteReadError:
+                    break
+                try:
+                    values = decode_request(payload)
+                    results = await loop.run_in_executor(
+                        self._executor, self.system.evaluate_batch, values
+                    )
+                    response = encode_response(results)
+                except Exception as error:
+                    response = encode_error(f'{type(error).__name__}: '
+                                            f'{error}')
+                self.requests += 1
+                writer.write(response)
+                await writer.drain()
+        except (ConnectionError, ProtocolError):
+            pass
+        finally:
+            writer.close()
+
+
+def _remove_stale_socket(path: str) -> None:
+    # Only sockets are removed; path may also vanish between checks.
+    try:
+        mode = os.stat(path).st_mode
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(mode):
+        raise FileExistsError(f'{path} exists and is not a socket.')
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
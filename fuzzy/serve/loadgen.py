@@ -0,0 +1,40 @@
+"""
+Generate load against inference server and report latency.
+
+Usage::
+
+    python -m fuzzy.serve.loadgen 127.0.0.1:8765 --requests 10000
+"""
+import argparse
+
+from fuzzy.serve._client import run_load
+from fuzzy.serve._protocol import parse_address
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(
+        prog='python -m fuzzy.serve.loadgen',
+        description='Measure throughput and latency of inference server.'
+    )
+    parser.add_argument('address', help='host:port or unix:/path/to/socket')
+    parser.add_argument('--requests', type=int, default=1000)
+    parser.add_argument('--batch-size', type=int, default=64)
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--low', type=float, default=0.)
+    parser.add_argument('--high', type=float, default=1.)
+    args = parser.parse_args(argv)
+
+    report = run_load(parse_address(args.address), requests=args.requests,
+                      batch_size=args.batch_size,
+                      concurrency=args.concurrency,
+                      low=args.low, high=args.high)
+    print(f"{report['requests']} requests, {report['values']} values "
+          f"in {report['seconds']:.3f} s")
+    print(f"throughput: {report['requests_per_second']:.1f} requests/s, "
+          f"{report['values_per_second']:.1f} values/s")
+    print(f"latency: p50 {report['p50_ms']:.3f} ms, "
+          f"p99 {report['p99_ms']:.3f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -1 +1 @@
-from fuzzy_set import FuzzySet
+from fuzzy.sets.fuzzy_set import FuzzySet
@@ -0,0 +1,23 @@
+"""
+This package contains interval type-2 fuzzy sets.
+
+Interval type-2 membership function gives interval of membership degrees
+  instead of single degree, modelling uncertainty of membership function
+  itself. TNorm, SNorm and StrongNegation apply on such intervals through
+  ``interval`` and ``interval_batch`` methods, so interval type-2 rules are
+  built from the same operators as type-1 rules. Resulting sets are reduced
+  to centroid intervals with vectorized Karnik-Mendel type reduction.
+"""
+from typing import TYPE_CHECKING
+
+from fuzzy._lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from fuzzy.type2._interval_function import IntervalType2Function
+    from fuzzy.type2._type_reduction import centroid_interval, type_reduce
+
+__getattr__, __dir__ = lazy_attributes(__name__, {
+    'IntervalType2Function': 'fuzzy.type2._interval_function',
+    'centroid_interval': 'fuzzy.type2._type_reduction',
+    'type_reduce': 'fuzzy.type2._type_reduction',
+})
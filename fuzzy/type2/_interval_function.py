@@ -0,0 +1,109 @@
+"""
+Interval type-2 membership functions.
+"""
+from typing import Optional, Tuple
+
+import numpy as np
+
+from fuzzy.batch import Workspace, prepare_batch
+from fuzzy.functions import FuzzyMembershipFunction, TrapezoidFunction
+
+
+class IntervalType2Function(FuzzyMembershipFunction):
+    """
+    Interval type-2 membership function bounded by two trapezoids.
+
+    Membership degree of input point is interval between lower and upper
+      membership function; area between them is footprint of uncertainty.
+      Lower function may be scaled by ``lower_height``, as lower functions
+      often don't reach 1.
+
+    Trees mixing IntervalType2Functions with TNorm, SNorm and
+      StrongNegation are evaluated with ``interval`` and ``interval_batch``.
+      Plain call returns middle of interval, which is Nie-Tan approximation
+      of type-reduced degree.
+    """
+
+    upper: TrapezoidFunction
+    """Upper membership function."""
+    lower: TrapezoidFunction
+    """Lower membership function, before scaling by lower_height."""
+    lower_height: float
+    """Height of lower membership function."""
+
+    def __init__(
+            self,
+            upper: TrapezoidFunction,
+            lower: TrapezoidFunction,
+            lower_height: float = 1.
+    ) -> None:
+        """
+        Construct interval type-2 function from bounding functions.
+
+        :param upper: upper membership function.
+        :param lower: lower membership function.
+        :param lower_height: scale of lower membership function in (0;1].
+        :raises ValueError: when lower function exceeds upper one.
+        """
+        if not 0. < lower_height <= 1.:
+            raise ValueError('lower_height must be in range (0;1].')
+        self.upper = upper
+        self.lower = lower
+        self.lower_height = float(lower_height)
+        # Both functions are linear between vertices, so comparing them at
+        #  all vertices and infinities covers whole real line.
+        points = np.array(upper.vertices + lower.vertices
+                          + (float('-inf'), float('inf')))
+        points = np.unique(np.concatenate([
+            points[np.isfinite(points)], [float('-inf'), float('inf')]
+        ]))
+        lower_degrees, upper_degrees = self.interval_batch(points)
+        if np.any(lower_degrees > upper_degrees):
+            raise ValueError('Lower membership function exceeds upper one.')
+
+    def __call__(self, input_point: float) -> float:
+        """
+        Return middle of membership interval.
+
+        :param input_point: point in data-space.
+        :return: average of lower and upper membership degree.
+        """
+        lower, upper = self.interval(input_point)
+        return (lower + upper) / 2
+
+    def evaluate_batch(
+            self,
+            input_points,
+            out: Optional[np.ndarray] = None,
+            dtype=None,
+            workspace: Optional[Workspace] = None
+    ) -> np.ndarray:
+        input_points, out = prepare_batch(input_points, out, dtype)
+        workspace = workspace or Workspace()
+        self.lower.evaluate_batch(input_points, out=out, workspace=workspace)
+        np.multiply(out, self.lower_height, out=out)
+        with workspace.scratch(out.shape, out.dtype) as upper:
+            self.upper.evaluate_batch(input_points, out=upper,
+                                      workspace=workspace)
+            np.add(out, upper, out=out)
+        return np.divide(out, 2, out=out)
+
+    def interval(self, input_point: float) -> Tuple[float, float]:
+        """
+        Return interval of membership degree for given input point.
+
+        :param input_point: point in data-space.
+        :return: lower and upper membership degree.
+        """
+        return (self.lower_height * self.lower(input_point),
+                self.upper(input_point))
+
+    def interval_batch(self, input_points) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Return intervals of membership degrees for array of input points.
+
+        :param input_points: array-like of points in data-space.
+        :return: arrays of lower and upper membership degrees.
+        """
+        return (self.lower_height * self.lower.evaluate_batch(input_points),
+                self.upper.evaluate_batch(input_points))
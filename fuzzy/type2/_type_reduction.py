@@ -0,0 +1,81 @@
+"""
+Centroid type reduction of interval type-2 fuzzy sets.
+
+Centroid of interval type-2 set sampled at points ``x_1 <= ... <= x_M`` with
+  lower degrees ``l`` and upper degrees ``u`` is interval ``[y_l, y_r]``.
+  Karnik-Mendel algorithms look for switch point ``k`` such that
+    ``y_l = (sum_{i<=k} x_i u_i + sum_{i>k} x_i l_i)
+            / (sum_{i<=k} u_i + sum_{i>k} l_i)``
+  is minimal, and analogously maximal ``y_r`` with ``l`` and ``u`` swapped.
+  Iterative search for ``k`` branches differently for every sample. Here
+  the expression is instead computed for all switch points at once from
+  prefix sums, and minimum is taken, which gives exact Karnik-Mendel
+  result in ``O(M)`` vectorized operations per sample, without iterations.
+"""
+from typing import Tuple
+
+import numpy as np
+
+from fuzzy.operators._operators import Operatable
+
+
+def centroid_interval(
+        points,
+        lower,
+        upper
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Return centroid interval of interval type-2 sets.
+
+    :param points: array-like of shape ``(M,)`` of sampled domain points;
+      need not be sorted.
+    :param lower: lower degrees of shape ``(M,)`` or ``(N, M)`` for batch
+      of N sets.
+    :param upper: upper degrees of the same shape as lower.
+    :return: arrays ``y_l`` and ``y_r`` of shape ``()`` or ``(N,)``; NaN
+      for sets with all degrees equal to 0.
+    """
+    points = np.asarray(points, dtype=float)
+    order = np.argsort(points)
+    x = points[order]
+    lower = np.asarray(lower, dtype=float)[..., order]
+    upper = np.asarray(upper, dtype=float)[..., order]
+    left = _extreme_centroid(x, upper, lower, np.min)
+    right = _extreme_centroid(x, lower, upper, np.max)
+    return left, right
+
+
+def type_reduce(
+        operatable: Operatable,
+        points
+) -> Tuple[float, float, float]:
+    """
+    Type-reduce and defuzzify output of operator tree.
+
+    :param operatable: tree with interval type-2 or type-1 functions.
+    :param points: array-like of domain points to sample tree at.
+    :return: ``y_l``, ``y_r`` and crisp output ``(y_l + y_r) / 2``.
+    """
+    lower, upper = operatable.interval_batch(points)
+    left, right = centroid_interval(points, lower, upper)
+    return float(left), float(right), float((left + right) / 2)
+
+
+def _extreme_centroid(x, head, tail, select) -> np.ndarray:
+    # Switch point p means degrees from head for first p points and from
+    #  tail for remaining ones; p goes from 0 to M.
+    zeros = np.zeros(head.shape[:-1] + (1,))
+    head_weight = np.concatenate([zeros, np.cumsum(head, axis=-1)], axis=-1)
+    head_moment = np.concatenate([zeros, np.cumsum(head * x, axis=-1)],
+                                 axis=-1)
+    tail_weight = np.concatenate([zeros, np.cumsum(tail, axis=-1)], axis=-1)
+    tail_moment = np.concatenate([zeros, np.cumsum(tail * x, axis=-1)],
+                                 axis=-1)
+    weight = head_weight + (tail_weight[..., -1:] - tail_weight)
+    moment = head_moment + (tail_moment[..., -1:] - tail_moment)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        centroids = np.where(weight > 0, moment / weight, np.nan)
+    empty = np.all(np.isnan(centroids), axis=-1)
+    fill = np.inf if select is np.min else -np.inf
+    result = select(np.where(np.isnan(centroids), fill, centroids), axis=-1)
+    return np.where(empty, np.nan, result)
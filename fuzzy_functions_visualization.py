@@ -1,86 +1,177 @@
 """
 Use of matplotlib library to visualize single and codependent fuzzy functions.
+
+Functions and operator trees are drawn through their breakpoints (vertices
+  and crossing points of operator children), where piecewise linear output
+  changes slope, so every corner is exact and each curve needs only a few
+  points evaluated in one batch. Trees with hedges, which are curved between
+  breakpoints, and trees with membership functions of unknown shape, which
+  have no known breakpoints, are additionally sampled evenly over range and
+  inside every segment.
+
+Figures saved to file are created without pyplot, so plotting works
+  headless; format (PNG, SVG, PDF, ...) follows file extension. Single
+  functions and operators are shown in window when no file is given.
+
+Example of plotting many variables into one file:
+    python fuzzy_functions_visualization.py terms.svg
 """
+import sys
+from math import ceil
+from typing import Iterable, Mapping, Optional, Tuple
+
 import numpy as np
-import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
+from matplotlib.figure import Figure
 
-from functions import TrapezoidFunction
-from operators import TNorm, SNorm, StrongNegation
+from fuzzy.functions import (
+    TrapezoidFunction, InfiniteTrapezoidFunction, FuzzyMembershipFunction,
+    ConstantFunction
+)
+from fuzzy.operators import TNorm, SNorm, StrongNegation, Hedge, breakpoints
+from fuzzy.operators._operators import Operatable
+
+CURVE_SAMPLES = 16
+"""
+Points sampled over range and inside each segment between breakpoints of
+  curved trees.
+"""
+
+
+def plot_range(
+        operatables: Iterable[Operatable],
+        margin: float = 0.1
+) -> Tuple[float, float]:
+    """
+    Return range covering all finite vertices of given trees.
+
+    :param operatables: FuzzyMembershipFunctions or FuzzyOperators.
+    :param margin: fraction of vertex span added on both sides.
+    :return: lower and upper end of range.
+    """
+    vertices = np.concatenate(
+        [[]] + [_finite_vertices(operatable) for operatable in operatables]
+    )
+    if len(vertices) == 0:
+        return -1., 1.
+    lower, upper = vertices.min(), vertices.max()
+    padding = (upper - lower) * margin or 1.
+    return float(lower - padding), float(upper + padding)
+
+
+def plot_points(
+        operatable: Operatable,
+        lower: float,
+        upper: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Return points drawing operator tree exactly in given range.
+
+    :param operatable: FuzzyMembershipFunction or FuzzyOperator.
+    :param lower: start of range.
+    :param upper: end of range.
+    :return: arrays of input points and membership degrees.
+    """
+    points = breakpoints(operatable, lower, upper)
+    if _is_curved(operatable):
+        points = np.union1d(
+            points, np.linspace(lower, upper, CURVE_SAMPLES + 1)
+        )
+        steps = np.linspace(0., 1., CURVE_SAMPLES, endpoint=False)
+        points = np.append(
+            (points[:-1, None] + np.diff(points)[:, None] * steps).ravel(),
+            points[-1]
+        )
+    return points, operatable.evaluate_batch(points)
+
+
+def plot_terms(
+        axes,
+        terms: Mapping[str, Operatable],
+        lower: Optional[float] = None,
+        upper: Optional[float] = None,
+        labels: bool = True
+) -> None:
+    """
+    Draw terms of one variable into given matplotlib axes.
+
+    All curves are added as single LineCollection, which keeps drawing
+      variables with hundreds of terms fast.
+
+    :param axes: matplotlib axes.
+    :param terms: mapping of term names to trees.
+    :param lower: start of range; computed from vertices when omitted.
+    :param upper: end of range; computed from vertices when omitted.
+    :param labels: whether to draw legend with term names.
+    """
+    if lower is None or upper is None:
+        lower, upper = plot_range(terms.values())
+    segments = [np.column_stack(plot_points(term, lower, upper))
+                for term in terms.values()]
+    colors = [f'C{i % 10}' for i in range(len(segments))]
+    axes.add_collection(LineCollection(segments, colors=colors))
+    axes.set_xlim(lower, upper)
+    axes.set_ylim(-0.05, 1.05)
+    if labels and terms:
+        handles = [axes.plot([], [], color=color)[0] for color in colors]
+        axes.legend(handles, list(terms), fontsize='small')
+
+
+def render_variables(
+        variables: Mapping[str, Mapping[str, Operatable]],
+        path: str,
+        columns: int = 4,
+        panel_size: Tuple[float, float] = (4., 2.5),
+        labels: bool = True
+) -> None:
+    """
+    Draw terms of many variables into grid of panels and save it to file.
+
+    :param variables: mapping of variable names to mappings of term names to
+      trees.
+    :param path: destination file; its extension selects format.
+    :param columns: maximal number of panels in one row.
+    :param panel_size: width and height of single panel in inches.
+    :param labels: whether to draw legends with term names.
+    """
+    columns = max(1, min(columns, len(variables)))
+    rows = max(1, ceil(len(variables) / columns))
+    figure = Figure(figsize=(panel_size[0] * columns, panel_size[1] * rows),
+                    layout='constrained')
+    axes = figure.subplots(rows, columns, squeeze=False).ravel()
+    for panel, (name, terms) in zip(axes, variables.items()):
+        plot_terms(panel, terms, labels=labels)
+        panel.set_title(name)
+    for panel in axes[len(variables):]:
+        panel.set_axis_off()
+    figure.savefig(path)
 
 
 def visualize_fuzzy_trapezoid_functions(
-        fuzz_funct: TrapezoidFunction
+        fuzz_funct: TrapezoidFunction,
+        path: Optional[str] = None
 ) -> None:
     """
     Visualize given trapezoid fuzzy membership function.
 
     :param fuzz_funct: trapezoid fuzzy membership function for visualization
+    :param path: destination file, its extension selects format; figure is
+      shown when omitted.
     """
-    figure = plt.figure()
-    axes1 = figure.add_axes([0.1, 0.1, 0.9, 0.9])
-    input_space_flat = np.linspace(-0.5, fuzz_funct.lower_boundary)
-    input_space_asc = np.linspace(
-        fuzz_funct.lower_boundary,
-        fuzz_funct.min_full_boundary
-    )
-    input_space_high_plateau = np.linspace(
-        fuzz_funct.min_full_boundary,
-        fuzz_funct.max_full_boundary
-    )
-    input_space_desc = np.linspace(
-        fuzz_funct.max_full_boundary,
-        fuzz_funct.upper_boundary
-    )
-    input_space_end_flat = np.linspace(
-        fuzz_funct.upper_boundary,
-        1.5
-    )
-    output_space_flat = np.array(
-        [fuzz_funct(in_point) for in_point in input_space_flat]
-    )
-    output_space_asc = np.array(
-        [fuzz_funct(in_point) for in_point in input_space_asc]
-    )
-    output_space_plateau = np.array(
-        [fuzz_funct(in_point) for in_point in input_space_high_plateau]
-    )
-    output_space_desc = np.array(
-        [fuzz_funct(in_point) for in_point in input_space_desc]
-    )
-    output_space_end_flat = np.array(
-        [fuzz_funct(in_point) for in_point in input_space_end_flat]
-    )
-    input_space = np.concatenate(
-        [input_space_flat,
-         input_space_asc,
-         input_space_high_plateau,
-         input_space_desc,
-         input_space_end_flat])
-    output_space = np.concatenate(
-        [output_space_flat,
-         output_space_asc,
-         output_space_plateau,
-         output_space_desc,
-         output_space_end_flat])
-    axes1.plot(input_space, output_space)
-    axes1.scatter([
-        fuzz_funct.lower_boundary,
-        fuzz_funct.min_full_boundary,
-        fuzz_funct.max_full_boundary,
-        fuzz_funct.upper_boundary
-    ], [
-        fuzz_funct(fuzz_funct.lower_boundary),
-        fuzz_funct(fuzz_funct.min_full_boundary),
-        fuzz_funct(fuzz_funct.max_full_boundary),
-        fuzz_funct(fuzz_funct.upper_boundary)
-    ], color='navy')
-    figure.show()
+    figure = _create_figure(path)
+    axes1 = figure.add_subplot()
+    plot_terms(axes1, {'': fuzz_funct}, labels=False)
+    vertices = _finite_vertices(fuzz_funct)
+    axes1.scatter(vertices, fuzz_funct.evaluate_batch(vertices),
+                  color='navy')
+    _output_figure(figure, path)
 
 
 def visualize_fuzzy_operators(
         fuzz_funct1: TrapezoidFunction,
         fuzz_funct2: TrapezoidFunction,
-        fuzz_funct3: TrapezoidFunction
+        fuzz_funct3: TrapezoidFunction,
+        path: Optional[str] = None
 ) -> None:
     """
     Visualize given trapezoid fuzzy operators.
@@ -91,18 +182,52 @@ def visualize_fuzzy_operators(
     :param fuzz_funct1: trapezoid fuzzy membership function for visualization
     :param fuzz_funct2: trapezoid fuzzy membership function for visualization
     :param fuzz_funct3: trapezoid fuzzy membership function for visualization
+    :param path: destination file, its extension selects format; figure is
+      shown when omitted.
     """
-    figure = plt.figure()
-    axes1 = figure.add_axes([0.1, 0.1, 0.9, 0.9])
+    figure = _create_figure(path)
+    axes1 = figure.add_subplot()
     fuzz_funct = SNorm(TNorm(fuzz_funct1, StrongNegation(fuzz_funct2)),
                        fuzz_funct3)
-    input_space = np.linspace(-1, 2.5, num=500)
+    plot_terms(axes1, {'equation': fuzz_funct}, labels=False)
+    _output_figure(figure, path)
+
+
+def _create_figure(path: Optional[str]) -> Figure:
+    # Only shown figures need pyplot and interactive backend.
+    if path is None:
+        import matplotlib.pyplot as plt
+        return plt.figure()
+    return Figure()
+
 
-    output_space = np.array(
-        [fuzz_funct(in_point) for in_point in input_space]
+def _output_figure(figure: Figure, path: Optional[str]) -> None:
+    if path is None:
+        figure.show()
+    else:
+        figure.savefig(path)
+
+
+def _finite_vertices(operatable: Operatable) -> np.ndarray:
+    if isinstance(operatable, TrapezoidFunction):
+        vertices = np.array(operatable.vertices, dtype=float)
+        return vertices[np.isfinite(vertices)]
+    if isinstance(operatable, FuzzyMembershipFunction):
+        return np.empty(0)
+    return np.concatenate(
+        [[]] + [_finite_vertices(child) for child in operatable.functions]
     )
-    axes1.plot(input_space, output_space)
-    figure.show()
+
+
+def _is_curved(operatable: Operatable) -> bool:
+    if isinstance(operatable, Hedge):
+        return True
+    # Shapes of other membership functions are unknown; they are sampled.
+    if isinstance(operatable, FuzzyMembershipFunction):
+        return not isinstance(operatable,
+                              (TrapezoidFunction, ConstantFunction))
+    return any(_is_curved(child) for child in operatable.functions)
+
 
 if __name__ == '__main__':
     _function = TrapezoidFunction(-0.25, 0.5, 0.75, 1.1)
@@ -111,7 +236,21 @@ if __name__ == '__main__':
     _function1 = TrapezoidFunction(-0.25, 0.0, 0.75, 1.1)
     _function2 = TrapezoidFunction(-0.25, 0.5, 0.75, 1.1)
     _function3 = TrapezoidFunction(-0.1, 0.1, 0.2, 0.3)
-    visualize_fuzzy_trapezoid_functions(_function1)
-    visualize_fuzzy_trapezoid_functions(_function2)
-    visualize_fuzzy_trapezoid_functions(_function3)
     visualize_fuzzy_operators(_function1, _function2, _function3)
+
+    _variables = {}
+    for _variable in range(20):
+        _width = 1. + _variable % 5
+        _terms = {'low': InfiniteTrapezoidFunction(0., _width, 'left')}
+        for _term in range(1, 24):
+            _start = _term * _width
+            _terms[f't{_term}'] = TrapezoidFunction(
+                _start - _width, _start, _start + _width / 2,
+                _start + 1.5 * _width
+            )
+        _terms['high'] = InfiniteTrapezoidFunction(
+            24 * _width, 25 * _width, 'right'
+        )
+        _variables[f'variable{_variable}'] = _terms
+    render_variables(_variables, sys.argv[1] if len(sys.argv) > 1
+                     else 'variables.png', labels=False)
@@ -0,0 +1,72 @@
+"""
+Benchmark of cold-start import cost of package entry points.
+
+Each entry point is imported in fresh interpreter several times; table shows
+  best import time and whether NumPy or matplotlib got loaded by it.
+
+    python fuzzy_import_benchmark.py [repeats]
+"""
+import os
+import subprocess
+import sys
+from typing import Tuple
+
+ENTRY_POINTS = (
+    'import fuzzy',
+    'from fuzzy.functions import TrapezoidFunction',
+    'from fuzzy.operators import TNorm, Very',
+    'from fuzzy.sets import FuzzySet',
+    'from fuzzy.functions import TrapezoidBank',
+    'from fuzzy.operators import breakpoints',
+    'from fuzzy.batch import Workspace',
+    'from fuzzy.rules import RuleBase',
+    'from fuzzy.lookup import LookupTable',
+    'from fuzzy.fitting import TrapezoidFitter',
+    'from fuzzy.type2 import IntervalType2Function',
+    'from fuzzy.serve import InferenceServer',
+    'import fuzzy_functions_visualization',
+)
+"""Import statements measured by benchmark."""
+
+_PROBE = '''
+import sys, time
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+print(elapsed, 'numpy' in sys.modules, 'matplotlib' in sys.modules)
+'''
+
+
+def measure(statement: str, repeats: int = 5) -> Tuple[float, bool, bool]:
+    """
+    Return best time of statement in fresh interpreters and loaded backends.
+
+    :param statement: import statement.
+    :param repeats: number of interpreters to start.
+    :return: seconds, whether NumPy and whether matplotlib was imported.
+    :raises subprocess.CalledProcessError: when statement fails.
+    """
+    directory = os.path.dirname(os.path.abspath(__file__))
+    best = None
+    for _ in range(repeats):
+        output = subprocess.run(
+            [sys.executable, '-c', _PROBE.format(statement=statement)],
+            cwd=directory, capture_output=True, text=True, check=True
+        ).stdout.split()
+        elapsed = float(output[0])
+        best = elapsed if best is None else min(best, elapsed)
+    return best, output[1] == 'True', output[2] == 'True'
+
+
+if __name__ == '__main__':
+    _repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    print(f'{"entry point":<48} {"ms":>8}  numpy  matplotlib')
+    for _statement in ENTRY_POINTS:
+        try:
+            _elapsed, _numpy, _matplotlib = measure(_statement, _repeats)
+        except subprocess.CalledProcessError:
+            print(f'{_statement:<48} {"failed":>8}')
+            continue
+        print(f'{_statement:<48} {_elapsed * 1000:8.2f}  '
+              f'{"yes" if _numpy else "no":<5}  '
+              f'{"yes" if _matplotlib else "no"}')
@@ -0,0 +1,86 @@
+"""
+Tests for zero-copy input buffers and evaluation over memory-mapped files.
+
+  - Typed and raw buffers are wrapped without copying
+  - Batch evaluation accepts buffer-protocol objects
+  - Chunked evaluation of raw float file equals evaluation of whole array,
+    files without values give empty results
+"""
+import array
+
+import numpy as np
+import pytest
+
+from fuzzy.batch import as_input_array, evaluate_mmap
+from fuzzy.functions import TrapezoidFunction, InfiniteTrapezoidFunction
+from fuzzy.rules import RuleBase
+
+
+def test_buffers_are_not_copied() -> None:
+    values = array.array('d', [0.5, 1.5, 2.5])
+    points = as_input_array(values)
+    values[0] = 7.
+    assert points[0] == 7.
+    raw = bytearray(np.array([1., 2.], dtype='<f4').tobytes())
+    points = as_input_array(memoryview(raw), dtype='<f4')
+    assert points.dtype == np.float32 and points.tolist() == [1., 2.]
+    assert np.shares_memory(points, np.frombuffer(raw, dtype=np.uint8))
+    single = np.arange(4, dtype=np.float32)
+    assert as_input_array(single) is single
+    assert as_input_array([1, 2]).dtype == np.float64
+
+
+def test_batch_evaluation_accepts_buffers() -> None:
+    funct = TrapezoidFunction(0, 1, 2, 3)
+    values = np.linspace(-1, 4, 51)
+    expected = funct.evaluate_batch(values)
+    assert np.array_equal(funct.evaluate_batch(values.tobytes()), expected)
+    assert np.array_equal(
+        funct.evaluate_batch(array.array('d', values.tolist())), expected
+    )
+    assert np.array_equal(funct.evaluate_batch(memoryview(values)), expected)
+
+
+def test_evaluate_mmap(tmp_path) -> None:
+    cold = InfiniteTrapezoidFunction(5, 15, 'left')
+    warm = TrapezoidFunction(10, 18, 24, 30)
+    rule_base = RuleBase({'cold': cold & ~warm, 'warm': warm | cold})
+    values = np.linspace(-10, 50, 10001)
+    path = str(tmp_path / 'values.f4')
+    header = b'HEADER__'
+    with open(path, 'wb') as file:
+        file.write(header + values.astype('<f4').tobytes())
+    expected = rule_base.evaluate_batch(values.astype('<f4'))
+    results = evaluate_mmap(rule_base, path, dtype='<f4',
+                            offset=len(header), chunk_size=999)
+    assert np.array_equal(results, expected)
+
+    out = np.memmap(str(tmp_path / 'results.f8'), dtype='<f8', mode='w+',
+                    shape=(100, 2))
+    evaluate_mmap(rule_base, path, dtype='<f4', offset=len(header),
+                  count=100, chunk_size=32, out=out)
+    assert np.array_equal(out, expected[:100])
+    single = evaluate_mmap(warm, path, dtype='<f4', offset=len(header),
+                           out_dtype=np.float32)
+    assert single.dtype == np.float32 and single.shape == (10001,)
+
+    empty = str(tmp_path / 'empty.f8')
+    open(empty, 'wb').close()
+    assert evaluate_mmap(rule_base, empty).shape == (0, 2)
+    assert evaluate_mmap(warm, path, offset=len(header) + 40004).shape == (0,)
+    out = np.empty((0, 2))
+    assert evaluate_mmap(rule_base, empty, out=out) is out
+
+
+def test_evaluate_mmap_rejects_wrong_out(tmp_path) -> None:
+    warm = TrapezoidFunction(10, 18, 24, 30)
+    rule_base = RuleBase({'warm': warm, 'not warm': ~warm})
+    path = str(tmp_path / 'values.f8')
+    np.linspace(0, 40, 50).tofile(path)
+    for out in (np.empty(51), np.empty(49), np.empty((50, 3)), np.empty(())):
+        with pytest.raises(ValueError):
+            evaluate_mmap(rule_base if out.ndim == 2 else warm, path, out=out)
+    empty = str(tmp_path / 'empty.f8')
+    open(empty, 'wb').close()
+    with pytest.raises(ValueError):
+        evaluate_mmap(rule_base, empty, out=np.empty((0, 3)))
@@ -0,0 +1,106 @@
+"""
+Tests for dtype, ``out`` buffers and Workspace in batch evaluation.
+
+  - Results written to out are equal to freshly allocated ones
+  - float32 results are close to float64 ones
+  - Reused Workspace allocates no scratch arrays after first call
+  - Buffers of wrong shape or dtype, or aliasing inputs are rejected
+"""
+import numpy as np
+import pytest
+
+from fuzzy.batch import Workspace, prepare_batch
+from fuzzy.functions import (
+    TrapezoidFunction, TriangularFunction, InfiniteTrapezoidFunction,
+    ConstantFunction, TrapezoidBank
+)
+from fuzzy.operators import Very, Intensify, Diminish
+from fuzzy.rules import RuleBase
+from fuzzy.type2 import IntervalType2Function
+
+
+def _create_systems():
+    cold = InfiniteTrapezoidFunction(5, 15, 'left')
+    warm = TrapezoidFunction(10, 18, 24, 30)
+    hot = InfiniteTrapezoidFunction(25, 35, 'right')
+    mild = TriangularFunction(12, 20, 28)
+    trees = [
+        warm, cold, hot, ConstantFunction(0.3),
+        cold | (mild & ~warm),
+        Very(warm) & Intensify(~hot) | Diminish(mild),
+        IntervalType2Function(TrapezoidFunction(8, 16, 26, 32), warm, 0.8),
+    ]
+    rule_base = RuleBase({f'rule{i}': tree
+                          for i, tree in enumerate(trees[:-1])})
+    bank = TrapezoidBank([cold.vertices, warm.vertices, hot.vertices])
+    return trees, rule_base, bank
+
+
+def test_out_equals_allocated_results() -> None:
+    trees, rule_base, bank = _create_systems()
+    values = np.linspace(-10, 50, 601)
+    workspace = Workspace()
+    for system in trees + [rule_base, bank]:
+        expected = system.evaluate_batch(values)
+        out = np.full(expected.shape, np.nan)
+        result = system.evaluate_batch(values, out=out, workspace=workspace)
+        assert result is out
+        assert np.array_equal(out, expected)
+
+
+def test_float32_results() -> None:
+    trees, rule_base, bank = _create_systems()
+    values = np.linspace(-10, 50, 601)
+    for system in trees + [rule_base, bank]:
+        expected = system.evaluate_batch(values)
+        result = system.evaluate_batch(values, dtype=np.float32)
+        assert result.dtype == np.float32
+        assert np.allclose(result, expected, atol=1e-5)
+        result = system.evaluate_batch(values.astype(np.float32),
+                                       dtype=np.float32)
+        assert np.allclose(result, expected, atol=1e-5)
+
+
+def test_steady_state_allocates_nothing() -> None:
+    trees, rule_base, _ = _create_systems()
+    values = np.linspace(-10, 50, 1000)
+    workspace = Workspace()
+    out = np.empty((len(values), len(rule_base)), dtype=np.float32)
+    rule_base.evaluate_batch(values, out=out, workspace=workspace)
+    tree_out = np.empty(len(values), dtype=np.float32)
+    for tree in trees:
+        tree.evaluate_batch(values, out=tree_out, workspace=workspace)
+    allocations = workspace.allocations
+    for _ in range(3):
+        rule_base.evaluate_batch(values, out=out, workspace=workspace)
+        for tree in trees:
+            tree.evaluate_batch(values, out=tree_out, workspace=workspace)
+    assert workspace.allocations == allocations
+
+
+def test_prepare_batch_rejects_wrong_buffers() -> None:
+    values = np.linspace(0, 1, 5)
+    points, out = prepare_batch([0, 1, 2])
+    assert points.dtype == np.float64 and out.shape == (3,)
+    with pytest.raises(ValueError):
+        prepare_batch(values, out=np.empty(4))
+    with pytest.raises(ValueError):
+        prepare_batch(values, out=np.empty(5, dtype=np.float32),
+                      dtype=np.float64)
+    with pytest.raises(ValueError):
+        prepare_batch(values, dtype=np.int64)
+    with pytest.raises(ValueError):
+        prepare_batch(values, out=np.empty((5, 3)), trailing=(2,))
+
+
+def test_out_aliasing_input_is_rejected() -> None:
+    tree = TriangularFunction(0, 1, 2) | TriangularFunction(1, 2, 3)
+    values = np.linspace(0, 3, 7)
+    with pytest.raises(ValueError):
+        tree.evaluate_batch(values, out=values)
+    with pytest.raises(ValueError):
+        Very(~tree).evaluate_batch(values, out=values[::-1])
+    points = np.concatenate([values, np.empty(7)])
+    # Disjoint views of one buffer are accepted.
+    tree.evaluate_batch(points[:7], out=points[7:])
+    assert np.allclose(points[7:], [0, .5, 1, .5, 1, .5, 0])
@@ -0,0 +1,103 @@
+"""
+Tests for analytic gradients and TrapezoidFitter.
+
+  - Analytic gradients match finite differences
+  - Gradients through operators match finite differences of tree output
+  - Fitting recovers vertices of known function
+  - Fitting step evaluates each function once
+  - Fitted functions keep vertex ordering invariants
+"""
+import numpy as np
+
+from fuzzy.functions import (
+    TrapezoidFunction, TriangularFunction, InfiniteTrapezoidFunction
+)
+from fuzzy.fitting import (
+    TrapezoidFitter, trapezoid_gradients, tree_gradients
+)
+
+
+def _numeric_gradient(funct, target, x, eps=1e-6):
+    gradient = []
+    vertices = funct.vertices
+    for i in range(4):
+        if not np.isfinite(vertices[i]):
+            gradient.append(0.)
+            continue
+        shifted = list(vertices)
+        shifted[i] += eps
+        funct.vertices = tuple(shifted)
+        upper = target.evaluate_batch(x).sum()
+        shifted[i] -= 2 * eps
+        funct.vertices = tuple(shifted)
+        lower = target.evaluate_batch(x).sum()
+        funct.vertices = vertices
+        gradient.append((upper - lower) / (2 * eps))
+    return np.array(gradient)
+
+
+def test_trapezoid_gradients_match_finite_differences() -> None:
+    # Points avoid vertices, where degree is not differentiable.
+    x = np.linspace(-1.013, 4.017, 101)
+    for funct in [TrapezoidFunction(0, 1, 2, 3),
+                  InfiniteTrapezoidFunction(0.5, 2.5, 'left'),
+                  InfiniteTrapezoidFunction(0.5, 2.5, 'right')]:
+        degrees, gradients = trapezoid_gradients(funct, x)
+        assert np.array_equal(degrees, funct.evaluate_batch(x))
+        assert np.allclose(gradients.sum(axis=0),
+                           _numeric_gradient(funct, funct, x), atol=1e-4)
+
+
+def test_tree_gradients_match_finite_differences() -> None:
+    f1 = TrapezoidFunction(0, 1, 2, 3)
+    f2 = TrapezoidFunction(1.5, 2.5, 3, 4)
+    f3 = TrapezoidFunction(-1, -0.5, 0.5, 1.2)
+    tree = (f1 & ~f2) | f3
+    x = np.linspace(-1.013, 4.017, 101)
+    output, gradients = tree_gradients(tree, x)
+    assert np.array_equal(output, tree.evaluate_batch(x))
+    for funct in (f1, f2, f3):
+        assert np.allclose(gradients[id(funct)],
+                           _numeric_gradient(funct, tree, x), atol=1e-4)
+
+
+def test_fitter_recovers_trapezoid() -> None:
+    target = TrapezoidFunction(-1., 0.5, 1.5, 3.)
+    fitted = TrapezoidFunction(-0.5, 0., 2., 2.5)
+    x = np.random.default_rng(0).uniform(-3, 5, 20000)
+    fitter = TrapezoidFitter([fitted], learning_rate=0.5, batch_size=256,
+                             seed=0)
+    history = fitter.fit(x, target.evaluate_batch(x), epochs=20)
+    assert history[-1] < history[0]
+    assert np.allclose(fitted.vertices, target.vertices, atol=0.05)
+
+
+def test_step_evaluates_functions_once() -> None:
+    f1 = TrapezoidFunction(0, 1, 2, 3)
+    f2 = TrapezoidFunction(1.5, 2.5, 3, 4)
+    calls = []
+    for funct in (f1, f2):
+        evaluate = funct.evaluate_batch
+        funct.evaluate_batch = lambda *args, evaluate=evaluate, **kwargs: (
+            calls.append(args) or evaluate(*args, **kwargs)
+        )
+    fitter = TrapezoidFitter([f1 & ~f2])
+    x = np.linspace(-1, 5, 50)
+    target = np.full(50, 0.5)
+    loss = fitter.loss(x, target)
+    del calls[:]
+    assert fitter.step(x, target) == loss
+    assert len(calls) == 2
+
+
+def test_fitter_keeps_invariants() -> None:
+    triangle = TriangularFunction(0, 1, 2)
+    left = InfiniteTrapezoidFunction(0, 1, 'left')
+    fitter = TrapezoidFitter([triangle | left], learning_rate=50.,
+                             batch_size=64, seed=1)
+    x = np.random.default_rng(1).uniform(-1, 3, 1000)
+    fitter.fit(x, np.random.default_rng(2).uniform(0, 1, 1000), epochs=3)
+    a, b, c, d = triangle.vertices
+    assert a < b == c < d
+    assert left.lower_boundary == left.min_full_boundary == float('-inf')
+    assert left.max_full_boundary < left.upper_boundary
@@ -0,0 +1,108 @@
+"""
+Tests for QuantileSketch and PartitionFitter.
+
+  - Sketch quantiles have small rank error and bounded memory
+  - Rank error stays within documented 2.5 / k over many seeds
+  - Merged sketches of shards match sketch of whole stream
+  - Fitted partitions have expected term types and quantile vertices
+  - Invalid arguments and degenerate data raise ValueError
+"""
+import numpy as np
+import pytest
+
+from fuzzy.functions import (
+    InfiniteTrapezoidFunction, TrapezoidFunction, TriangularFunction
+)
+from fuzzy.fitting import QuantileSketch, PartitionFitter, partition_levels
+
+
+def _rank_error(data, levels, quantiles) -> float:
+    ranks = np.searchsorted(np.sort(data), quantiles) / len(data)
+    return float(np.abs(ranks - levels).max())
+
+
+def test_sketch_quantiles() -> None:
+    data = np.random.default_rng(0).lognormal(size=200_000)
+    sketch = QuantileSketch(k=200, seed=1)
+    for chunk in np.array_split(data, 100):
+        sketch.update(chunk)
+    sketch.update([np.nan])
+    levels = np.linspace(0.01, 0.99, 99)
+    assert len(sketch) == len(data)
+    assert sketch.retained < 1000
+    assert _rank_error(data, levels, sketch.quantile(levels)) < 0.03
+    assert sketch.quantile(0) == data.min()
+    assert sketch.quantile(1) == data.max()
+    with pytest.raises(ValueError):
+        sketch.quantile(1.5)
+    with pytest.raises(ValueError):
+        QuantileSketch().quantile(0.5)
+
+
+def test_sketch_error_bound() -> None:
+    k = 64
+    levels = np.linspace(0, 1, 201)[1:-1]
+    for seed in range(20):
+        data = np.random.default_rng(seed).normal(size=20_000)
+        sketch = QuantileSketch(k=k, seed=seed)
+        for chunk in np.array_split(data, 50):
+            sketch.update(chunk)
+        assert _rank_error(data, levels, sketch.quantile(levels)) < 2.5 / k
+
+
+def test_merged_shards() -> None:
+    data = np.random.default_rng(2).normal(size=100_000)
+    shards = []
+    for seed, shard in enumerate(np.array_split(data, 8)):
+        sketch = QuantileSketch(k=200, seed=seed)
+        sketch.update(shard)
+        shards.append(sketch)
+    merged = shards[0]
+    for sketch in shards[1:]:
+        merged.merge(sketch)
+    levels = np.linspace(0.05, 0.95, 19)
+    assert len(merged) == len(data)
+    assert merged.retained < 1000
+    assert _rank_error(data, levels, merged.quantile(levels)) < 0.03
+    with pytest.raises(ValueError):
+        merged.merge(QuantileSketch(k=100))
+
+
+def test_fitted_partition() -> None:
+    data = np.random.default_rng(3).uniform(0, 100, size=50_000)
+    fitter = PartitionFitter(terms=4, plateau=0.5, seed=0)
+    other = PartitionFitter(terms=4, plateau=0.5, seed=1)
+    fitter.update(data[:25_000])
+    other.update(data[25_000:])
+    partition = fitter.merge(other).partition()
+    types = [type(term) for term in partition.terms]
+    assert types == [InfiniteTrapezoidFunction, TrapezoidFunction,
+                     TrapezoidFunction, InfiniteTrapezoidFunction]
+    assert partition.terms[0].infinite_side == 'left'
+    shared = partition.knots[1:-1]
+    assert np.allclose(shared, partition_levels(4, 0.5) * 100, atol=3)
+    degrees = np.stack([term.evaluate_batch(data) for term in partition])
+    assert np.allclose(degrees.sum(axis=0), 1)
+
+    triangular = PartitionFitter(terms=3, plateau=0.)
+    triangular.update(data)
+    assert type(triangular.functions()[1]) is TriangularFunction
+
+
+def test_explicit_levels_and_errors() -> None:
+    fitter = PartitionFitter(levels=[0.1, 0.3, 0.6, 0.9])
+    fitter.update(np.arange(1000.))
+    assert fitter.vertices()[1].tolist() == pytest.approx(
+        [100, 300, 600, 900], abs=10)
+    with pytest.raises(ValueError):
+        PartitionFitter(levels=[0.1, 0.3, 0.2])
+    with pytest.raises(ValueError):
+        PartitionFitter(levels=[0.3, 0.1])
+    with pytest.raises(ValueError):
+        PartitionFitter(terms=1)
+    with pytest.raises(ValueError):
+        PartitionFitter(plateau=1.)
+    discrete = PartitionFitter(terms=5)
+    discrete.update(np.repeat([1., 2.], 500))
+    with pytest.raises(ValueError):
+        discrete.partition()
@@ -0,0 +1,54 @@
+"""
+Unit tests for vectorized ``evaluate_batch`` of membership functions
+  and operators:
+  1. Results are equal to scalar calls for every function type.
+  1. Results keep shape of input.
+  1. Infinite inputs are handled like in scalar calls.
+"""
+import numpy as np
+
+from fuzzy.functions import (
+    InfiniteTrapezoidFunction, TriangularFunction, ConstantFunction
+)
+from fuzzy.operators import StrongNegation, TNorm, SNorm
+
+from tests.fuzzy.functions.function.test_trapezoid_call import \
+    create_random_trapezoid_function, create_random_triangular_function
+
+
+def assert_batch_equals_scalar(funct, values) -> None:
+    expected = np.array([funct(v) for v in values])
+    assert np.array_equal(funct.evaluate_batch(values), expected)
+
+
+def test_batch_equals_scalar_for_membership_functions() -> None:
+    values = np.concatenate([np.linspace(-200, 400, 1001),
+                             [float('-inf'), float('inf')]])
+    for _ in range(5):
+        funct = create_random_trapezoid_function()
+        assert_batch_equals_scalar(funct, values)
+        vertices = [funct.lower_boundary, funct.min_full_boundary,
+                    funct.max_full_boundary, funct.upper_boundary]
+        assert_batch_equals_scalar(funct, vertices)
+        assert_batch_equals_scalar(create_random_triangular_function(),
+                                   values)
+    assert_batch_equals_scalar(InfiniteTrapezoidFunction(0, 1, 'left'),
+                               values)
+    assert_batch_equals_scalar(InfiniteTrapezoidFunction(0, 1, 'right'),
+                               values)
+    assert_batch_equals_scalar(ConstantFunction(0.3), values)
+
+
+def test_batch_equals_scalar_for_operators() -> None:
+    values = np.linspace(-200, 400, 1001)
+    f1, f2, f3 = (create_random_trapezoid_function() for _ in range(3))
+    assert_batch_equals_scalar(SNorm(TNorm(f1, StrongNegation(f2)), f3),
+                               values)
+    assert_batch_equals_scalar(TNorm(f1, f2, f3), values)
+
+
+def test_batch_keeps_shape() -> None:
+    funct = TriangularFunction(0, 1, 2)
+    values = np.linspace(-1, 3, 12).reshape(3, 4)
+    assert funct.evaluate_batch(values).shape == (3, 4)
+    assert (~funct).evaluate_batch(values).shape == (3, 4)
@@ -0,0 +1,95 @@
+"""
+Unit tests for TrapezoidBank:
+  1. Invalid rows raise ValueError naming them, also under ``python -O``.
+  1. NaN rows and rows which can't be materialized are rejected.
+  1. Infinite sides follow TrapezoidFunction conventions.
+  1. Records of all supported kinds build the same bank.
+  1. Batch evaluation equals materialized functions.
+"""
+import numpy as np
+import pytest
+
+from fuzzy.functions import (
+    TrapezoidBank, TrapezoidFunction, InfiniteTrapezoidFunction,
+    TriangularFunction
+)
+
+INF = float('inf')
+
+ROWS = [
+    (0., 1., 2., 3.),
+    (-INF, -INF, 0., 1.),
+    (0., 1., INF, INF),
+    (-1., 0., 0., 1.),
+    (-INF, -INF, INF, INF),
+]
+
+
+def test_invalid_rows_are_named() -> None:
+    rows = ROWS + [(0., -1., 2., 3.), (0., 1., 2., 3.), (-INF, 0., 1., 2.),
+                   (0., 1., 2., INF), (0., 2., 1., 3.)]
+    with pytest.raises(ValueError) as error:
+        TrapezoidBank(rows)
+    message = str(error.value)
+    assert 'in 4 rows' in message
+    for row in (5, 7, 8, 9):
+        assert f'row {row} ' in message
+    assert 'row 6 ' not in message
+
+
+def test_nan_and_unbuildable_rows() -> None:
+    nan = float('nan')
+    with pytest.raises(ValueError) as error:
+        TrapezoidBank([(0., nan, 2., 3.)])
+    assert 'vertex is NaN' in str(error.value)
+    assert 'lower_boundary' not in str(error.value)
+    for row in ((-INF, -INF, -INF, 5.), (0., INF, INF, INF)):
+        with pytest.raises(ValueError, match='infinite row'):
+            TrapezoidBank([row])
+    # Every accepted row can be materialized.
+    bank = TrapezoidBank(ROWS)
+    assert len(list(bank)) == len(ROWS)
+
+
+def test_invalid_shape_and_lengths() -> None:
+    with pytest.raises(ValueError):
+        TrapezoidBank(np.zeros((3, 3)))
+    with pytest.raises(ValueError):
+        TrapezoidBank.from_arrays([0, 1], [1, 2], [2, 3], [3])
+
+
+def test_records_of_all_kinds() -> None:
+    bank = TrapezoidBank(ROWS)
+    columns = np.array(ROWS).T
+    from_arrays = TrapezoidBank.from_arrays(*columns)
+    names = ['lower_boundary', 'min_full_boundary', 'max_full_boundary',
+             'upper_boundary']
+    from_mappings = TrapezoidBank.from_records(
+        [dict(zip(names, row)) for row in ROWS]
+    )
+    structured = np.array(ROWS, dtype=[(name, float) for name in names])
+    from_structured = TrapezoidBank.from_records(structured)
+    for other in (from_arrays, from_mappings, from_structured):
+        assert np.array_equal(bank.vertices, other.vertices)
+
+
+def test_lazy_materialization() -> None:
+    bank = TrapezoidBank(ROWS)
+    assert len(bank) == 5
+    assert type(bank[0]) is TrapezoidFunction
+    assert type(bank[1]) is InfiniteTrapezoidFunction
+    assert bank[1].infinite_side == 'left'
+    assert bank[2].infinite_side == 'right'
+    assert type(bank[3]) is TriangularFunction
+    assert bank[-1] is bank[4]
+
+
+def test_batch_equals_materialized_functions() -> None:
+    bank = TrapezoidBank(ROWS)
+    values = np.concatenate([np.linspace(-2, 4, 121), [-INF, INF]])
+    expected = np.array([[f.evaluate_batch(v) for f in bank]
+                         for v in values])
+    assert np.array_equal(bank.evaluate_batch(values), expected)
+    # Scalar call of both-infinite row gives NaN at inf; batch gives 0.
+    scalar = np.array([[f(v) for f in bank] for v in values[:-1]])
+    assert np.array_equal(bank.evaluate_batch(values[:-1]), scalar)
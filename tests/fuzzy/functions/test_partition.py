@@ -0,0 +1,62 @@
+"""
+Unit tests for Partition:
+  1. Terms not overlapping exactly are rejected.
+  1. Scalar and batch degrees equal degrees of terms.
+  1. Degrees sum to 1 inside partition.
+  1. Infinite outer terms cover whole real line.
+"""
+import numpy as np
+import pytest
+
+from fuzzy.functions import (
+    Partition, TrapezoidFunction, TriangularFunction,
+    InfiniteTrapezoidFunction
+)
+
+
+def _create_partition() -> Partition:
+    return Partition([
+        InfiniteTrapezoidFunction(0, 1, 'left'),
+        TriangularFunction(0, 1, 3),
+        TrapezoidFunction(1, 3, 4, 6),
+        InfiniteTrapezoidFunction(4, 6, 'right'),
+    ])
+
+
+def test_wrong_partitions() -> None:
+    with pytest.raises(ValueError):
+        Partition([])
+    with pytest.raises(ValueError):
+        Partition([TriangularFunction(0, 1, 2), TriangularFunction(1, 2.5, 3)])
+    with pytest.raises(ValueError):
+        Partition([TriangularFunction(0, 1, 2), TriangularFunction(0.5, 2, 3)])
+
+
+def test_partition_degrees_equal_terms() -> None:
+    partition = _create_partition()
+    values = np.concatenate([np.linspace(-3, 9, 1201), partition.knots[1:-1],
+                             [float('-inf'), float('inf')]])
+    expected = np.array([[term(v) for term in partition] for v in values])
+    matrix = partition.membership_matrix(values)
+    assert np.allclose(matrix, expected)
+    assert np.allclose(matrix.sum(axis=1), 1.)
+    for value, row in zip(values, expected):
+        pairs = partition(value)
+        assert 1 <= len(pairs) <= 2
+        dense = np.zeros(len(partition))
+        for index, degree in pairs:
+            assert degree > 0
+            dense[index] = degree
+        assert np.allclose(dense, row)
+
+
+def test_partition_outside_finite_terms() -> None:
+    partition = Partition([TriangularFunction(0, 1, 2),
+                           TriangularFunction(1, 2, 3)])
+    assert partition(-1.) == []
+    assert partition(0.5) == [(0, 0.5)]
+    assert partition(1.25) == [(0, 0.75), (1, 0.25)]
+    assert partition(2.5) == [(1, 0.5)]
+    indices, degrees = partition.evaluate_batch([-1., 0.5, 2.5, 5.])
+    assert np.array_equal(indices[:, 0], [0, 0, 1, 1])
+    assert np.allclose(degrees, [[0, 0], [0.5, 0], [0.5, 0], [0, 0]])
@@ -0,0 +1,115 @@
+"""
+Tests for LookupTable compilation, interpolation and storage.
+
+  - Tables of trapezoid operator trees are exact
+  - Interpolation error at points checked during compilation is within
+    estimated error, which is within requested bound
+  - Queries outside of grid are clamped
+  - Systems with several outputs are rejected; their rules compile
+  - Saved tables load back memory-mapped with identical results
+"""
+import numpy as np
+import pytest
+
+from fuzzy.functions import (
+    TrapezoidFunction, TriangularFunction, InfiniteTrapezoidFunction
+)
+from fuzzy.lookup import LookupTable, compile_lookup_table
+from fuzzy.operators import breakpoints
+from fuzzy.rules import RuleBase
+
+from tests.fuzzy.functions.function.test_trapezoid_call import \
+    create_random_trapezoid_function
+
+
+def test_breakpoints_contain_vertices_and_crossings() -> None:
+    f1 = TriangularFunction(0, 1, 2)
+    f2 = TriangularFunction(1, 2, 3)
+    points = breakpoints(f1 | f2, -1, 4)
+    assert np.allclose(points, [-1, 0, 1, 1.5, 2, 3, 4])
+
+
+def test_operator_tree_table_is_exact() -> None:
+    f1, f2, f3 = (create_random_trapezoid_function() for _ in range(3))
+    tree = (f1 & ~f2) | f3
+    table = compile_lookup_table(tree, (-150, 450), max_error=1e-9)
+    values = np.random.uniform(-150, 450, 10000)
+    assert np.allclose(table.evaluate_batch(values),
+                       tree.evaluate_batch(values), atol=1e-9)
+    assert table.estimated_error <= 1e-9
+
+
+def test_nonlinear_system_within_error_bound() -> None:
+    temperature = TrapezoidFunction(10, 15, 20, 25)
+    humidity = InfiniteTrapezoidFunction(0.3, 0.6, 'right')
+
+    def system(t, h):
+        return np.sqrt(temperature.evaluate_batch(t)
+                       * humidity.evaluate_batch(h))
+
+    table = compile_lookup_table(system, [(0, 40), (0, 1)], max_error=1e-2,
+                                 breakpoints=[temperature, humidity])
+    assert table.ndim == 2
+    assert table.estimated_error <= 1e-2
+    # Error is bounded only at points checked during compilation: nodes or
+    #  quarter points of grid intervals along each axis.
+    rng = np.random.default_rng(0)
+    samples = []
+    for axis in table.axes:
+        indices = rng.integers(len(axis) - 1, size=100000)
+        fractions = rng.choice([0, 0.25, 0.5, 0.75], size=100000)
+        samples.append(axis[indices] + np.diff(axis)[indices] * fractions)
+    t, h = samples
+    error = np.abs(table.evaluate_batch(t, h) - system(t, h))
+    assert error.max() <= table.estimated_error + 1e-12
+
+
+def test_three_dimensional_table() -> None:
+    def system(x, y, z):
+        return x * y * (1 - z)
+
+    table = compile_lookup_table(system, [(0, 1)] * 3, max_error=1e-9)
+    assert table(0.2, 0.5, 0.9) == pytest.approx(0.01)
+
+
+def test_queries_are_clamped() -> None:
+    table = LookupTable([np.array([0., 1.])], np.array([0.25, 0.75]), 0.)
+    assert table(-5.) == 0.25
+    assert table(5.) == 0.75
+    assert table(0.5) == pytest.approx(0.5)
+
+
+def test_rule_base_needs_table_for_each_rule() -> None:
+    f1, f2 = (create_random_trapezoid_function() for _ in range(2))
+    rule_base = RuleBase({'both': f1 & f2, 'either': f1 | f2})
+    with pytest.raises(TypeError):
+        compile_lookup_table(rule_base, (-150, 450))
+    table = compile_lookup_table(rule_base['either'], (-150, 450),
+                                 max_error=1e-9)
+    values = np.random.uniform(-150, 450, 1000)
+    assert np.allclose(table.evaluate_batch(values),
+                       rule_base.evaluate_batch(values)[:, 1], atol=1e-9)
+
+
+def test_unreachable_error_raises() -> None:
+    with pytest.raises(ValueError):
+        compile_lookup_table(lambda x: np.sin(100 * x), (0, 10),
+                             max_error=1e-12, max_points=64)
+
+
+def test_save_and_mmap_load(tmp_path) -> None:
+    def system(x, y):
+        return x * y
+
+    table = compile_lookup_table(system, [(0, 1), (0, 2)], max_error=1e-3)
+    path = str(tmp_path / 'table.bin')
+    table.save(path)
+    assert [file.name for file in tmp_path.iterdir()] == ['table.bin']
+    loaded = LookupTable.load(path)
+    assert isinstance(loaded.values, np.memmap) or \
+        isinstance(loaded.values.base, np.memmap)
+    assert loaded.estimated_error == table.estimated_error
+    x = np.random.uniform(0, 1, 100)
+    y = np.random.uniform(0, 2, 100)
+    assert np.array_equal(loaded.evaluate_batch(x, y),
+                          table.evaluate_batch(x, y))
@@ -0,0 +1,104 @@
+"""
+Tests for linguistic hedges.
+
+  - Scalar and batched hedges give equal degrees
+  - Nested powers are merged by ``**``
+  - Intensify and Diminish are inverse to each other
+  - RuleBase fuses hedges into instructions with unchanged outputs
+  - Gradients through hedges match finite differences
+"""
+import numpy as np
+import pytest
+
+from fuzzy.functions import TrapezoidFunction, ConstantFunction
+from fuzzy.operators import (
+    Power, Very, Somewhat, Intensify, Diminish, StrongNegation, power
+)
+from fuzzy.fitting import tree_gradients
+from fuzzy.rules import RuleBase
+
+
+def _create_hedges(funct):
+    return [Very(funct), Somewhat(funct), Power(funct, 3.),
+            Intensify(funct), Diminish(funct), Very(~Intensify(funct))]
+
+
+def test_scalar_equals_batch() -> None:
+    funct = TrapezoidFunction(0, 2, 3, 6)
+    values = np.linspace(-1, 7, 161)
+    for hedge in _create_hedges(funct):
+        expected = [hedge(value) for value in values]
+        assert np.allclose(hedge.evaluate_batch(values), expected)
+
+
+def test_power_values() -> None:
+    funct = TrapezoidFunction(0, 2, 3, 6)
+    assert Very(funct)(1.) == pytest.approx(0.25)
+    assert Somewhat(funct)(1.) == pytest.approx(0.5 ** 0.5)
+    with pytest.raises(ValueError):
+        Power(funct, 0)
+
+
+def test_power_merging() -> None:
+    funct = TrapezoidFunction(0, 2, 3, 6)
+    merged = (funct ** 2) ** 3
+    assert isinstance(merged, Power)
+    assert merged.functions[0] is funct
+    assert merged.exponent == 6
+    assert (funct ** 2) ** 0.5 is funct
+    assert power(funct, 1) is funct
+    assert isinstance(ConstantFunction(0.5) ** 2, ConstantFunction)
+    assert isinstance(((~funct) ** 2).functions[0], StrongNegation)
+
+
+def test_intensify_diminish_inverse() -> None:
+    funct = TrapezoidFunction(0, 2, 3, 6)
+    values = np.linspace(-1, 7, 161)
+    degrees = funct.evaluate_batch(values)
+    assert np.allclose(Intensify(Diminish(funct)).evaluate_batch(values),
+                       degrees)
+    assert np.allclose(Diminish(Intensify(funct)).evaluate_batch(values),
+                       degrees)
+
+
+def test_rule_base_fuses_hedges(tmp_path) -> None:
+    warm = TrapezoidFunction(10, 18, 24, 30)
+    hot = TrapezoidFunction(20, 30, 40, 50)
+    rules = {
+        'plain': warm & ~hot,
+        'hedged': Very(warm) & Somewhat(~Intensify(hot)) ** 4,
+        'cancelled': ~~Diminish(warm) ** 0.5 ** 2,
+    }
+    rule_base = RuleBase(rules)
+    lengths = np.diff(rule_base.offsets)
+    assert lengths.tolist() == [3, 3, 1]
+    values = np.linspace(0, 60, 241)
+    outputs = rule_base.evaluate_batch(values)
+    for column, rule in enumerate(rules.values()):
+        assert np.allclose(outputs[:, column], rule.evaluate_batch(values))
+
+    path = str(tmp_path / 'hedges.bin')
+    rule_base.save(path)
+    loaded = RuleBase.load(path)
+    assert np.array_equal(loaded.evaluate_batch(values), outputs)
+    assert np.allclose(loaded['hedged'].evaluate_batch(values),
+                       rules['hedged'].evaluate_batch(values))
+
+
+def test_gradients_through_hedges() -> None:
+    funct = TrapezoidFunction(0, 2, 3, 6)
+    x = np.linspace(-0.97, 6.93, 97)
+    for hedge in _create_hedges(funct):
+        _, gradients = tree_gradients(hedge, x)
+        vertices = funct.vertices
+        for i in range(4):
+            shifted = list(vertices)
+            shifted[i] += 1e-6
+            funct.vertices = tuple(shifted)
+            upper = hedge.evaluate_batch(x).sum()
+            shifted[i] -= 2e-6
+            funct.vertices = tuple(shifted)
+            lower = hedge.evaluate_batch(x).sum()
+            funct.vertices = vertices
+            assert gradients[id(funct)][i] == pytest.approx(
+                (upper - lower) / 2e-6, rel=1e-4, abs=1e-4)
@@ -0,0 +1,115 @@
+"""
+Tests for building operator trees with ``&``, ``|`` and ``~``.
+
+  - Operators build the same trees as explicit constructors
+  - Nested operators of same type are flattened into single n-ary node
+  - Double negation is removed
+  - Constant 0/1 operands are folded
+  - Degrees out of range and non-positive exponents raise ValueError,
+    also when operand is constant
+  - Unsupported operand types return NotImplemented
+"""
+import numpy as np
+import pytest
+
+from fuzzy.functions import ConstantFunction, TriangularFunction
+from fuzzy.operators import StrongNegation, TNorm, SNorm, power
+
+from tests.fuzzy.functions.function.test_trapezoid_call import \
+    create_random_trapezoid_function
+
+
+def test_operators_equal_explicit_tree() -> None:
+    f1 = create_random_trapezoid_function()
+    f2 = create_random_trapezoid_function()
+    f3 = create_random_trapezoid_function()
+    explicit = SNorm(TNorm(f1, StrongNegation(f2)), f3)
+    overloaded = (f1 & ~f2) | f3
+    for v in np.linspace(-100, 500, 200):
+        assert explicit(v) == overloaded(v)
+
+
+def test_chained_operators_are_flattened() -> None:
+    f1, f2, f3, f4 = (create_random_trapezoid_function() for _ in range(4))
+    conj = f1 & f2 & f3 & f4
+    assert type(conj) is TNorm
+    assert conj.functions == [f1, f2, f3, f4]
+    disj = f1 | (f2 | (f3 | f4))
+    assert type(disj) is SNorm
+    assert disj.functions == [f1, f2, f3, f4]
+    mixed = (f1 & f2) | (f3 & f4)
+    assert type(mixed) is SNorm
+    assert all(type(f) is TNorm for f in mixed.functions)
+
+
+def test_flattening_does_not_modify_operands() -> None:
+    f1, f2, f3 = (create_random_trapezoid_function() for _ in range(3))
+    inner = f1 & f2
+    outer = inner & f3
+    assert inner.functions == [f1, f2]
+    assert outer.functions == [f1, f2, f3]
+
+
+def test_double_negation_is_removed() -> None:
+    funct = TriangularFunction(0, 1, 2)
+    assert ~~funct is funct
+    neg = ~funct
+    assert type(neg) is StrongNegation
+    assert ~neg is funct
+
+
+def test_constants_are_folded() -> None:
+    funct = TriangularFunction(0, 1, 2)
+    assert (funct & 1) is funct
+    assert (1 & funct) is funct
+    assert (funct | 0.) is funct
+    zero = funct & 0
+    assert isinstance(zero, ConstantFunction) and zero(0.5) == 0.
+    one = 1. | funct
+    assert isinstance(one, ConstantFunction) and one(0.5) == 1.
+    neg_const = ~ConstantFunction(0.25)
+    assert isinstance(neg_const, ConstantFunction)
+    assert neg_const.value == 0.75
+
+
+def test_non_trivial_constants_are_reduced() -> None:
+    funct = TriangularFunction(0, 1, 2)
+    conj = funct & 0.3 & 0.6
+    assert len(conj.functions) == 2
+    assert conj(1.) == 0.3
+    disj = 0.3 | funct | 0.6
+    assert disj(3.) == 0.6
+
+
+def test_invalid_constants_raise() -> None:
+    funct = TriangularFunction(0, 1, 2)
+    for build in (lambda: funct & 2, lambda: -0.5 | funct,
+                  lambda: (funct & 0) & 2, lambda: funct | float('nan'),
+                  lambda: ConstantFunction(0.5) ** -1,
+                  lambda: power(ConstantFunction(0), -1),
+                  lambda: funct ** 0):
+        with pytest.raises(ValueError):
+            build()
+
+
+def test_unsupported_operands_return_not_implemented() -> None:
+    class Other:
+        def __rand__(self, other):
+            return 'and'
+
+        def __ror__(self, other):
+            return 'or'
+
+        def __rpow__(self, other):
+            return 'pow'
+
+    funct = TriangularFunction(0, 1, 2)
+    for operand in (funct, ~funct):
+        assert operand & Other() == 'and'
+        assert operand | Other() == 'or'
+        assert operand ** Other() == 'pow'
+        assert operand.__and__('text') is NotImplemented
+        with pytest.raises(TypeError):
+            operand & 'text'
+    mixed = funct & ~funct
+    assert type(mixed) is TNorm and mixed.functions[0] is funct
@@ -0,0 +1,174 @@
+"""
+Tests for sliding-window operators.
+
+  - Streaming evaluation equals naive aggregation of last degrees
+  - Batched evaluation equals streaming evaluation of each series
+  - OWA special weights reduce to maximum, minimum and mean
+  - Window operators compose with other operators, also under short
+    circuiting TNorm and SNorm, and can't be shared within tree
+  - Intervals of type-2 degrees are aggregated bound-wise, in streaming
+    and batched evaluation; quantifiers take extremes over interval
+  - Invalid windows and weights raise ValueError
+"""
+import numpy as np
+import pytest
+
+from fuzzy.functions import (
+    TrapezoidFunction, InfiniteTrapezoidFunction, TriangularFunction
+)
+from fuzzy.operators import (
+    WindowMin, WindowMax, WindowOWA, WindowQuantifier, StrongNegation, TNorm
+)
+from fuzzy.type2 import IntervalType2Function
+
+HIGH = TrapezoidFunction(0, 2, 3, 6)
+MOST = InfiniteTrapezoidFunction(0.3, 0.8, 'right')
+
+
+def _create_operators(size):
+    weights = np.linspace(1, 0, size)
+    return [WindowMin(HIGH, size), WindowMax(HIGH, size),
+            WindowOWA(HIGH, weights / weights.sum()),
+            WindowOWA.from_quantifier(HIGH, size, MOST),
+            WindowQuantifier(HIGH, size, MOST)]
+
+
+def test_streaming_equals_naive() -> None:
+    values = np.random.default_rng(0).uniform(-1, 7, 200)
+    degrees = HIGH.evaluate_batch(values)
+    minimum, maximum, owa, _, most = _create_operators(5)
+    for i, value in enumerate(values):
+        window = degrees[max(0, i - 4):i + 1]
+        assert minimum(value) == window.min()
+        assert maximum(value) == window.max()
+        assert most(value) == pytest.approx(MOST(window.mean()))
+        result = owa(value)
+        if len(window) == 5:
+            ordered = np.sort(window)[::-1]
+            assert result == pytest.approx(ordered @ owa.weights)
+    most.reset()
+    assert most(values[0]) == MOST(degrees[0])
+
+
+@pytest.mark.parametrize('size', [1, 4, 50, 300])
+def test_batch_equals_streaming(size) -> None:
+    series = np.random.default_rng(size).uniform(-1, 7, (3, 120))
+    for operator in _create_operators(size):
+        batch = operator.evaluate_batch(series)
+        for row, expected in zip(series, batch):
+            operator.reset()
+            streamed = [operator(value) for value in row]
+            assert np.allclose(streamed, expected, atol=1e-12)
+        single = operator.evaluate_batch(series, dtype=np.float32)
+        assert single.dtype == np.float32
+        assert np.allclose(single, batch, atol=1e-6)
+
+
+def test_owa_special_weights() -> None:
+    values = np.random.default_rng(1).uniform(-1, 7, 50)
+    for weights, reference in (([1, 0, 0, 0], WindowMax(HIGH, 4)),
+                               ([0, 0, 0, 1], WindowMin(HIGH, 4))):
+        owa = WindowOWA(HIGH, weights)
+        assert np.allclose(owa.evaluate_batch(values),
+                           reference.evaluate_batch(values))
+    mean = WindowOWA(HIGH, [0.25] * 4).evaluate_batch(values)
+    degrees = HIGH.evaluate_batch(values)
+    assert mean[-1] == pytest.approx(degrees[-4:].mean())
+    assert mean[1] == pytest.approx(degrees[:2].mean())
+
+
+def test_composition() -> None:
+    values = np.random.default_rng(2).uniform(-1, 7, 30)
+    operator = ~WindowQuantifier(HIGH, 3, MOST)
+    assert isinstance(operator, StrongNegation)
+    streamed = [operator(value) for value in values]
+    assert np.allclose(operator.evaluate_batch(values), streamed)
+
+
+def test_invalid_arguments() -> None:
+    with pytest.raises(ValueError):
+        WindowMin(HIGH, 0)
+    with pytest.raises(ValueError):
+        WindowOWA(HIGH, [0.5, 0.6])
+    with pytest.raises(ValueError):
+        WindowOWA(HIGH, [1.5, -0.5])
+    with pytest.raises(ValueError):
+        WindowOWA.from_quantifier(HIGH, 4, StrongNegation(MOST))
+
+
+def test_nested_under_short_circuiting_operators() -> None:
+    values = [2.5, -5, -5, 1.0, 8, 8, 2.5, 4]
+    gate = TrapezoidFunction(0, 1, 10, 11)
+    for operator in (gate & WindowMax(HIGH, 3),
+                     ~gate | WindowMin(HIGH, 3),
+                     (gate | ~gate) & WindowQuantifier(HIGH, 3, MOST)):
+        streamed = [operator(value) for value in values]
+        assert np.allclose(operator.evaluate_batch(values), streamed)
+
+
+def test_shared_window_rejected() -> None:
+    window = WindowMax(HIGH, 3)
+    for tree in (window & window, window | ~(window & HIGH),
+                 ~(~window & HIGH) | ~(~window & HIGH)):
+        with pytest.raises(ValueError):
+            tree(1.)
+    shared = WindowMin(HIGH, 3)
+    with pytest.raises(ValueError):
+        (shared | shared).interval(1.)
+    # Batched evaluation keeps no state, so sharing is harmless there.
+    assert np.allclose((window & window).evaluate_batch([1., 2.]),
+                       window.evaluate_batch([1., 2.]))
+
+
+def test_shared_subtrees_build_in_linear_time() -> None:
+    tree = HIGH
+    for _ in range(64):
+        tree = TNorm(tree, tree)
+    assert not tree._stateful
+    windowed = WindowMin(HIGH, 2)
+    for _ in range(64):
+        windowed = TNorm(windowed, HIGH)
+    assert windowed(2.5) == 1.
+
+
+def test_interval_degrees() -> None:
+    funct = IntervalType2Function(upper=HIGH,
+                                  lower=TriangularFunction(1, 2.5, 4),
+                                  lower_height=0.8)
+    half = TriangularFunction(0.2, 0.5, 0.8)
+    values = np.random.default_rng(3).uniform(-1, 7, 60)
+    lower, upper = funct.interval_batch(values)
+    minimum, maximum, owa, most, about_half = (
+        WindowMin(funct, 4), WindowMax(funct, 4),
+        WindowOWA(funct, [0.4, 0.3, 0.2, 0.1]),
+        WindowQuantifier(funct, 4, MOST), WindowQuantifier(funct, 4, half)
+    )
+    weights = np.array([0.4, 0.3, 0.2, 0.1])
+    for operator in (minimum, maximum, owa, most, about_half):
+        bounds = operator.interval_batch(values)
+        assert np.all(bounds[0] <= bounds[1])
+        for i, value in enumerate(values):
+            window = slice(max(0, i - 3), i + 1)
+            streamed = operator.interval(value)
+            assert streamed == pytest.approx((bounds[0][i], bounds[1][i]))
+            if i < 3:
+                continue
+            if operator is minimum:
+                expected = lower[window].min(), upper[window].min()
+            elif operator is maximum:
+                expected = lower[window].max(), upper[window].max()
+            elif operator is owa:
+                expected = (np.sort(lower[window])[::-1] @ weights,
+                            np.sort(upper[window])[::-1] @ weights)
+            else:
+                quantifier = operator.quantifier
+                proportions = [lower[window].mean(), upper[window].mean()]
+                if proportions[0] < 0.5 < proportions[1]:
+                    proportions.append(0.5)
+                degrees = [quantifier(p) for p in proportions]
+                expected = min(degrees), max(degrees)
+            assert streamed == pytest.approx(expected)
+    # Plain calls don't share windows with intervals.
+    assert minimum(values[0]) == funct(values[0])
+    minimum.reset()
+    assert minimum.interval(values[0]) == (lower[0], upper[0])
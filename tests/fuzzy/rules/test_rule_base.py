@@ -0,0 +1,150 @@
+"""
+Tests for RuleBase compilation and binary format.
+
+  - Rule base outputs equal outputs of operator trees
+  - Trees rebuilt from tape equal original trees
+  - Saved rule bases load memory-mapped with identical outputs and names
+  - Plain and clamped terms with infinite side keep their degrees at
+    infinite values, also after save and load
+  - Version 1 files are still readable
+  - Files of other kinds or versions are rejected
+"""
+import struct
+
+import numpy as np
+import pytest
+
+from fuzzy.functions import (
+    TrapezoidFunction, TriangularFunction, InfiniteTrapezoidFunction,
+    ConstantFunction
+)
+from fuzzy.operators import TNorm
+from fuzzy.rules import RuleBase
+
+from tests.fuzzy.functions.function.test_trapezoid_call import \
+    create_random_trapezoid_function
+
+
+def _create_rule_base() -> RuleBase:
+    cold = InfiniteTrapezoidFunction(5, 15, 'left')
+    warm = TrapezoidFunction(10, 18, 24, 30)
+    hot = InfiniteTrapezoidFunction(25, 35, 'right')
+    mild = TriangularFunction(12, 20, 28)
+    return RuleBase({
+        'heat': cold | (mild & ~warm),
+        'cool': hot & ~cold,
+        'keep': TNorm(warm, ConstantFunction(0.8)),
+        'idle': ~(warm | hot),
+    }, terms={'cold': cold, 'warm': warm, 'hot': hot})
+
+
+def test_rule_base_outputs_equal_trees() -> None:
+    rule_base = _create_rule_base()
+    values = np.concatenate([np.linspace(-10, 50, 601),
+                             [float('-inf'), float('inf')]])
+    outputs = rule_base.evaluate_batch(values)
+    assert outputs.shape == (len(values), 4)
+    for column, name in enumerate(rule_base.names):
+        tree = rule_base[name]
+        assert np.array_equal(outputs[:, column], tree.evaluate_batch(values))
+    assert rule_base(20.) == outputs[np.argmax(values == 20.)].tolist()
+
+
+def test_term_names_and_sharing() -> None:
+    rule_base = _create_rule_base()
+    assert len(rule_base.vertices) == 4
+    assert sorted(rule_base.term_names) == ['', 'cold', 'hot', 'warm']
+
+
+def test_unsupported_nodes() -> None:
+    class Custom(TNorm):
+        pass
+
+    with pytest.raises(TypeError):
+        RuleBase({'rule': Custom(create_random_trapezoid_function(),
+                                 create_random_trapezoid_function())})
+
+
+def test_save_and_load(tmp_path) -> None:
+    rule_base = _create_rule_base()
+    path = str(tmp_path / 'model.bin')
+    rule_base.save(path)
+    values = np.linspace(-10, 50, 601)
+    for mmap in (True, False):
+        loaded = RuleBase.load(path, mmap=mmap)
+        assert isinstance(loaded.vertices, np.memmap) == mmap
+        assert loaded.names == rule_base.names
+        assert loaded.term_names == rule_base.term_names
+        assert np.array_equal(loaded.evaluate_batch(values),
+                              rule_base.evaluate_batch(values))
+        rebuilt = loaded['heat']
+        assert np.array_equal(rebuilt.evaluate_batch(values),
+                              rule_base['heat'].evaluate_batch(values))
+
+
+def test_infinite_terms_keep_class(tmp_path) -> None:
+    inf = float('inf')
+    terms = [TrapezoidFunction(-inf, -inf, 0, 1),
+             InfiniteTrapezoidFunction(0, 1, 'left'),
+             TrapezoidFunction(0, 1, inf, inf),
+             InfiniteTrapezoidFunction(0, 1, 'right')]
+    rule_base = RuleBase({f'rule{i}': term for i, term in enumerate(terms)})
+    path = str(tmp_path / 'infinite.bin')
+    rule_base.save(path)
+    loaded = RuleBase.load(path)
+    values = [-inf, -1., 0.5, 2., inf]
+    expected = np.stack([term.evaluate_batch(values) for term in terms],
+                        axis=1)
+    assert expected[0].tolist() == [0., 1., 0., 0.]
+    for candidate in (rule_base, loaded):
+        assert np.array_equal(candidate.evaluate_batch(values), expected)
+        assert [type(term) for term in candidate.terms] == \
+            [type(term) for term in terms]
+
+
+def test_large_rule_base_round_trip(tmp_path) -> None:
+    terms = [create_random_trapezoid_function() for _ in range(200)]
+    rules = {f'rule{i}': terms[i % 200] & ~terms[(7 * i) % 200]
+             for i in range(2000)}
+    rule_base = RuleBase(rules)
+    path = str(tmp_path / 'large.bin')
+    rule_base.save(path)
+    loaded = RuleBase.load(path)
+    values = np.linspace(-100, 400, 50)
+    assert np.array_equal(loaded.evaluate_batch(values),
+                          rule_base.evaluate_batch(values))
+
+
+def test_rejects_other_files(tmp_path) -> None:
+    path = tmp_path / 'other.bin'
+    path.write_bytes(b'not a rule base')
+    with pytest.raises(ValueError):
+        RuleBase.load(str(path))
+    path.write_bytes(struct.pack('<4sI12Q', b'FZRB', 99, *[0] * 12))
+    with pytest.raises(ValueError):
+        RuleBase.load(str(path))
+
+
+def test_load_version_1(tmp_path) -> None:
+    warm = TrapezoidFunction(10, 18, 24, 30)
+    vertices = np.array([warm.vertices], dtype=float)
+    constants = np.zeros(0)
+    tape = np.array([[0, 0], [4, 0]], dtype='<i4')
+    offsets = np.array([0, 2], dtype='<i8')
+    names = b'{"rules": ["cool"], "terms": ["warm"]}'
+    arrays = [vertices, constants, tape, offsets]
+    layout = []
+    position = struct.calcsize('<4sI10Q')
+    for array in arrays:
+        layout += [position, len(array)]
+        position += array.nbytes
+    layout += [position, len(names)]
+    path = tmp_path / 'v1.bin'
+    path.write_bytes(struct.pack('<4sI10Q', b'FZRB', 1, *layout)
+                     + b''.join(array.tobytes() for array in arrays) + names)
+    loaded = RuleBase.load(str(path))
+    values = np.linspace(0, 40, 81)
+    assert np.array_equal(loaded.evaluate_batch(values)[:, 0],
+                          (~warm).evaluate_batch(values))
+    assert np.array_equal(loaded['cool'].evaluate_batch(values),
+                          (~warm).evaluate_batch(values))
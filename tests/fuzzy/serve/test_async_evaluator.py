@@ -0,0 +1,61 @@
+"""
+Tests for AsyncEvaluator.
+
+  - Results equal scalar evaluation of system
+  - Concurrent requests are grouped into batches bounded by max size
+  - Lone requests are served after max wait
+  - Errors of system are propagated to all requests of batch
+"""
+import asyncio
+
+import numpy as np
+import pytest
+
+from fuzzy.functions import TriangularFunction
+from fuzzy.serve import AsyncEvaluator
+
+
+def test_results_equal_scalar_calls() -> None:
+    system = TriangularFunction(0, 1, 2) | TriangularFunction(1, 2, 3)
+    values = np.linspace(-1, 4, 100).tolist()
+
+    async def run():
+        async with AsyncEvaluator(system, max_batch_size=16) as evaluator:
+            results = await asyncio.gather(
+                *(evaluator.evaluate(v) for v in values)
+            )
+        return results, evaluator.statistics
+
+    results, statistics = asyncio.run(run())
+    assert results == [system(v) for v in values]
+    assert statistics.requests == 100
+    assert statistics.batches == 7
+    assert statistics.largest_batch == 16
+    assert statistics.max_pending == 16
+    assert statistics.pending == 0 and statistics.in_flight == 0
+    assert statistics.mean_batch_size == pytest.approx(100 / 7)
+
+
+def test_lone_request_waits_at_most_max_wait() -> None:
+    system = TriangularFunction(0, 1, 2)
+
+    async def run():
+        async with AsyncEvaluator(system, max_wait=0.01) as evaluator:
+            return await asyncio.wait_for(evaluator.evaluate(0.5), 1.)
+
+    assert asyncio.run(run()) == 0.5
+
+
+def test_errors_are_propagated() -> None:
+    class Failing:
+        def evaluate_batch(self, values):
+            raise RuntimeError('failed')
+
+    async def run():
+        async with AsyncEvaluator(Failing(), max_batch_size=2) as evaluator:
+            return await asyncio.gather(evaluator.evaluate(1.),
+                                        evaluator.evaluate(2.),
+                                        return_exceptions=True)
+
+    results = asyncio.run(run())
+    assert all(isinstance(r, RuntimeError) for r in results)
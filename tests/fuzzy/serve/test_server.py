@@ -0,0 +1,175 @@
+"""
+Tests for InferenceServer, its protocol and clients on localhost.
+
+  - Results received over TCP and Unix sockets equal local evaluation
+  - Connections are persistent and pooled
+  - Stale Unix sockets are replaced, other files are kept
+  - Errors are reported without closing connection or dropping it from
+    pool, and are raised by load generator
+  - Load generator reports throughput and latency percentiles
+"""
+import asyncio
+import socket
+import subprocess
+import sys
+import threading
+from contextlib import contextmanager
+
+import numpy as np
+import pytest
+
+from fuzzy.functions import TrapezoidFunction, TriangularFunction
+from fuzzy.rules import RuleBase
+from fuzzy.serve import (
+    Client, ConnectionPool, InferenceServer, ProtocolError, parse_address,
+    run_load
+)
+
+
+def _create_rule_base() -> RuleBase:
+    low = TriangularFunction(-1, 0, 1)
+    high = TrapezoidFunction(0, 1, 2, 3)
+    return RuleBase({'low': low, 'high': high, 'between': low & high})
+
+
+@contextmanager
+def _running_server(system, address):
+    loop = asyncio.new_event_loop()
+    server = InferenceServer(system, workers=2)
+    loop.run_until_complete(server.start(address))
+    thread = threading.Thread(target=loop.run_forever)
+    thread.start()
+    try:
+        yield server
+    finally:
+        asyncio.run_coroutine_threadsafe(server.close(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+
+def test_parse_address() -> None:
+    assert parse_address('unix:/tmp/x.sock') == '/tmp/x.sock'
+    assert parse_address('localhost:80') == ('localhost', 80)
+    assert parse_address(':80') == ('127.0.0.1', 80)
+
+
+def test_tcp_results_equal_local_evaluation() -> None:
+    rule_base = _create_rule_base()
+    values = np.linspace(-2, 4, 101)
+    with _running_server(rule_base, ('127.0.0.1', 0)) as server:
+        with Client(server.address) as client:
+            for _ in range(3):
+                assert np.array_equal(client.evaluate(values),
+                                      rule_base.evaluate_batch(values))
+        assert server.requests == 3
+
+
+def test_empty_batch_round_trip() -> None:
+    with _running_server(_create_rule_base(), ('127.0.0.1', 0)) as server:
+        with Client(server.address) as client:
+            assert client.evaluate([]).shape == (0, 3)
+            assert client.evaluate([0.5]).shape == (1, 3)
+    with _running_server(TriangularFunction(-1, 0, 1),
+                         ('127.0.0.1', 0)) as server:
+        with Client(server.address) as client:
+            assert client.evaluate([]).shape == (0, 1)
+
+
+def test_unix_socket_and_pool(tmp_path) -> None:
+    rule_base = _create_rule_base()
+    path = str(tmp_path / 'fuzzy.sock')
+    with _running_server(rule_base, path):
+        with ConnectionPool(path, size=2) as pool:
+            results = [pool.evaluate([0.5, 1.5]) for _ in range(5)]
+            assert len(pool._all) == 1
+        assert all(np.array_equal(r, rule_base.evaluate_batch([0.5, 1.5]))
+                   for r in results)
+
+
+def test_unix_socket_path_replaces_only_sockets(tmp_path) -> None:
+    path = str(tmp_path / 'stale.sock')
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(path)
+    stale.close()
+    with _running_server(_create_rule_base(), path):
+        with Client(path) as client:
+            assert client.evaluate([0.5]).shape == (1, 3)
+
+    regular = tmp_path / 'data.txt'
+    regular.write_text('keep')
+    server = InferenceServer(_create_rule_base())
+    with pytest.raises(FileExistsError):
+        asyncio.run(server.start(str(regular)))
+    assert regular.read_text() == 'keep'
+
+
+class _Failing:
+    def evaluate_batch(self, values):
+        if len(values) > 1:
+            raise ValueError('too many')
+        return values * 2
+
+
+def test_errors_keep_connection_open() -> None:
+    with _running_server(_Failing(), ('127.0.0.1', 0)) as server:
+        with Client(server.address) as client:
+            with pytest.raises(ProtocolError, match='too many'):
+                client.evaluate([1., 2.])
+            assert client.evaluate([1.5]).tolist() == [[3.]]
+        with ConnectionPool(server.address, size=1) as pool:
+            with pytest.raises(ProtocolError):
+                pool.evaluate([1., 2.])
+            with pool.connection() as first:
+                pass
+            with pytest.raises(ProtocolError):
+                pool.evaluate([1., 2.])
+            with pool.connection() as second:
+                assert second is first
+                assert second.evaluate([1.5]).tolist() == [[3.]]
+            # Failure inside borrowed connection discards it.
+            with pytest.raises(KeyboardInterrupt):
+                with pool.connection():
+                    raise KeyboardInterrupt
+            assert pool._all == []
+            with pool.connection() as third:
+                assert third is not first
+
+
+def test_load_generator() -> None:
+    with _running_server(_create_rule_base(), ('127.0.0.1', 0)) as server:
+        report = run_load(server.address, requests=50, batch_size=16,
+                          concurrency=4)
+    assert report['requests'] == 50
+    assert report['values'] == 800
+    assert 0 < report['p50_ms'] <= report['p99_ms']
+    assert report['requests_per_second'] > 0
+
+
+def test_load_generator_raises_request_errors() -> None:
+    with _running_server(_Failing(), ('127.0.0.1', 0)) as server:
+        with pytest.raises(ProtocolError, match='too many'):
+            run_load(server.address, requests=20, batch_size=4,
+                     concurrency=4)
+
+
+def test_command_line(tmp_path) -> None:
+    model = str(tmp_path / 'model.bin')
+    _create_rule_base().save(model)
+    socket_path = str(tmp_path / 'cli.sock')
+    process = subprocess.Popen(
+        [sys.executable, '-m', 'fuzzy.serve', model,
+         '--address', f'unix:{socket_path}'],
+        stdout=subprocess.PIPE, text=True
+    )
+    try:
+        assert 'Serving 3 rules' in process.stdout.readline()
+        output = subprocess.run(
+            [sys.executable, '-m', 'fuzzy.serve.loadgen',
+             f'unix:{socket_path}', '--requests', '20'],
+            capture_output=True, text=True, check=True
+        ).stdout
+        assert '20 requests' in output and 'p99' in output
+    finally:
+        process.terminate()
+        process.wait()
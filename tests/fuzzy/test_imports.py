@@ -0,0 +1,47 @@
+"""
+Tests for lazy imports of package attributes.
+
+  - Scalar membership functions and operators don't import NumPy
+  - Lazy attributes load on first access and are listed by dir
+  - Unknown attributes raise AttributeError
+"""
+import os
+import subprocess
+import sys
+
+import pytest
+
+import fuzzy
+import fuzzy.functions
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__)
+)))
+
+
+def test_scalar_evaluation_does_not_import_numpy() -> None:
+    script = (
+        'import sys\n'
+        'import fuzzy, fuzzy.rules, fuzzy.serve\n'
+        'from fuzzy.functions import TrapezoidFunction, ConstantFunction\n'
+        'from fuzzy.operators import Very\n'
+        'from fuzzy.sets import FuzzySet\n'
+        'f = TrapezoidFunction(0, 1, 2, 3)\n'
+        'assert (Very(f) & ~ConstantFunction(0.2) | f ** 3)(0.5) == 0.25\n'
+        'assert "numpy" not in sys.modules\n'
+        'from fuzzy.functions import TrapezoidBank\n'
+        'assert "numpy" in sys.modules\n'
+    )
+    subprocess.run([sys.executable, '-c', script], cwd=_ROOT, check=True)
+
+
+def test_lazy_attributes() -> None:
+    assert 'TrapezoidBank' in dir(fuzzy.functions)
+    assert 'rules' in dir(fuzzy)
+    assert fuzzy.functions.TrapezoidBank.__name__ == 'TrapezoidBank'
+    assert fuzzy.rules.RuleBase is fuzzy.rules.RuleBase
+    assert fuzzy.sets.FuzzySet.__name__ == 'FuzzySet'
+    with pytest.raises(AttributeError):
+        fuzzy.functions.MissingFunction
+    with pytest.raises(AttributeError):
+        fuzzy.missing
@@ -0,0 +1,115 @@
+"""
+Tests for interval type-2 functions and type reduction.
+
+  - Lower function must not exceed upper one
+  - Operators and hedges apply on intervals bound-wise
+  - Centroid interval equals exhaustive search over embedded sets
+  - Batched type reduction equals type reduction of each set
+"""
+from itertools import product
+
+import numpy as np
+import pytest
+
+from fuzzy.functions import TrapezoidFunction, TriangularFunction
+from fuzzy.operators import Very, Intensify
+from fuzzy.type2 import IntervalType2Function, centroid_interval, type_reduce
+
+
+def _create_function(shift: float = 0.) -> IntervalType2Function:
+    return IntervalType2Function(
+        upper=TrapezoidFunction(0 + shift, 2 + shift, 3 + shift, 5 + shift),
+        lower=TriangularFunction(1 + shift, 2.5 + shift, 4 + shift),
+        lower_height=0.8
+    )
+
+
+def test_lower_must_not_exceed_upper() -> None:
+    with pytest.raises(ValueError):
+        IntervalType2Function(TriangularFunction(1, 2.5, 4),
+                              TrapezoidFunction(0, 2, 3, 5))
+    with pytest.raises(ValueError):
+        IntervalType2Function(TriangularFunction(0, 1, 2),
+                              TriangularFunction(0.5, 1, 2.5))
+
+
+def test_interval_degrees() -> None:
+    funct = _create_function()
+    assert funct.interval(0.5) == (0., 0.25)
+    assert funct.interval(2.5) == (0.8, 1.)
+    assert funct(2.5) == 0.9
+    lower, upper = funct.interval_batch(np.linspace(-1, 6, 50))
+    assert np.all(lower <= upper)
+
+
+def test_operators_on_intervals() -> None:
+    first = _create_function()
+    second = _create_function(1.)
+    plain = TriangularFunction(0, 3, 6)
+    tree = (first & ~second) | plain
+    values = np.linspace(-1, 7, 81)
+    lower, upper = tree.interval_batch(values)
+    for value, low, high in zip(values, lower, upper):
+        f_low, f_high = first.interval(value)
+        s_low, s_high = second.interval(value)
+        expected = (max(min(f_low, 1 - s_high), plain(value)),
+                    max(min(f_high, 1 - s_low), plain(value)))
+        assert tree.interval(value) == expected == (low, high)
+
+
+def test_hedges_on_intervals() -> None:
+    funct = _create_function()
+    values = np.linspace(-1, 6, 71)
+    lower, upper = funct.interval_batch(values)
+    very_lower, very_upper = Very(funct).interval_batch(values)
+    assert np.allclose(very_lower, lower ** 2)
+    assert np.allclose(very_upper, upper ** 2)
+    tree = Intensify(~funct)
+    tree_lower, tree_upper = tree.interval_batch(values)
+    for value, low, high in zip(values, tree_lower, tree_upper):
+        f_low, f_high = funct.interval(value)
+        expected = (tree.apply(1 - f_high), tree.apply(1 - f_low))
+        assert tree.interval(value) == pytest.approx(expected)
+        assert (low, high) == pytest.approx(expected)
+
+
+def _exhaustive_centroid(x, lower, upper):
+    centroids = [np.dot(x, weights) / np.sum(weights)
+                 for weights in product(*zip(lower, upper))
+                 if np.sum(weights) > 0]
+    return min(centroids), max(centroids)
+
+
+def test_centroid_equals_exhaustive_search() -> None:
+    random = np.random.default_rng(0)
+    for _ in range(20):
+        x = random.uniform(0, 10, 8)
+        lower = random.uniform(0, 0.5, 8)
+        upper = lower + random.uniform(0, 0.5, 8)
+        left, right = centroid_interval(x, lower, upper)
+        expected_left, expected_right = _exhaustive_centroid(x, lower, upper)
+        assert left == pytest.approx(expected_left)
+        assert right == pytest.approx(expected_right)
+
+
+def test_batched_centroid() -> None:
+    random = np.random.default_rng(1)
+    x = np.linspace(0, 10, 101)
+    lower = random.uniform(0, 0.5, (32, 101))
+    upper = lower + random.uniform(0, 0.5, (32, 101))
+    lower[0] = upper[0] = 0.
+    left, right = centroid_interval(x, lower, upper)
+    assert left.shape == right.shape == (32,)
+    assert np.isnan(left[0]) and np.isnan(right[0])
+    for i in range(1, 32):
+        single = centroid_interval(x, lower[i], upper[i])
+        assert (left[i], right[i]) == pytest.approx(single)
+        assert left[i] <= right[i]
+
+
+def test_type_reduce_symmetric_set() -> None:
+    funct = IntervalType2Function(TrapezoidFunction(0, 2, 3, 5),
+                                  TrapezoidFunction(1, 2.2, 2.8, 4))
+    left, right, crisp = type_reduce(funct, np.linspace(-1, 6, 701))
+    assert left < 2.5 < right
+    assert crisp == pytest.approx(2.5)
@@ -0,0 +1,75 @@
+"""
+Tests for plotting of membership functions and operator trees.
+
+  - Plotted points contain vertices and crossing points of operators
+  - Curved trees and functions of unknown shape are sampled
+  - Variables are rendered headless into PNG and SVG files
+  - Single functions and operators are shown when no file is given
+"""
+import numpy as np
+import pytest
+
+pytest.importorskip('matplotlib')
+
+from fuzzy.functions import TrapezoidFunction, TriangularFunction
+from fuzzy.operators import Very
+from fuzzy.type2 import IntervalType2Function
+
+from fuzzy_functions_visualization import (
+    CURVE_SAMPLES, plot_points, plot_range, render_variables,
+    visualize_fuzzy_operators, visualize_fuzzy_trapezoid_functions
+)
+
+
+def test_points_contain_vertices_and_crossings() -> None:
+    tree = TriangularFunction(0, 1, 2) | TriangularFunction(1, 2, 3)
+    points, degrees = plot_points(tree, -1, 4)
+    assert np.allclose(points, [-1, 0, 1, 1.5, 2, 3, 4])
+    assert np.allclose(degrees, [0, 0, 1, 0.5, 1, 0, 0])
+    assert plot_range([tree], margin=0.5) == (-1.5, 4.5)
+
+
+def test_curved_trees_are_sampled() -> None:
+    function = TrapezoidFunction(0, 2, 3, 6)
+    points, degrees = plot_points(Very(function), -1, 7)
+    assert {0, 2, 3, 6} <= set(points)
+    assert len(points) > CURVE_SAMPLES
+    assert np.allclose(degrees, Very(function).evaluate_batch(points))
+
+    interval = IntervalType2Function(function, TrapezoidFunction(1, 2, 3, 5))
+    points, degrees = plot_points(interval, -1, 6)
+    assert len(points) > CURVE_SAMPLES
+    assert degrees.max() == pytest.approx(1.)
+
+
+@pytest.mark.parametrize('extension', ['png', 'svg'])
+def test_render_headless(tmp_path, extension) -> None:
+    terms = {f't{i}': TrapezoidFunction(i, i + 1, i + 2, i + 3)
+             for i in range(5)}
+    path = tmp_path / f'variables.{extension}'
+    render_variables({'first': terms, 'second': {'very': Very(terms['t0'])},
+                      'third': terms}, str(path), columns=2)
+    assert path.stat().st_size > 0
+    if extension == 'svg':
+        assert path.read_text().lstrip().startswith('<?xml')
+    else:
+        assert path.read_bytes().startswith(b'\x89PNG')
+    operators = tmp_path / f'operators.{extension}'
+    visualize_fuzzy_operators(*list(terms.values())[:3],
+                              path=str(operators))
+    assert operators.stat().st_size > 0
+
+
+def test_shown_without_path(tmp_path, monkeypatch) -> None:
+    from matplotlib import pyplot
+    from matplotlib.figure import Figure
+
+    shown = []
+    monkeypatch.setattr(Figure, 'show', lambda figure: shown.append(figure))
+    monkeypatch.chdir(tmp_path)
+    function = TrapezoidFunction(0, 1, 2, 3)
+    visualize_fuzzy_trapezoid_functions(function)
+    visualize_fuzzy_operators(function, function, function)
+    pyplot.close('all')
+    assert len(shown) == 2
+    assert list(tmp_path.iterdir()) == []